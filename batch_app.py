@@ -0,0 +1,23 @@
+"""
+배치 변환 CLI 런처
+Batch Transcription CLI Launcher
+
+사용 예 / Usage:
+    python batch_app.py videos/ "recordings/**/*.mp4" -u urls.txt -o transcripts -m small
+"""
+
+import multiprocessing
+import sys
+
+# 모듈 임포트
+from src.ffmpeg_setup import setup_ffmpeg_path
+from src.batch_cli import main
+
+# FFmpeg 경로 설정 실행
+setup_ffmpeg_path()
+
+
+if __name__ == "__main__":
+    # 청크 병렬 변환 워커 프로세스 지원
+    multiprocessing.freeze_support()
+    sys.exit(main())
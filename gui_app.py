@@ -3,6 +3,7 @@ GUI 애플리케이션 메인 런처
 GUI Application Main Launcher
 """
 
+import multiprocessing
 import tkinter as tk
 
 # 모듈 임포트
@@ -21,4 +22,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # PyInstaller 빌드에서 청크 병렬 변환 워커 프로세스 지원
+    multiprocessing.freeze_support()
     main() 
\ No newline at end of file
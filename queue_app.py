@@ -0,0 +1,25 @@
+"""
+작업 큐 CLI 런처
+Job Queue CLI Launcher
+
+사용 예 / Usage:
+    python queue_app.py add videos/ -u urls.txt -m small
+    python queue_app.py work --workers 2
+    python queue_app.py status
+    python queue_app.py retry
+"""
+
+import multiprocessing
+import sys
+
+# 모듈 임포트
+from src.ffmpeg_setup import setup_ffmpeg_path
+from src.job_queue import main
+
+# FFmpeg 경로 설정 실행
+setup_ffmpeg_path()
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
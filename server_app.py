@@ -0,0 +1,25 @@
+"""
+HTTP 변환 서비스 런처
+HTTP Transcription Service Launcher
+
+사용 예 / Usage:
+    python server_app.py --port 8000 --model base
+    curl -X POST -H "Content-Type: application/json" -d '{"url": "https://youtu.be/..."}' localhost:8000/jobs
+    curl --data-binary @video.mp4 -H "Content-Type: application/octet-stream" "localhost:8000/jobs?filename=video.mp4"
+    curl "localhost:8000/jobs/<id>/segments?stream=1"
+"""
+
+import multiprocessing
+import sys
+
+# 모듈 임포트
+from src.ffmpeg_setup import setup_ffmpeg_path
+from src.http_service import main
+
+# FFmpeg 경로 설정 실행
+setup_ffmpeg_path()
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
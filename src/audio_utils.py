@@ -0,0 +1,336 @@
+"""
+오디오 처리 유틸리티 모듈
+Audio Processing Utility Module
+"""
+
+import subprocess
+import threading
+from collections import deque
+
+from .ffmpeg_setup import get_ffmpeg_binary
+
+# Whisper 입력 샘플링 레이트 (16kHz 모노)
+SAMPLE_RATE = 16000
+
+# 파이프 읽기 단위 (1MB)
+_PIPE_CHUNK_SIZE = 1024 * 1024
+
+# 에러 메시지에 남길 FFmpeg stderr 마지막 줄 수
+_STDERR_TAIL_LINES = 20
+
+
+def _drain_stderr(stream, tail):
+    """
+    stderr 파이프를 끝까지 읽으며 마지막 몇 줄만 남깁니다
+    (stdout을 읽는 동안 stderr 파이프가 가득 차 FFmpeg가 멈추지 않도록 별도 스레드에서 실행)
+    
+    Args:
+        stream (file): FFmpeg stderr 파이프
+        tail (collections.deque): 마지막 줄을 담을 deque (maxlen 지정)
+    """
+    for line in iter(stream.readline, b''):
+        tail.append(line.decode('utf-8', errors='replace').rstrip())
+
+
+def load_audio_array(file_path, sample_rate=SAMPLE_RATE):
+    """
+    FFmpeg 파이프로 오디오를 디코딩하여 NumPy 배열로 반환합니다
+    (임시 WAV 파일 없이 16kHz 모노 float32 PCM을 메모리로 바로 읽습니다)
+    
+    Args:
+        file_path (str): 비디오/오디오 파일 경로
+        sample_rate (int): 출력 샘플링 레이트
+    
+    Returns:
+        numpy.ndarray: float32 모노 오디오 샘플 (-1.0 ~ 1.0)
+    """
+    import numpy as np
+    
+    ffmpeg_cmd = [
+        get_ffmpeg_binary(),
+        '-nostdin',
+        '-hide_banner',
+        '-loglevel', 'error',  # 에러만 출력
+        '-threads', '0',
+        '-i', file_path,
+        '-vn',  # 비디오 스트림 제거
+        '-f', 'f32le',  # float32 raw PCM
+        '-acodec', 'pcm_f32le',
+        '-ac', '1',  # 모노
+        '-ar', str(sample_rate),  # 샘플링 레이트
+        '-'  # stdout 파이프로 출력
+    ]
+    
+    try:
+        process = subprocess.Popen(ffmpeg_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError:
+        raise Exception("FFmpeg not found. Please install FFmpeg. / FFmpeg를 찾을 수 없습니다. FFmpeg를 설치해주세요.")
+    
+    stderr_tail = deque(maxlen=_STDERR_TAIL_LINES)
+    stderr_thread = threading.Thread(target=_drain_stderr, args=(process.stderr, stderr_tail),
+                                     name="videoscribe-ffmpeg-stderr", daemon=True)
+    stderr_thread.start()
+    
+    # 청크 단위로 읽어 하나의 쓰기 가능한 버퍼에 누적 (추가 복사 없음)
+    buffer = bytearray()
+    with process:
+        while True:
+            chunk = process.stdout.read(_PIPE_CHUNK_SIZE)
+            if not chunk:
+                break
+            buffer += chunk
+        process.wait()
+        stderr_thread.join()
+    
+    if process.returncode != 0:
+        stderr = "\n".join(stderr_tail)
+        raise Exception(f"FFmpeg failed: {stderr}")
+    
+    # float32 샘플 경계에 맞춰 자르기
+    usable_bytes = len(buffer) - (len(buffer) % 4)
+    audio = np.frombuffer(buffer, dtype=np.float32, count=usable_bytes // 4)
+    
+    if audio.size == 0:
+        raise Exception("No audio stream found in file / 파일에서 오디오 스트림을 찾을 수 없습니다")
+    
+    return audio
+
+
+def compute_frame_energy(audio, sample_rate=SAMPLE_RATE, frame_ms=20):
+    """
+    프레임 단위 RMS 에너지를 계산합니다
+    
+    Args:
+        audio (numpy.ndarray): float32 모노 오디오
+        sample_rate (int): 샘플링 레이트
+        frame_ms (int): 프레임 길이 (밀리초)
+    
+    Returns:
+        tuple: (프레임별 RMS 배열, 프레임당 샘플 수)
+    """
+    import numpy as np
+    
+    frame_size = max(1, int(sample_rate * frame_ms / 1000))
+    n_frames = len(audio) // frame_size
+    if n_frames == 0:
+        return np.zeros(1, dtype=np.float32), frame_size
+    
+    frames = audio[:n_frames * frame_size].reshape(n_frames, frame_size)
+    energy = np.sqrt(np.mean(frames * frames, axis=1))
+    return energy, frame_size
+
+
+def split_audio_on_silence(audio, sample_rate=SAMPLE_RATE, target_seconds=30.0, search_seconds=5.0):
+    """
+    오디오를 약 target_seconds 길이의 구간으로 나눕니다
+    (각 경계는 [target - search, target] 범위에서 가장 조용한 프레임으로 정함)
+    
+    Args:
+        audio (numpy.ndarray): float32 모노 오디오
+        sample_rate (int): 샘플링 레이트
+        target_seconds (float): 최대 구간 길이 (Whisper 윈도우 30초)
+        search_seconds (float): 무음 경계 탐색 범위
+    
+    Returns:
+        list: (start_sample, end_sample) 튜플 목록
+    """
+    import numpy as np
+    
+    total_samples = len(audio)
+    target_samples = int(target_seconds * sample_rate)
+    if total_samples <= target_samples:
+        return [(0, total_samples)]
+    
+    energy, frame_size = compute_frame_energy(audio, sample_rate)
+    search_frames = max(1, int(search_seconds * sample_rate / frame_size))
+    
+    chunks = []
+    start = 0
+    while total_samples - start > target_samples:
+        # 탐색 범위 (프레임 인덱스)
+        window_end = (start + target_samples) // frame_size
+        window_start = max(start // frame_size + 1, window_end - search_frames)
+        window = energy[window_start:window_end]
+        
+        if len(window) == 0:
+            split = start + target_samples
+        else:
+            split = (window_start + int(np.argmin(window))) * frame_size
+        
+        chunks.append((start, split))
+        start = split
+    
+    # 1초 미만의 꼬리 구간은 앞 구간에 합침 (짧은 구간의 환각 방지)
+    if chunks and total_samples - start < sample_rate:
+        chunks[-1] = (chunks[-1][0], total_samples)
+    else:
+        chunks.append((start, total_samples))
+    return chunks
+
+
+def detect_speech_regions(audio, sample_rate=SAMPLE_RATE, frame_ms=30, threshold_db=None, margin_db=10.0,
+                          min_speech_ms=200, min_silence_ms=1000, pad_ms=250):
+    """
+    프레임 에너지 기준으로 음성 구간을 찾습니다 (에너지 기반 VAD)
+    
+    임계값을 지정하지 않으면 잡음 바닥(하위 10% 프레임) + margin_db로 정하되,
+    큰 소리(상위 5% 프레임)보다 25dB 이상 낮게 유지하여 말이 계속되는 녹음에서
+    음성이 잘리지 않도록 합니다.
+    
+    Args:
+        audio (numpy.ndarray): float32 모노 오디오
+        sample_rate (int): 샘플링 레이트
+        frame_ms (int): 프레임 길이 (밀리초)
+        threshold_db (float): 음성 판정 임계값 (dBFS), None이면 자동
+        margin_db (float): 자동 임계값의 잡음 바닥 대비 여유 (dB)
+        min_speech_ms (int): 이보다 짧은 음성 구간은 잡음으로 보고 제거
+        min_silence_ms (int): 이보다 짧은 무음은 제거하지 않고 앞뒤 음성과 합침
+        pad_ms (int): 음성 구간 앞뒤로 남길 여유 (단어 끝이 잘리지 않도록)
+    
+    Returns:
+        list: 원본 기준 (start_sample, end_sample) 튜플 목록 (무음만 있으면 빈 목록)
+    """
+    import numpy as np
+    
+    energy, frame_size = compute_frame_energy(audio, sample_rate, frame_ms)
+    energy_db = 20.0 * np.log10(energy + 1e-10)
+    
+    if threshold_db is None:
+        noise_floor_db = float(np.percentile(energy_db, 10))
+        loud_db = float(np.percentile(energy_db, 95))
+        threshold_db = max(min(noise_floor_db + margin_db, loud_db - 25.0), -60.0)
+    
+    # 음성 프레임 구간 (시작, 끝) 찾기
+    voiced = np.concatenate(([0], (energy_db > threshold_db).astype(np.int8), [0]))
+    edges = np.diff(voiced)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    
+    def to_frames(ms):
+        return max(0, int(round(ms / frame_ms)))
+    
+    min_speech_frames = to_frames(min_speech_ms)
+    min_silence_frames = to_frames(min_silence_ms)
+    pad_frames = to_frames(pad_ms)
+    n_frames = len(energy)
+    
+    # 짧은 무음 합치기
+    regions = []
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        if regions and start - regions[-1][1] < min_silence_frames:
+            regions[-1][1] = end
+        else:
+            regions.append([start, end])
+    
+    # 짧은 잡음 제거 후 여유 추가 (겹치는 구간은 합침)
+    padded = []
+    for start, end in regions:
+        if end - start < min_speech_frames:
+            continue
+        start = max(0, start - pad_frames)
+        end = min(n_frames, end + pad_frames)
+        if padded and start <= padded[-1][1]:
+            padded[-1] = (padded[-1][0], end)
+        else:
+            padded.append((start, end))
+    
+    total_samples = len(audio)
+    speech_regions = []
+    for start, end in padded:
+        # 마지막 프레임까지 음성이면 남은 꼬리 샘플도 포함
+        end_sample = total_samples if end >= n_frames else end * frame_size
+        speech_regions.append((start * frame_size, end_sample))
+    return speech_regions
+
+
+class SpeechTimeline:
+    """음성 구간만 이어붙인 오디오의 시간을 원본 시간으로 되돌리는 매핑"""
+    
+    def __init__(self, regions, sample_rate=SAMPLE_RATE):
+        """
+        초기화
+        
+        Args:
+            regions (list): 원본 기준 (start_sample, end_sample) 음성 구간 목록
+            sample_rate (int): 샘플링 레이트
+        """
+        self.sample_rate = sample_rate
+        self.regions = list(regions)
+        
+        # 이어붙인 오디오에서 각 구간의 시작 위치 (초)
+        self._gated_starts = []
+        position = 0
+        for start, end in self.regions:
+            self._gated_starts.append(position / sample_rate)
+            position += end - start
+        self.speech_seconds = position / sample_rate
+    
+    def to_original(self, seconds, is_end=False):
+        """
+        이어붙인 오디오의 시간을 원본 시간으로 변환합니다
+        
+        Args:
+            seconds (float): 이어붙인 오디오 기준 시간
+            is_end (bool): 구간 끝 시간 여부 (경계에서는 앞 구간의 끝으로 매핑)
+        
+        Returns:
+            float: 원본 오디오 기준 시간
+        """
+        import bisect
+        
+        if not self.regions:
+            return seconds
+        
+        if is_end:
+            index = bisect.bisect_left(self._gated_starts, seconds) - 1
+        else:
+            index = bisect.bisect_right(self._gated_starts, seconds) - 1
+        index = min(max(index, 0), len(self.regions) - 1)
+        
+        region_start, region_end = self.regions[index]
+        original = region_start / self.sample_rate + (seconds - self._gated_starts[index])
+        return min(original, region_end / self.sample_rate)
+    
+    def remap_segment(self, segment):
+        """
+        세그먼트(와 단어) 타임스탬프를 원본 시간으로 보정합니다
+        
+        Args:
+            segment (dict): Whisper 세그먼트
+        
+        Returns:
+            dict: 보정된 세그먼트
+        """
+        segment["start"] = self.to_original(segment["start"])
+        segment["end"] = max(segment["start"], self.to_original(segment["end"], is_end=True))
+        for word in segment.get("words") or []:
+            word["start"] = self.to_original(word["start"])
+            word["end"] = max(word["start"], self.to_original(word["end"], is_end=True))
+        return segment
+
+
+def gate_speech(audio, sample_rate=SAMPLE_RATE, max_speech_ratio=0.95, **vad_options):
+    """
+    무음 구간을 제거하고 음성 구간만 이어붙입니다
+    
+    Args:
+        audio (numpy.ndarray): float32 모노 오디오
+        sample_rate (int): 샘플링 레이트
+        max_speech_ratio (float): 음성 비율이 이보다 높으면 잘라내지 않음 (이득이 없으므로)
+        **vad_options: detect_speech_regions 옵션
+    
+    Returns:
+        tuple: (음성만 남긴 오디오, SpeechTimeline) - 잘라내지 않았으면 (원본 오디오, None)
+    """
+    import numpy as np
+    
+    regions = detect_speech_regions(audio, sample_rate, **vad_options)
+    timeline = SpeechTimeline(regions, sample_rate)
+    
+    total_seconds = len(audio) / sample_rate
+    if total_seconds <= 0 or (regions and timeline.speech_seconds / total_seconds > max_speech_ratio):
+        return audio, None
+    
+    if not regions:
+        return audio[:0], timeline
+    return np.concatenate([audio[start:end] for start, end in regions]), timeline
@@ -0,0 +1,484 @@
+"""
+음성 인식 엔진 모듈
+Transcription Backend Module
+"""
+
+from .audio_utils import SAMPLE_RATE, split_audio_on_silence
+
+# 엔진 이름
+BACKEND_WHISPER = "whisper"
+BACKEND_FASTER_WHISPER = "faster-whisper"
+
+# UI 표시용 엔진 목록
+BACKEND_OPTIONS = {
+    BACKEND_WHISPER: "OpenAI Whisper (PyTorch)",
+    BACKEND_FASTER_WHISPER: "faster-whisper (CTranslate2, int8 CPU)"
+}
+
+# faster-whisper 모델 이름 매핑 (openai-whisper의 'large'는 large-v3)
+_FASTER_WHISPER_MODEL_NAMES = {
+    "large": "large-v3"
+}
+
+
+class TranscriptionBackend:
+    """음성 인식 엔진 기본 클래스"""
+    
+    name = None
+    # transcribe_batch가 여러 입력을 한 배치로 함께 디코딩하는지 여부 (아니면 입력마다 따로 변환)
+    batches_inputs = False
+    
+    def __init__(self, model_size="base", device="cpu", cpu_threads=0):
+        """
+        초기화
+        
+        Args:
+            model_size (str): 모델 크기 (tiny, base, small, medium, large)
+            device (str): 장치 (cuda, cpu)
+            cpu_threads (int): CPU 스레드 수 (0이면 라이브러리 기본값)
+        """
+        self.model_size = model_size
+        self.device = device
+        self.cpu_threads = cpu_threads
+        self.model = None
+    
+    def load(self):
+        """모델을 로드합니다 (이미 로드되었으면 그대로 반환)"""
+        raise NotImplementedError
+    
+    def transcribe(self, audio, language=None, task="transcribe", initial_prompt=None, verbose=None):
+        """
+        오디오를 텍스트로 변환합니다
+        
+        Args:
+            audio (numpy.ndarray): 16kHz 모노 float32 오디오
+            language (str): 언어 코드, None이면 자동 감지
+            task (str): transcribe 또는 translate
+            initial_prompt (str): 앞 문맥 프롬프트
+            verbose (bool): 엔진 자체 출력 여부 (지원하는 엔진만)
+        
+        Returns:
+            dict: Whisper 형식 결과 (text, language, segments)
+        """
+        raise NotImplementedError
+    
+    def detect_language(self, audio):
+        """
+        오디오 앞부분으로 언어를 감지합니다
+        
+        Args:
+            audio (numpy.ndarray): 16kHz 모노 float32 오디오
+            
+        Returns:
+            str: 언어 코드
+        """
+        return self.transcribe(audio[:30 * SAMPLE_RATE]).get('language')
+    
+    def language_probabilities(self, audio):
+        """
+        30초 이하 오디오의 언어별 확률을 반환합니다 (언어 감지 단계용)
+        
+        Args:
+            audio (numpy.ndarray): 16kHz 모노 float32 오디오
+            
+        Returns:
+            dict: 언어 코드 → 확률
+        """
+        return {self.detect_language(audio): 1.0}
+    
+    def iter_transcribe(self, audio, language=None, task="transcribe", start_sample=0, initial_prompt=None,
+                        chunk_callback=None, chunked=False):
+        """
+        오디오를 변환하면서 세그먼트를 하나씩 내보냅니다
+        
+        기본 구현은 transcribe를 한 번 호출하여 전체를 변환한 뒤 세그먼트를 내보냅니다 (결과가 transcribe와 같음).
+        chunked이면 무음 경계로 나눈 약 30초 청크를 차례로 변환하여 청크마다 바로 내보내고,
+        앞 청크의 텍스트를 다음 청크의 프롬프트로 넘겨 문맥을 이어갑니다 (청크 경계에서 재개 가능).
+        
+        Args:
+            audio (numpy.ndarray): 16kHz 모노 float32 오디오
+            language (str): 언어 코드, None이면 자동 감지
+            task (str): transcribe 또는 translate
+            start_sample (int): 이 위치 전까지는 이미 변환됨 (체크포인트에서 재개할 때)
+            initial_prompt (str): 첫 청크에 넘길 앞 문맥
+            chunk_callback (function): 청크의 세그먼트를 모두 내보낸 뒤 호출 (다음 재개 위치, 다음 프롬프트)
+            chunked (bool): 약 30초 청크 단위로 나누어 변환할지 여부
+            
+        Returns:
+            tuple: (언어 코드, 세그먼트 dict 제너레이터)
+        """
+        if language is None:
+            language = self.detect_language(audio[start_sample:])
+        
+        if not chunked:
+            return language, self._iter_single_pass(audio, language, task, start_sample, initial_prompt,
+                                                    chunk_callback)
+        
+        def generate():
+            segment_id = 0
+            prompt = initial_prompt
+            for start, end in split_audio_on_silence(audio, SAMPLE_RATE):
+                # 청크 경계는 같은 오디오에서 항상 같으므로 끝난 청크만 건너뜀
+                if end <= start_sample:
+                    continue
+                offset = start / SAMPLE_RATE
+                result = self.transcribe(audio[start:end], language=language, task=task, initial_prompt=prompt)
+                for segment in result.get("segments", []):
+                    segment = dict(segment)
+                    segment["id"] = segment_id
+                    segment["start"] = segment["start"] + offset
+                    segment["end"] = segment["end"] + offset
+                    segment_id += 1
+                    yield segment
+                prompt = result.get("text") or None
+                if chunk_callback:
+                    chunk_callback(end, prompt)
+        
+        return language, generate()
+    
+    def _iter_single_pass(self, audio, language, task, start_sample, initial_prompt, chunk_callback):
+        """재개 위치부터 끝까지 transcribe 한 번으로 변환하고 세그먼트를 내보냅니다"""
+        offset = start_sample / SAMPLE_RATE
+        result = self.transcribe(audio[start_sample:], language=language, task=task, initial_prompt=initial_prompt)
+        for segment in result.get("segments", []):
+            if offset:
+                segment = dict(segment)
+                segment["start"] = segment["start"] + offset
+                segment["end"] = segment["end"] + offset
+            yield segment
+        if chunk_callback:
+            chunk_callback(len(audio), result.get("text") or None)
+
+    def transcribe_batch(self, audios, language=None, task="transcribe", batch_size=8, beam_size=None):
+        """
+        여러 오디오를 한 번에 변환합니다
+        
+        기본 구현은 하나씩 차례로 변환하고, 배치 디코딩을 지원하는 엔진이 재정의합니다.
+        
+        Args:
+            audios (list): 16kHz 모노 float32 오디오 목록
+            language (str): 언어 코드, None이면 입력마다 자동 감지
+            task (str): transcribe 또는 translate
+            batch_size (int): 한 번에 디코딩할 30초 윈도우 수
+            beam_size (int): 빔 크기 (None이면 greedy)
+        
+        Returns:
+            list: 입력 순서대로 Whisper 형식 결과 (text, language, segments)
+        """
+        return [self.transcribe(audio, language=language, task=task) for audio in audios]
+
+
+class WhisperBackend(TranscriptionBackend):
+    """openai-whisper (PyTorch) 엔진"""
+    
+    name = BACKEND_WHISPER
+    batches_inputs = True
+    
+    def load(self):
+        if self.model is None:
+            import whisper
+            
+            if self.cpu_threads:
+                import torch
+                torch.set_num_threads(self.cpu_threads)
+            
+            self.model = whisper.load_model(self.model_size, device=self.device)
+        return self
+    
+    def transcribe(self, audio, language=None, task="transcribe", initial_prompt=None, verbose=None):
+        options = {
+            "task": task,
+            "verbose": verbose,
+            "fp16": self.device == "cuda"  # CPU에서는 fp16 미지원
+        }
+        if language:
+            options["language"] = language
+        if initial_prompt:
+            options["initial_prompt"] = initial_prompt
+        
+        return self.load().model.transcribe(audio, **options)
+    
+    def detect_language(self, audio):
+        probs = self.language_probabilities(audio)
+        return max(probs, key=probs.get)
+    
+    def language_probabilities(self, audio):
+        import whisper
+        
+        model = self.load().model
+        mel = whisper.log_mel_spectrogram(whisper.pad_or_trim(audio), n_mels=model.dims.n_mels).to(model.device)
+        _, probs = model.detect_language(mel)
+        return probs
+
+    def transcribe_batch(self, audios, language=None, task="transcribe", batch_size=8, beam_size=None):
+        """
+        여러 입력의 30초 윈도우를 모아 인코더/디코더를 배치로 실행합니다
+        
+        짧은 클립이 많을 때 호출마다 배치 크기 1로 디코딩하는 오버헤드를 줄입니다.
+        품질 기준(compression_ratio, avg_logprob)을 넘는 윈도우만 온도 폴백이 있는 transcribe로 다시 변환합니다.
+        """
+        import torch
+        import whisper
+        from whisper.tokenizer import get_tokenizer
+        
+        model = self.load().model
+        batch_size = max(1, batch_size)
+        results = [{'text': "", 'language': language, 'segments': []} for _ in audios]
+        
+        # (입력 번호, 시작 시간, 윈도우 오디오) 목록
+        windows = []
+        for index, audio in enumerate(audios):
+            for start, end in split_audio_on_silence(audio, SAMPLE_RATE):
+                if end > start:
+                    windows.append((index, start / SAMPLE_RATE, audio[start:end]))
+        
+        def mel_batch(chunk):
+            mels = [whisper.log_mel_spectrogram(whisper.pad_or_trim(window_audio), n_mels=model.dims.n_mels)
+                    for _, _, window_audio in chunk]
+            return torch.stack(mels).to(model.device)
+        
+        # 언어를 지정하지 않았으면 입력마다 첫 윈도우로 감지 (배치 실행)
+        if language is None:
+            first_windows = {}
+            for window in windows:
+                first_windows.setdefault(window[0], window)
+            first_windows = list(first_windows.values())
+            for batch_start in range(0, len(first_windows), batch_size):
+                chunk = first_windows[batch_start:batch_start + batch_size]
+                _, probs = model.detect_language(mel_batch(chunk))
+                for (index, _, _), language_probs in zip(chunk, probs):
+                    results[index]['language'] = max(language_probs, key=language_probs.get)
+        
+        # 같은 언어의 윈도우끼리 묶어서 디코딩
+        positions_by_language = {}
+        for position, (index, _, _) in enumerate(windows):
+            positions_by_language.setdefault(results[index]['language'], []).append(position)
+        
+        window_segments = [[] for _ in windows]
+        fp16 = self.device == "cuda"  # CPU에서는 fp16 미지원
+        for window_language, positions in positions_by_language.items():
+            options = whisper.DecodingOptions(task=task, language=window_language, beam_size=beam_size, fp16=fp16)
+            tokenizer = get_tokenizer(model.is_multilingual, num_languages=model.num_languages,
+                                      language=window_language, task=task)
+            
+            for batch_start in range(0, len(positions), batch_size):
+                chunk_positions = positions[batch_start:batch_start + batch_size]
+                chunk = [windows[position] for position in chunk_positions]
+                decoded = whisper.decode(model, mel_batch(chunk), options)
+                
+                for position, (_, offset, window_audio), result in zip(chunk_positions, chunk, decoded):
+                    window_seconds = len(window_audio) / SAMPLE_RATE
+                    if result.no_speech_prob > 0.6 and result.avg_logprob < -1.0:
+                        # 무음 윈도우 (openai-whisper transcribe와 같은 기준)
+                        continue
+                    
+                    if result.compression_ratio > 2.4 or result.avg_logprob < -1.0:
+                        # 반복/저신뢰 윈도우는 온도 폴백으로 다시 변환
+                        fallback = self.transcribe(window_audio, language=window_language, task=task)
+                        segments = [dict(segment) for segment in fallback.get("segments", [])]
+                        for segment in segments:
+                            segment["start"] = segment["start"] + offset
+                            segment["end"] = min(segment["end"], window_seconds) + offset
+                    else:
+                        segments = _decoding_result_segments(result, tokenizer, offset, window_seconds)
+                    window_segments[position] = segments
+        
+        # 윈도우 결과를 입력별 세그먼트로 되돌림
+        for position, (index, _, _) in enumerate(windows):
+            segments = results[index]['segments']
+            for segment in window_segments[position]:
+                segment["id"] = len(segments)
+                segments.append(segment)
+        
+        for result in results:
+            result['text'] = "".join(segment['text'] for segment in result['segments'])
+            if result['language'] is None:
+                result['language'] = "unknown"
+        return results
+
+
+class FasterWhisperBackend(TranscriptionBackend):
+    """faster-whisper (CTranslate2) 엔진 - CPU에서는 int8 양자화 사용"""
+    
+    name = BACKEND_FASTER_WHISPER
+    _batched_pipeline = None
+    
+    def load(self):
+        if self.model is None:
+            from faster_whisper import WhisperModel
+            
+            compute_type = "float16" if self.device == "cuda" else "int8"
+            model_name = _FASTER_WHISPER_MODEL_NAMES.get(self.model_size, self.model_size)
+            self.model = WhisperModel(model_name, device=self.device, compute_type=compute_type,
+                                      cpu_threads=self.cpu_threads)
+        return self
+    
+    def transcribe(self, audio, language=None, task="transcribe", initial_prompt=None, verbose=None):
+        segments_iter, info = self.load().model.transcribe(
+            audio,
+            language=language,
+            task=task,
+            beam_size=5,
+            initial_prompt=initial_prompt
+        )
+        
+        segments = [_segment_to_dict(segment) for segment in segments_iter]
+        return {
+            'text': "".join(segment['text'] for segment in segments),
+            'language': info.language,
+            'segments': segments
+        }
+    
+    def transcribe_batch(self, audios, language=None, task="transcribe", batch_size=8, beam_size=None):
+        """
+        BatchedInferencePipeline으로 입력마다 윈도우를 배치 디코딩합니다
+        
+        faster-whisper는 여러 입력을 한 배치에 섞는 API가 없으므로 입력 단위로 처리하고,
+        BatchedInferencePipeline이 없는 버전(1.1 미만)에서는 차례로 변환합니다.
+        """
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:
+            return super().transcribe_batch(audios, language, task, batch_size, beam_size)
+        
+        if self._batched_pipeline is None:
+            self._batched_pipeline = BatchedInferencePipeline(model=self.load().model)
+        
+        results = []
+        for audio in audios:
+            segments_iter, info = self._batched_pipeline.transcribe(
+                audio,
+                language=language,
+                task=task,
+                batch_size=max(1, batch_size),
+                beam_size=beam_size or 5
+            )
+            segments = [_segment_to_dict(segment) for segment in segments_iter]
+            results.append({
+                'text': "".join(segment['text'] for segment in segments),
+                'language': info.language,
+                'segments': segments
+            })
+        return results
+    
+    def language_probabilities(self, audio):
+        # 언어 감지는 transcribe 호출 시 바로 실행되고, 세그먼트 디코딩은 제너레이터를 소비할 때까지 미뤄짐
+        _, info = self.load().model.transcribe(audio[:30 * SAMPLE_RATE])
+        if info.all_language_probs:
+            return dict(info.all_language_probs)
+        return {info.language: info.language_probability}
+    
+    def iter_transcribe(self, audio, language=None, task="transcribe", start_sample=0, initial_prompt=None,
+                        chunk_callback=None, chunked=False):
+        # faster-whisper는 세그먼트를 디코딩하는 즉시 내보내는 제너레이터를 반환
+        segments_iter, info = self.load().model.transcribe(audio[start_sample:], language=language, task=task,
+                                                           beam_size=5, initial_prompt=initial_prompt)
+        if not start_sample and not chunk_callback:
+            return info.language, (_segment_to_dict(segment) for segment in segments_iter)
+        
+        offset = start_sample / SAMPLE_RATE
+        
+        def generate():
+            # 재개한 경우 원본 기준 시간으로 보정하고, 세그먼트 끝을 다음 재개 위치로 알림
+            for segment in segments_iter:
+                segment = _segment_to_dict(segment)
+                segment['start'] += offset
+                segment['end'] += offset
+                # 받는 쪽이 시간을 바꿀 수 있으므로 (무음 제거 보정) 재개 위치는 내보내기 전에 계산
+                resume_sample = int(segment['end'] * SAMPLE_RATE)
+                prompt = segment['text']
+                yield segment
+                if chunk_callback:
+                    chunk_callback(resume_sample, prompt)
+        
+        return info.language, generate()
+
+
+def _decoding_result_segments(result, tokenizer, offset, window_seconds):
+    """
+    배치 디코딩 결과(DecodingResult)의 타임스탬프 토큰으로 세그먼트를 나눕니다
+    
+    Args:
+        result (DecodingResult): whisper.decode 결과
+        tokenizer (Tokenizer): 디코딩에 사용한 토크나이저
+        offset (float): 원본 오디오에서의 윈도우 시작 시간
+        window_seconds (float): 윈도우 길이 (초)
+    
+    Returns:
+        list: openai-whisper 형식 세그먼트 dict 목록 (시간은 원본 기준)
+    """
+    timestamp_begin = tokenizer.timestamp_begin
+    spans = []
+    start = None
+    text_tokens = []
+    for token in result.tokens:
+        if token >= timestamp_begin:
+            seconds = (token - timestamp_begin) * 0.02
+            if start is not None and text_tokens:
+                spans.append((start, seconds, text_tokens))
+                start = None
+                text_tokens = []
+            else:
+                start = seconds
+        elif token < tokenizer.eot:
+            text_tokens.append(token)
+    
+    # 닫는 타임스탬프 없이 끝난 텍스트는 윈도우 끝까지로 처리
+    if text_tokens:
+        spans.append((start or 0.0, window_seconds, text_tokens))
+    
+    segments = []
+    for start, end, tokens in spans:
+        start = min(start, window_seconds)
+        segments.append({
+            'id': len(segments),
+            'seek': int(offset * 100),
+            'start': start + offset,
+            'end': max(start, min(end, window_seconds)) + offset,
+            'text': tokenizer.decode(tokens),
+            'tokens': tokens,
+            'temperature': result.temperature,
+            'avg_logprob': result.avg_logprob,
+            'compression_ratio': result.compression_ratio,
+            'no_speech_prob': result.no_speech_prob
+        })
+    return segments
+
+
+def _segment_to_dict(segment):
+    """faster-whisper Segment를 openai-whisper 세그먼트 dict로 변환합니다"""
+    return {
+        'id': segment.id,
+        'seek': segment.seek,
+        'start': segment.start,
+        'end': segment.end,
+        'text': segment.text,
+        'tokens': list(segment.tokens),
+        'temperature': segment.temperature,
+        'avg_logprob': segment.avg_logprob,
+        'compression_ratio': segment.compression_ratio,
+        'no_speech_prob': segment.no_speech_prob
+    }
+
+
+def create_backend(name, model_size="base", device="cpu", cpu_threads=0):
+    """
+    엔진 이름으로 음성 인식 엔진을 생성합니다
+    
+    Args:
+        name (str): 엔진 이름 (whisper, faster-whisper)
+        model_size (str): 모델 크기
+        device (str): 장치 (cuda, cpu)
+        cpu_threads (int): CPU 스레드 수
+    
+    Returns:
+        TranscriptionBackend: 엔진 인스턴스 (faster-whisper가 없으면 Whisper로 폴백)
+    """
+    if name == BACKEND_FASTER_WHISPER:
+        try:
+            import faster_whisper  # noqa: F401
+            return FasterWhisperBackend(model_size, device, cpu_threads)
+        except ImportError:
+            print("faster-whisper not available, falling back to openai-whisper")
+    
+    return WhisperBackend(model_size, device, cpu_threads)
@@ -0,0 +1,523 @@
+"""
+배치 변환 CLI 모듈
+Batch Transcription CLI Module
+"""
+
+import os
+import re
+import sys
+import glob
+import time
+import queue
+import shutil
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .audio_utils import SAMPLE_RATE, load_audio_array
+from .backends import BACKEND_OPTIONS, BACKEND_WHISPER
+from .converter import VideoToTextConverter
+from .metrics import JsonLinesSink, METRIC_PROBE, METRIC_DOWNLOAD, METRIC_EXTRACT
+from .progress import format_seconds
+from .subtitle_writer import SubtitleWriter, SUBTITLE_FORMATS, parse_formats, write_subtitles
+from .two_pass import TwoPassTranscriber
+
+# 디렉토리/glob 입력에서 찾을 미디어 확장자
+MEDIA_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.webm', '.mp3', '.wav', '.m4a', '.aac')
+
+MODEL_SIZES = ["tiny", "base", "small", "medium", "large"]
+
+
+class BatchItem:
+    """배치 입력 하나의 처리 상태"""
+    
+    def __init__(self, index, source, is_url, name):
+        """
+        초기화
+        
+        Args:
+            index (int): 입력 순번 (1부터)
+            source (str): 파일 경로 또는 YouTube URL
+            is_url (bool): YouTube URL 여부
+            name (str): 출력 파일 이름 (확장자 제외)
+        """
+        self.index = index
+        self.source = source
+        self.is_url = is_url
+        self.name = name
+        self.audio = None
+        self.youtube_info = None
+        self.cache_key = None
+        self.result = None
+        self.error = None
+        self.cached = False
+        self.audio_seconds = 0.0
+        self.prepare_seconds = 0.0
+        self.transcribe_seconds = 0.0
+        self.metrics = None
+        self.subtitle_writer = None
+        self.output_path = None
+
+
+def _is_url(text):
+    # 'youtube_talk.mp4' 같은 로컬 파일이 URL로 처리되지 않도록 실제 경로를 먼저 확인
+    if os.path.exists(text):
+        return False
+    return text.startswith(("http://", "https://", "www.", "youtu", "m.youtube"))
+
+
+def _safe_name(text):
+    """파일 이름으로 쓸 수 없는 문자를 정리합니다"""
+    return re.sub(r'[<>:"/\\|?*\s]+', '_', text).strip('_')[:80] or "transcript"
+
+
+def _formats_arg(text):
+    """--formats 인자를 검사합니다"""
+    try:
+        formats = parse_formats(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    if not formats:
+        raise argparse.ArgumentTypeError("At least one output format is required")
+    return formats
+
+
+def collect_inputs(sources, url_lists=None):
+    """
+    디렉토리, glob, 파일, URL, URL 목록 파일을 입력 목록으로 펼칩니다
+    
+    Args:
+        sources (list): 파일/디렉토리/glob/URL 목록
+        url_lists (list): 한 줄에 하나씩 URL이 적힌 텍스트 파일 목록 ('#'으로 시작하는 줄은 무시)
+    
+    Returns:
+        list: (source, is_url) 튜플 목록 (중복 제거, 입력 순서 유지)
+    """
+    entries = []
+    
+    for url_list in url_lists or []:
+        with open(url_list, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    entries.append((line, True))
+    
+    for source in sources or []:
+        if _is_url(source):
+            entries.append((source, True))
+        elif os.path.isdir(source):
+            for root, _, filenames in os.walk(source):
+                for filename in sorted(filenames):
+                    if filename.lower().endswith(MEDIA_EXTENSIONS):
+                        entries.append((os.path.join(root, filename), False))
+        elif glob.has_magic(source):
+            for path in sorted(glob.glob(source, recursive=True)):
+                if os.path.isfile(path) and path.lower().endswith(MEDIA_EXTENSIONS):
+                    entries.append((path, False))
+        elif os.path.isfile(source):
+            entries.append((source, False))
+        else:
+            print(f"Warning: input not found, skipped: {source}")
+    
+    seen = set()
+    inputs = []
+    for source, is_url in entries:
+        key = source if is_url else os.path.abspath(source)
+        if key not in seen:
+            seen.add(key)
+            inputs.append((source, is_url))
+    return inputs
+
+
+class BatchTranscriber:
+    """
+    여러 입력을 다운로드/오디오 추출과 변환을 겹쳐서 처리하는 클래스
+    
+    다운로드와 오디오 추출은 스레드 풀에서 미리 진행하고, 변환은 하나의 모델로 순서대로 처리합니다.
+    미리 준비해 두는 입력 수를 제한하여 디코딩된 오디오가 메모리에 쌓이지 않도록 합니다.
+    """
+    
+    def __init__(self, converter, output_dir, language=None, jobs=2, prefetch=2, skip_existing=False, decode_batch=1,
+                 transcriber=None, formats=("txt",)):
+        """
+        초기화
+        
+        Args:
+            converter (VideoToTextConverter): 변환기
+            output_dir (str): 변환 결과 저장 디렉토리
+            language (str): 언어 코드, None이면 자동 감지
+            jobs (int): 다운로드/오디오 추출 스레드 수
+            prefetch (int): 변환 대기 중인 준비 완료 입력 최대 수
+            skip_existing (bool): 결과 파일이 이미 있으면 건너뛰기
+            decode_batch (int): 준비된 입력을 모아 한 번에 디코딩할 최대 수 (1이면 하나씩)
+            transcriber (TwoPassTranscriber): 변환에 쓸 초안 → 보정 변환기 (None이면 converter로 변환)
+            formats (str or list): 출력 형식 (txt는 '<이름>_transcript.txt', 자막은 '<이름>.<형식>')
+        """
+        self.converter = converter
+        self.transcriber = transcriber
+        self.output_dir = output_dir
+        self.language = language
+        self.jobs = max(1, jobs)
+        # 초안 → 보정 변환은 입력마다 따로 진행 (보정 구간은 변환기 안에서 배치 디코딩)
+        self.decode_batch = 1 if transcriber else max(1, decode_batch)
+        backend = converter._get_backend()
+        if self.decode_batch > 1 and not backend.batches_inputs:
+            print(f"--decode-batch {self.decode_batch} is ignored: the {backend.name} backend cannot decode several "
+                  f"inputs in one batch, so inputs are decoded one at a time", file=sys.stderr)
+            self.decode_batch = 1
+        # 배치를 채울 수 있도록 준비 대기 수는 배치 크기 이상
+        self.prefetch = max(1, prefetch, self.decode_batch)
+        self.skip_existing = skip_existing
+        self.formats = parse_formats(formats) or ("txt",)
+        self.subtitle_formats = tuple(name for name in self.formats if name != "txt")
+    
+    def make_items(self, inputs):
+        """입력 목록으로 BatchItem을 만들고 출력 이름 충돌을 정리합니다"""
+        items = []
+        used_names = set()
+        for index, (source, is_url) in enumerate(inputs, 1):
+            if is_url:
+                video_id = self.converter.get_youtube_video_id(source)
+                name = f"youtube_{video_id}" if video_id else _safe_name(source)
+            else:
+                name = _safe_name(os.path.splitext(os.path.basename(source))[0])
+            
+            unique_name = name
+            suffix = 2
+            while unique_name in used_names:
+                unique_name = f"{name}_{suffix}"
+                suffix += 1
+            used_names.add(unique_name)
+            
+            items.append(BatchItem(index, source, is_url, unique_name))
+        return items
+    
+    def _output_path(self, item):
+        if "txt" in self.formats:
+            return os.path.join(self.output_dir, f"{item.name}_transcript.txt")
+        return os.path.join(self.output_dir, f"{item.name}.{self.formats[0]}")
+    
+    def _prepare(self, item):
+        """입력을 다운로드하고 오디오를 메모리로 디코딩합니다 (워커 스레드)"""
+        start_time = time.time()
+        item.metrics = metrics = self.converter.start_metrics("youtube" if item.is_url else "local")
+        try:
+            if item.is_url:
+                if not self.converter.is_youtube_url(item.source):
+                    raise ValueError("Invalid YouTube URL / 유효하지 않은 YouTube URL입니다")
+                
+                # 캐시에 있으면 다운로드 생략 (초안 → 보정 결과는 오디오 해시로 캐시되므로 제외)
+                if not self.transcriber:
+                    item.cache_key = self.converter.get_youtube_cache_key(item.source, self.language)
+                if item.cache_key:
+                    cached_result = self.converter.transcript_cache.get(item.cache_key)
+                    if cached_result:
+                        item.result = cached_result
+                        item.cached = True
+                        item.audio_seconds = (cached_result.get('youtube_info') or {}).get('duration') or 0.0
+                        metrics.set('cache_hit', True)
+                        self.converter.finish_metrics(item.result, metrics)
+                        return
+                
+                with metrics.stage(METRIC_PROBE):
+                    item.youtube_info = self.converter.get_youtube_info(item.source)
+                with metrics.stage(METRIC_DOWNLOAD):
+                    downloaded_file = self.converter.download_youtube_video(item.source, audio_only=True)
+                try:
+                    with metrics.stage(METRIC_EXTRACT):
+                        item.audio = load_audio_array(downloaded_file)
+                finally:
+                    shutil.rmtree(os.path.dirname(downloaded_file), ignore_errors=True)
+            else:
+                with metrics.stage(METRIC_EXTRACT):
+                    item.audio = load_audio_array(item.source)
+            
+            item.audio_seconds = len(item.audio) / SAMPLE_RATE
+        except Exception as e:
+            item.error = e
+            self.converter.finish_metrics(None, metrics, error=e)
+        finally:
+            item.prepare_seconds = time.time() - start_time
+    
+    def _transcribe(self, item):
+        """준비된 오디오를 변환합니다 (메인 스레드)"""
+        start_time = time.time()
+        try:
+            # 자막은 세그먼트가 디코딩되는 대로 파일에 이어 씀 (초안 → 보정은 보정이 끝난 뒤 한 번에 씀)
+            if self.subtitle_formats and not self.transcriber:
+                item.subtitle_writer = SubtitleWriter(self.output_dir, item.name, self.subtitle_formats)
+                item.result = self.converter.transcribe_audio(item.audio, item.source, self.language,
+                                                              metrics=item.metrics,
+                                                              subtitle_writer=item.subtitle_writer)
+            else:
+                transcriber = self.transcriber or self.converter
+                item.result = transcriber.transcribe_audio(item.audio, item.source, self.language,
+                                                           metrics=item.metrics)
+            self._finish_result(item)
+        except Exception as e:
+            item.error = e
+            if item.subtitle_writer is not None:
+                item.subtitle_writer.abort()
+                item.subtitle_writer = None
+            self.converter.finish_metrics(None, item.metrics, error=e)
+        finally:
+            # 변환이 끝난 오디오 버퍼는 바로 해제
+            item.audio = None
+            item.transcribe_seconds = time.time() - start_time
+    
+    def _transcribe_batch(self, items):
+        """준비된 여러 입력의 오디오를 한 번에 배치 디코딩합니다 (메인 스레드)"""
+        start_time = time.time()
+        try:
+            results = self.converter.transcribe_audio_batch([item.audio for item in items],
+                                                            [item.source for item in items], self.language,
+                                                            batch_size=self.decode_batch,
+                                                            metrics=[item.metrics for item in items])
+            for item, result in zip(items, results):
+                item.result = result
+                self._finish_result(item)
+        except Exception as e:
+            for item in items:
+                item.error = e
+                self.converter.finish_metrics(None, item.metrics, error=e)
+        finally:
+            # 배치 변환 시간은 오디오 길이 비율로 나눠서 표시
+            elapsed = time.time() - start_time
+            total_audio = sum(item.audio_seconds for item in items)
+            for item in items:
+                item.audio = None
+                item.transcribe_seconds = elapsed * item.audio_seconds / total_audio if total_audio > 0 else elapsed / len(items)
+    
+    def _finish_result(self, item):
+        """YouTube 결과에 영상 정보를 붙여 캐시에 저장하고 지표를 마무리합니다"""
+        if item.is_url:
+            item.result['youtube_info'] = item.youtube_info
+            if item.cache_key:
+                self.converter.transcript_cache.put(item.cache_key, item.result)
+        self.converter.finish_metrics(item.result, item.metrics)
+    
+    def _write(self, item):
+        item.output_path = self._output_path(item)
+        if "txt" in self.formats:
+            with open(item.output_path, 'w', encoding='utf-8') as f:
+                f.write(item.result.get('transcript', ''))
+        
+        if not self.subtitle_formats:
+            return
+        language = item.result.get('detected_language')
+        if item.subtitle_writer is not None:
+            subtitle_writer, item.subtitle_writer = item.subtitle_writer, None
+            subtitle_writer.close(language)
+        else:
+            # 캐시된 결과와 배치 디코딩 결과는 세그먼트로 한 번에 씀
+            write_subtitles(item.result.get('segments', []), self.output_dir, item.name, self.subtitle_formats,
+                            language)
+    
+    def run(self, items):
+        """
+        모든 입력을 처리합니다
+        
+        Args:
+            items (list): BatchItem 목록
+        
+        Returns:
+            list: 처리된 BatchItem 목록 (건너뛴 항목 제외)
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        
+        if self.skip_existing:
+            pending = [item for item in items if not os.path.exists(self._output_path(item))]
+            skipped = len(items) - len(pending)
+            if skipped:
+                print(f"Skipping {skipped} input(s) with existing transcripts")
+            items = pending
+        
+        if not items:
+            return []
+        
+        ready = queue.Queue()
+        # 준비됐지만 아직 변환되지 않은 입력 수 제한 (메모리 상한)
+        slots = threading.Semaphore(self.prefetch + self.jobs)
+        
+        def prepare_into_queue(item):
+            try:
+                self._prepare(item)
+            finally:
+                ready.put(item)
+        
+        def feed():
+            with ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix="batch-prepare") as pool:
+                for item in items:
+                    slots.acquire()
+                    pool.submit(prepare_into_queue, item)
+        
+        feeder = threading.Thread(target=feed, name="batch-feeder", daemon=True)
+        feeder.start()
+        
+        # 첫 다운로드/추출과 겹쳐서 모델 로드
+        self.converter.load_model()
+        
+        total = len(items)
+        done = 0
+        while done < total:
+            group = [ready.get()]
+            # 이미 준비된 입력이 있으면 기다리지 않고 배치에 모음
+            while len(group) < self.decode_batch and done + len(group) < total:
+                try:
+                    group.append(ready.get_nowait())
+                except queue.Empty:
+                    break
+            
+            to_transcribe = [item for item in group if item.error is None and not item.cached]
+            if len(to_transcribe) > 1:
+                self._transcribe_batch(to_transcribe)
+            elif to_transcribe:
+                self._transcribe(to_transcribe[0])
+            
+            for item in group:
+                try:
+                    if item.error is None:
+                        self._write(item)
+                except Exception as e:
+                    item.error = e
+                finally:
+                    slots.release()
+                
+                done += 1
+                self._print_item(done, total, item)
+        
+        return items
+    
+    def _print_item(self, done, total, item):
+        prefix = f"[{done}/{total}] {item.source}"
+        if item.error is not None:
+            print(f"{prefix}: FAILED - {item.error}")
+        elif item.cached:
+            print(f"{prefix}: cached -> {item.output_path}")
+        else:
+            speed = item.audio_seconds / item.transcribe_seconds if item.transcribe_seconds > 0 else 0.0
+            print(f"{prefix}: {format_seconds(item.audio_seconds)} audio, "
+                  f"prepare {item.prepare_seconds:.1f}s, transcribe {item.transcribe_seconds:.1f}s "
+                  f"({speed:.1f}x realtime) -> {item.output_path}")
+
+
+def print_summary(items, wall_seconds):
+    """
+    배치 처리량 요약을 출력합니다
+    
+    Args:
+        items (list): 처리된 BatchItem 목록
+        wall_seconds (float): 전체 소요 시간 (초)
+    """
+    failed = [item for item in items if item.error is not None]
+    cached = [item for item in items if item.error is None and item.cached]
+    transcribed = [item for item in items if item.error is None and not item.cached]
+    
+    audio_seconds = sum(item.audio_seconds for item in transcribed)
+    transcribe_seconds = sum(item.transcribe_seconds for item in transcribed)
+    
+    print("")
+    print("=" * 60)
+    print("Batch summary / 배치 처리 요약")
+    print(f"  Inputs: {len(items)} (transcribed {len(transcribed)}, cached {len(cached)}, failed {len(failed)})")
+    print(f"  Audio transcribed: {format_seconds(audio_seconds)}")
+    print(f"  Wall time: {format_seconds(wall_seconds)} (transcription busy {format_seconds(transcribe_seconds)})")
+    if wall_seconds > 0:
+        print(f"  Throughput: {audio_seconds / wall_seconds:.1f}x realtime, "
+              f"{len(items) * 3600 / wall_seconds:.1f} files/hour")
+    if failed:
+        print("  Failed inputs:")
+        for item in failed:
+            print(f"    - {item.source}: {item.error}")
+    print("=" * 60)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Transcribe video/audio files and YouTube URLs in batch / 여러 영상을 한 번에 텍스트로 변환"
+    )
+    parser.add_argument("inputs", nargs="*", help="Files, directories, glob patterns or YouTube URLs")
+    parser.add_argument("-u", "--url-list", action="append", default=[],
+                        help="Text file with one YouTube URL per line (repeatable)")
+    parser.add_argument("-o", "--output-dir", default="transcripts", help="Directory for transcript files")
+    parser.add_argument("-f", "--formats", default=("txt",), type=_formats_arg,
+                        help=f"Comma-separated output formats ({', '.join(SUBTITLE_FORMATS)}), default txt")
+    parser.add_argument("-m", "--model", default="base", choices=MODEL_SIZES, help="Whisper model size")
+    parser.add_argument("--draft-model", default=None, choices=MODEL_SIZES,
+                        help="Transcribe with this small model first and re-decode only low-confidence parts "
+                             "with --model")
+    parser.add_argument("-l", "--language", default=None, help="Language code (e.g. ko, en), default auto-detect")
+    parser.add_argument("--backend", default=BACKEND_WHISPER, choices=list(BACKEND_OPTIONS),
+                        help="Transcription engine")
+    parser.add_argument("--cpu", action="store_true", help="Do not use the GPU")
+    parser.add_argument("--chunked", action="store_true",
+                        help="Transcribe silence-split chunks in parallel worker processes (CPU only)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for --chunked")
+    parser.add_argument("-j", "--jobs", type=int, default=2, help="Concurrent downloads/audio extractions")
+    parser.add_argument("--prefetch", type=int, default=2,
+                        help="Max prepared inputs waiting for transcription (bounds memory)")
+    parser.add_argument("--decode-batch", type=int, default=1,
+                        help="Decode up to N prepared inputs together in one batched forward pass")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the transcript cache")
+    parser.add_argument("--no-language-probe", action="store_true",
+                        help="Let the main model detect the language instead of a quick tiny-model probe")
+    parser.add_argument("--no-checkpoint", action="store_true",
+                        help="Do not save progress of long inputs for resuming after a crash")
+    parser.add_argument("--metrics-file", default=None,
+                        help="Append per-input stage timings to this JSON-lines file")
+    parser.add_argument("--no-vad", action="store_true", help="Decode silent regions too (disable silence trimming)")
+    parser.add_argument("--skip-existing", action="store_true", help="Skip inputs whose transcript file exists")
+    return parser
+
+
+def main(argv=None):
+    """
+    배치 CLI 진입점
+    
+    Args:
+        argv (list): 명령행 인자 (None이면 sys.argv)
+    
+    Returns:
+        int: 종료 코드 (실패한 입력이 있으면 1)
+    """
+    args = build_parser().parse_args(argv)
+    
+    inputs = collect_inputs(args.inputs, args.url_list)
+    if not inputs:
+        print("No inputs found / 처리할 입력이 없습니다", file=sys.stderr)
+        return 2
+    
+    options = dict(
+        use_gpu=not args.cpu,
+        chunked=args.chunked,
+        max_workers=args.workers,
+        use_cache=not args.no_cache,
+        backend=args.backend,
+        vad_filter=not args.no_vad,
+        use_checkpoints=not args.no_checkpoint,
+        language_probe=not args.no_language_probe,
+        metrics_sink=JsonLinesSink(args.metrics_file) if args.metrics_file else None
+    )
+    converter = VideoToTextConverter(model_size=args.model, **options)
+    converters = [converter]
+    transcriber = None
+    if args.draft_model and args.draft_model != args.model:
+        # 초안 모델로 준비/변환하고, 큰 모델은 보정할 구간이 처음 나올 때 로드
+        draft_converter = VideoToTextConverter(model_size=args.draft_model, **options)
+        transcriber = TwoPassTranscriber(draft_converter, converter, refine_model_size=args.model)
+        converters.insert(0, draft_converter)
+    batch = BatchTranscriber(converters[0], args.output_dir, language=args.language, jobs=args.jobs,
+                             prefetch=args.prefetch, skip_existing=args.skip_existing,
+                             decode_batch=args.decode_batch, transcriber=transcriber, formats=args.formats)
+    
+    model_label = f"'{args.draft_model}' -> '{args.model}'" if transcriber else f"'{args.model}'"
+    print(f"Processing {len(inputs)} input(s) with model {model_label} ({args.backend})")
+    start_time = time.time()
+    try:
+        items = batch.run(batch.make_items(inputs))
+    finally:
+        for each in converters:
+            each.close()
+    
+    print_summary(items, time.time() - start_time)
+    return 1 if any(item.error is not None for item in items) else 0
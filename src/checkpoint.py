@@ -0,0 +1,195 @@
+"""
+변환 체크포인트 모듈
+Transcription Checkpoint Module
+"""
+
+import os
+import json
+import time
+import tempfile
+import threading
+
+from .transcript_cache import _json_default
+
+# 이 길이 이상의 오디오만 체크포인트 기록 (초)
+CHECKPOINT_MIN_AUDIO_SECONDS = 600
+
+# 체크포인트 파일 최소 저장 간격 (초) - 중단 시 최대 이만큼의 작업을 다시 함
+CHECKPOINT_SAVE_INTERVAL_SECONDS = 15
+
+# 이 기간 동안 이어서 변환하지 않은 체크포인트는 삭제 (일)
+CHECKPOINT_MAX_AGE_DAYS = 7
+
+
+def _default_checkpoint_dir():
+    """기본 체크포인트 디렉토리를 반환합니다 / Return default checkpoint directory"""
+    return os.path.join(os.path.expanduser("~"), ".videoscribe", "checkpoints")
+
+
+class CheckpointStore:
+    """변환 도중 상태를 키별 JSON 파일로 저장하는 디스크 저장소"""
+    
+    def __init__(self, checkpoint_dir=None, max_age_days=CHECKPOINT_MAX_AGE_DAYS):
+        """
+        초기화
+        
+        Args:
+            checkpoint_dir (str): 체크포인트 디렉토리 (None이면 ~/.videoscribe/checkpoints)
+            max_age_days (float): 오래된 체크포인트 삭제 기준 (일)
+        """
+        self.checkpoint_dir = checkpoint_dir or _default_checkpoint_dir()
+        self.max_age_seconds = max_age_days * 24 * 3600
+        self._lock = threading.Lock()
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        self._remove_stale()
+    
+    def _entry_path(self, key):
+        return os.path.join(self.checkpoint_dir, f"{key}.json")
+    
+    def load(self, key):
+        """
+        저장된 상태를 반환합니다 (없거나 읽을 수 없으면 None)
+        
+        Args:
+            key (str): 체크포인트 키
+        
+        Returns:
+            dict: 저장된 상태 또는 None
+        """
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Checkpoint read failed: {e}")
+            return None
+        
+        if state.get('key') != key:
+            return None
+        return state
+    
+    def save(self, key, state):
+        """
+        상태를 저장합니다 (임시 파일에 쓴 뒤 교체하므로 중간에 죽어도 이전 체크포인트가 남음)
+        
+        Args:
+            key (str): 체크포인트 키
+            state (dict): 저장할 상태 (JSON 직렬화 가능)
+        """
+        state = dict(state, key=key)
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.checkpoint_dir, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, default=_json_default)
+            with self._lock:
+                os.replace(temp_path, self._entry_path(key))
+        except Exception as e:
+            print(f"Checkpoint write failed: {e}")
+            if temp_path:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+    
+    def remove(self, key):
+        """체크포인트를 삭제합니다 (변환이 끝났을 때)"""
+        with self._lock:
+            try:
+                os.unlink(self._entry_path(key))
+            except OSError:
+                pass
+    
+    def _remove_stale(self):
+        """오래된 체크포인트와 남은 임시 파일을 삭제합니다"""
+        now = time.time()
+        for filename in os.listdir(self.checkpoint_dir):
+            entry_path = os.path.join(self.checkpoint_dir, filename)
+            try:
+                if now - os.stat(entry_path).st_mtime > self.max_age_seconds:
+                    os.unlink(entry_path)
+            except OSError:
+                pass
+
+
+class TranscriptCheckpoint:
+    """
+    변환 한 건의 진행 상태 (완료된 세그먼트 + 디코더 재개 위치와 프롬프트)
+    
+    엔진이 청크를 끝낼 때마다 mark()로 재개 위치를 기록하고, 다시 실행하면 저장된 세그먼트를 먼저 내보낸 뒤
+    resume_sample부터 이어서 디코딩합니다. 재개 위치는 무음 제거 후 디코딩하는 오디오 기준입니다.
+    """
+    
+    def __init__(self, store, key, save_interval=CHECKPOINT_SAVE_INTERVAL_SECONDS):
+        """
+        초기화 (저장된 상태가 있으면 불러옴)
+        
+        Args:
+            store (CheckpointStore): 저장소
+            key (str): 입력 오디오 + 변환 옵션 키
+            save_interval (float): 최소 저장 간격 (초)
+        """
+        self.store = store
+        self.key = key
+        self.save_interval = save_interval
+        self.language = None
+        self.segments = []
+        self.resume_sample = 0
+        self.prompt = None
+        self._marked_count = 0
+        self._last_save = 0.0
+        
+        state = store.load(key)
+        if state:
+            self.language = state.get('language')
+            self.segments = state.get('segments', [])
+            self.resume_sample = int(state.get('resume_sample', 0))
+            self.prompt = state.get('prompt')
+            self._marked_count = len(self.segments)
+    
+    @property
+    def resumed(self):
+        """저장된 상태에서 이어서 변환하는지 여부"""
+        return self.resume_sample > 0
+    
+    @property
+    def resume_seconds(self):
+        """이미 변환된 위치 (원본 오디오 기준 초)"""
+        return self.segments[-1]['end'] if self.segments else 0.0
+    
+    def record(self, segment):
+        """디코딩된 세그먼트를 추가합니다 (청크가 끝나 mark()가 호출된 뒤에 저장 대상이 됨)"""
+        self.segments.append(segment)
+    
+    def mark(self, resume_sample, prompt=None, force=False):
+        """
+        디코더 재개 위치를 갱신하고 저장 간격이 지났으면 파일에 씁니다
+        
+        Args:
+            resume_sample (int): 다음에 디코딩할 샘플 위치
+            prompt (str): 다음 청크에 넘길 앞 문맥
+            force (bool): 저장 간격과 관계없이 저장
+        """
+        self.resume_sample = resume_sample
+        self.prompt = prompt
+        self._marked_count = len(self.segments)
+        if force or time.monotonic() - self._last_save >= self.save_interval:
+            self.flush()
+    
+    def flush(self):
+        """마지막으로 끝난 청크까지의 상태를 바로 저장합니다 (변환이 실패했을 때)"""
+        if not self._marked_count and not self.resume_sample:
+            return
+        self._last_save = time.monotonic()
+        self.store.save(self.key, {
+            'language': self.language,
+            'segments': self.segments[:self._marked_count],
+            'resume_sample': self.resume_sample,
+            'prompt': self.prompt,
+            'saved_at': time.time()
+        })
+    
+    def complete(self):
+        """변환이 끝났으므로 체크포인트를 삭제합니다"""
+        self.store.remove(self.key)
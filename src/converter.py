@@ -6,37 +6,225 @@ Video to Text Converter Module
 import os
 import tempfile
 import re
+import copy
+import time
+import threading
+from collections import OrderedDict
+
+from .audio_utils import SAMPLE_RATE, load_audio_array, gate_speech
+from .backends import BACKEND_WHISPER, create_backend
+from .transcript_cache import TranscriptCache, hash_audio
+from .checkpoint import CheckpointStore, TranscriptCheckpoint, CHECKPOINT_MIN_AUDIO_SECONDS
+from .language_detection import get_language_detector, LANGUAGE_MIN_PROBABILITY
+from .media_probe import probe_media
+from .subtitle_writer import SubtitleWriter, parse_formats
+from .metrics import (RunMetrics, sink_from_env, emit_metrics, METRIC_PROBE, METRIC_DOWNLOAD, METRIC_EXTRACT,
+                      METRIC_DETECT_LANGUAGE, METRIC_LOAD_MODEL, METRIC_DECODE, METRIC_POSTPROCESS)
+from .progress import (ProgressReporter, format_seconds, STAGE_VALIDATE, STAGE_DOWNLOAD, STAGE_EXTRACT,
+                       STAGE_LOAD_MODEL, STAGE_TRANSCRIBE, STAGE_FINALIZE)
+
+# YouTube 메타데이터 캐시 (영상 ID → (저장 시각, info dict))
+# 검증 버튼, 정보 조회, 다운로드 전략이 같은 extract_info 결과를 공유합니다
+YOUTUBE_INFO_TTL_SECONDS = 600
+YOUTUBE_INFO_CACHE_SIZE = 32
+_youtube_info_cache = OrderedDict()
+_youtube_info_lock = threading.Lock()
 
 
 class VideoToTextConverter:
     """비디오 파일에서 텍스트를 추출하는 클래스"""
     
-    def __init__(self, model_size="base", use_gpu=True):
+    def __init__(self, model_size="base", use_gpu=True, chunked=False, max_workers=None,
+                 use_cache=True, cache_dir=None, cache_size_mb=500, backend=BACKEND_WHISPER, vad_filter=True,
+                 metrics_sink=None, use_checkpoints=True, checkpoint_dir=None, language_probe=True, output_dir=None,
+                 subtitle_formats=()):
         """
         초기화
         
         Args:
             model_size (str): Whisper 모델 크기 (tiny, base, small, medium, large)
             use_gpu (bool): GPU 사용 여부
+            backend (str): 음성 인식 엔진 (whisper, faster-whisper)
+            chunked (bool): CPU에서 무음 기준 청크 병렬 변환 사용 여부
+            max_workers (int): 청크 병렬 변환 워커 프로세스 수 (None이면 자동)
+            use_cache (bool): 변환 결과 디스크 캐시 사용 여부
+            cache_dir (str): 캐시 디렉토리 (None이면 ~/.videoscribe/transcript_cache)
+            cache_size_mb (int): 캐시 최대 크기 (MB), 넘으면 오래된 항목부터 삭제
+            vad_filter (bool): 디코딩 전에 무음 구간 제거 여부 (타임스탬프는 원본 기준으로 보정)
+            metrics_sink (object): 변환 지표 기록기 (emit(dict)), None이면 VIDEOSCRIBE_METRICS_FILE 설정을 따름
+            use_checkpoints (bool): 긴 오디오 변환 중 완료된 세그먼트를 저장하여 중단 후 이어서 변환할지 여부
+            checkpoint_dir (str): 체크포인트 디렉토리 (None이면 ~/.videoscribe/checkpoints)
+            language_probe (bool): 언어 자동 감지 시 tiny 모델로 몇 구간만 먼저 감지하고 언어를 고정해서 변환할지 여부
+            output_dir (str): save_transcript로 저장할 파일의 디렉토리 (None이면 현재 디렉토리)
+            subtitle_formats (str or list): save_transcript 시 텍스트 파일과 함께 저장할 자막 형식 (srt, vtt, tsv, json)
         """
         self.model_size = model_size
         self.use_gpu = use_gpu
+        self.backend = backend
+        self.chunked = chunked
+        self.max_workers = max_workers
+        self.vad_filter = vad_filter
+        self.language_probe = language_probe
+        self.output_dir = output_dir
+        self.subtitle_formats = parse_formats(subtitle_formats)
+        self.metrics_sink = metrics_sink if metrics_sink is not None else sink_from_env()
         self.model = None
+        # 엔진 생성/모델 로드 lock (백그라운드 미리 로드와 변환 스레드가 함께 사용, _load_model 안에서 다시 잡음)
+        self._model_lock = threading.RLock()
+        self.parallel_transcriber = None
+        self.transcript_cache = None
+        self.checkpoint_store = None
+        
+        if use_cache:
+            try:
+                self.transcript_cache = TranscriptCache(cache_dir, max_size_mb=cache_size_mb)
+            except Exception as e:
+                # 캐시 디렉토리를 만들 수 없으면 캐시 없이 동작
+                print(f"Transcript cache disabled: {e}")
+        
+        if use_checkpoints:
+            try:
+                self.checkpoint_store = CheckpointStore(checkpoint_dir)
+            except Exception as e:
+                print(f"Transcript checkpoints disabled: {e}")
     
-    def _load_model(self):
-        """Whisper 모델을 로드합니다"""
-        if self.model is None:
-            import whisper
+    def _get_device(self):
+        """사용할 장치를 반환합니다 (cuda 또는 cpu)"""
+        if not self.use_gpu:
+            return "cpu"
+        
+        try:
             import torch
-            
-            # GPU 설정
-            if self.use_gpu and torch.cuda.is_available():
-                device = "cuda"
-            else:
-                device = "cpu"
-            
-            self.model = whisper.load_model(self.model_size, device=device)
-        return self.model
+        except ImportError:
+            return "cpu"
+        
+        # GPU 설정
+        if torch.cuda.is_available():
+            return "cuda"
+        return "cpu"
+    
+    def _get_backend(self):
+        """음성 인식 엔진 인스턴스를 반환합니다 (모델은 아직 로드하지 않음)"""
+        # 미리 로드 스레드와 동시에 호출되어도 엔진은 하나만 생성
+        with self._model_lock:
+            if self.model is None:
+                self.model = create_backend(self.backend, self.model_size, self._get_device())
+            return self.model
+    
+    def _load_model(self):
+        """음성 인식 엔진의 모델을 로드합니다 (백그라운드 미리 로드와 겹치면 끝날 때까지 기다림)"""
+        with self._model_lock:
+            return self._get_backend().load()
+    
+    def load_model(self):
+        """
+        모델을 미리 로드합니다 (첫 변환 전에 로딩 시간을 다른 작업과 겹치기 위해 사용)
+        
+        Returns:
+            TranscriptionBackend: 로드된 음성 인식 엔진
+        """
+        return self._load_model()
+    
+    def close(self):
+        """모델과 청크 병렬 워커 풀을 해제합니다 (다음 변환 시 다시 로드)"""
+        if self.parallel_transcriber is not None:
+            self.parallel_transcriber.close()
+            self.parallel_transcriber = None
+        self.model = None
+    
+    def detect_language(self, audio, source_key=None):
+        """
+        tiny 모델로 오디오 몇 구간만 디코딩하여 언어를 감지합니다 (본 모델 로드 전, 작업 분배용으로도 사용)
+        
+        Args:
+            audio (numpy.ndarray): 16kHz 모노 float32 오디오
+            source_key (str): 감지 결과 캐시 키 (예: 'audio:<해시>'), None이면 캐시 사용 안함
+        
+        Returns:
+            tuple: (언어 코드, 확률), 음성이 없으면 (None, 0.0)
+        """
+        detector = get_language_detector(self._get_backend().name, self._get_device())
+        return detector.detect(audio, source_key)
+    
+    def _probe_language(self, audio, audio_hash, metrics):
+        """
+        본 변환 전에 언어를 감지합니다 (확신이 낮거나 실패하면 None을 반환하여 본 모델이 감지)
+        
+        Returns:
+            str: 고정할 언어 코드 또는 None
+        """
+        try:
+            with metrics.stage(METRIC_DETECT_LANGUAGE):
+                language, probability = self.detect_language(audio, f"audio:{audio_hash or hash_audio(audio)}")
+        except Exception as e:
+            print(f"Language probe failed: {e}")
+            return None
+        
+        metrics.set('language_probability', round(probability, 4))
+        return language if probability >= LANGUAGE_MIN_PROBABILITY else None
+    
+    def start_metrics(self, source):
+        """
+        변환 한 건의 지표 기록을 시작합니다 (다운로드/추출을 직접 하는 호출자용)
+        
+        Args:
+            source (str): 입력 종류 (local, youtube, audio)
+        
+        Returns:
+            RunMetrics: 지표 객체 (변환 메서드의 metrics 인자로 전달)
+        """
+        return RunMetrics(source, model_size=self.model_size, backend=self.backend)
+    
+    def finish_metrics(self, result, metrics, error=None):
+        """
+        지표를 마무리하여 결과의 metrics 항목에 넣고 기록기로 보냅니다
+        
+        Args:
+            result (dict): 변환 결과 (실패했으면 None)
+            metrics (RunMetrics): 지표 객체
+            error (Exception): 실패 원인
+        
+        Returns:
+            dict: 지표 dict
+        """
+        if error is not None:
+            metrics.set('error', str(error))
+        metrics_dict = metrics.finish().to_dict()
+        if result is not None:
+            result['metrics'] = metrics_dict
+        emit_metrics(self.metrics_sink, metrics_dict)
+        return metrics_dict
+    
+    def _start_metrics(self, metrics, source):
+        """
+        호출자가 넘긴 지표 객체를 이어 쓰거나 새로 만듭니다
+        
+        Returns:
+            tuple: (RunMetrics, 새로 만들었는지 여부 - 만든 쪽이 마무리)
+        """
+        if metrics is not None:
+            return metrics, False
+        return self.start_metrics(source), True
+    
+    def _finish_metrics(self, result, metrics, owner, error=None):
+        """지표 객체를 만든 쪽에서만 마무리합니다"""
+        if owner:
+            self.finish_metrics(result, metrics, error)
+    
+    def _get_parallel_transcriber(self):
+        """
+        청크 병렬 변환기를 반환합니다 (CPU 전용 청크 모드가 아니면 None)
+        
+        GPU에서는 하나의 장치를 여러 프로세스가 나눠 쓰는 이득이 없으므로 순차 변환을 사용합니다.
+        """
+        if not self.chunked or self._get_device() != "cpu":
+            return None
+        
+        if self.parallel_transcriber is None:
+            from .parallel_transcriber import ParallelTranscriber
+            self.parallel_transcriber = ParallelTranscriber(self.model_size, max_workers=self.max_workers,
+                                                            backend=self._get_backend().name)
+        return self.parallel_transcriber
     
     def is_youtube_url(self, url):
         """
@@ -56,6 +244,107 @@ class VideoToTextConverter:
         ]
         return any(re.match(pattern, url.strip()) for pattern in youtube_patterns)
     
+    def get_youtube_video_id(self, url):
+        """
+        YouTube URL에서 영상 ID를 추출합니다
+        
+        Args:
+            url (str): YouTube URL
+            
+        Returns:
+            str: 영상 ID (찾지 못하면 None)
+        """
+        id_patterns = [
+            r'(?:youtube\.com/watch\?(?:.*&)?v=)([\w-]+)',
+            r'(?:youtu\.be/)([\w-]+)',
+            r'(?:youtube\.com/shorts/)([\w-]+)'
+        ]
+        for pattern in id_patterns:
+            match = re.search(pattern, url.strip())
+            if match:
+                return match.group(1)
+        return None
+    
+    def _get_cache_key(self, source_id, language):
+        """변환 결과 캐시 키를 생성합니다 (캐시 비활성화 시 None)"""
+        if self.transcript_cache is None or not source_id:
+            return None
+        return TranscriptCache.make_key(source_id, self.model_size, language, task="transcribe",
+                                        backend=self._get_backend().name, vad=self.vad_filter)
+    
+    def get_youtube_cache_key(self, url, language=None):
+        """
+        YouTube 영상 ID 기준 변환 결과 캐시 키를 반환합니다
+        
+        Args:
+            url (str): YouTube URL
+            language (str): 언어 코드, None이면 자동 감지
+            
+        Returns:
+            str: 캐시 키 (캐시 비활성화 또는 ID를 찾지 못하면 None)
+        """
+        video_id = self.get_youtube_video_id(url)
+        return self._get_cache_key(f"youtube:{video_id}" if video_id else None, language)
+    
+    def _extract_youtube_info(self, url):
+        """
+        yt-dlp로 YouTube 메타데이터를 한 번만 추출합니다 (영상 ID 기준 TTL 캐시)
+        
+        포맷 선택은 하지 않은 원본 info dict를 반환하므로 다운로드 전략마다
+        process_ie_result로 원하는 포맷을 다시 고를 수 있습니다.
+        
+        Args:
+            url (str): YouTube URL
+            
+        Returns:
+            dict: yt-dlp info dict
+        """
+        import yt_dlp
+        
+        cache_key = self.get_youtube_video_id(url) or url.strip()
+        now = time.time()
+        
+        with _youtube_info_lock:
+            cached = _youtube_info_cache.get(cache_key)
+            if cached and now - cached[0] < YOUTUBE_INFO_TTL_SECONDS:
+                _youtube_info_cache.move_to_end(cache_key)
+                return cached[1]
+        
+        ydl_opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'extract_flat': False,
+        }
+        
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=False, process=False)
+            # 리다이렉트 등 영상 결과가 아니면 일반 방식으로 해석
+            if info.get('_type', 'video') != 'video':
+                info = ydl.extract_info(url, download=False)
+        
+        with _youtube_info_lock:
+            _youtube_info_cache[cache_key] = (now, info)
+            _youtube_info_cache.move_to_end(cache_key)
+            while len(_youtube_info_cache) > YOUTUBE_INFO_CACHE_SIZE:
+                _youtube_info_cache.popitem(last=False)
+        
+        return info
+    
+    def _safe_file_name(self, title, video_id=None):
+        """
+        영상 제목을 파일 이름으로 쓸 수 있게 정리합니다
+        
+        Args:
+            title (str): 영상 제목
+            video_id (str): 영상 ID (정리한 제목이 비면 youtube_<ID>)
+        
+        Returns:
+            str: 확장자 없는 파일 이름
+        """
+        safe_title = re.sub(r'[<>:"/\\|?*]', '_', title or '')[:50]
+        safe_title = re.sub(r'[^\w\s-]', '', safe_title).strip()
+        return safe_title or f"youtube_{video_id or 'video'}"
+    
     def get_youtube_info(self, url):
         """
         YouTube 영상 정보를 가져옵니다
@@ -69,23 +358,15 @@ class VideoToTextConverter:
         try:
             # yt-dlp 우선 시도
             try:
-                import yt_dlp
-                
-                ydl_opts = {
-                    'quiet': True,
-                    'no_warnings': True,
-                    'extract_flat': False,
+                info = self._extract_youtube_info(url)
+                return {
+                    'title': info.get('title', 'Unknown'),
+                    'duration': info.get('duration', 0),
+                    'uploader': info.get('uploader', 'Unknown'),
+                    'view_count': info.get('view_count', 0),
+                    'upload_date': info.get('upload_date', 'Unknown'),
+                    'channel_id': info.get('channel_id')
                 }
-                
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                    return {
-                        'title': info.get('title', 'Unknown'),
-                        'duration': info.get('duration', 0),
-                        'uploader': info.get('uploader', 'Unknown'),
-                        'view_count': info.get('view_count', 0),
-                        'upload_date': info.get('upload_date', 'Unknown')
-                    }
             except ImportError:
                 # yt-dlp 없으면 기본 정보 반환 (클라우드 환경용)
                 print("yt-dlp not available, using basic info")
@@ -100,13 +381,15 @@ class VideoToTextConverter:
             print(f"Error getting YouTube info: {e}")
             return None
     
-    def download_youtube_video(self, url, progress_callback=None):
+    def download_youtube_video(self, url, progress_callback=None, audio_only=False, info=None):
         """
         YouTube 영상을 다운로드합니다
         
         Args:
             url (str): YouTube URL
-            progress_callback (function): 진행률 콜백 함수
+            progress_callback (function): 진행률 콜백 함수 (인자가 1개면 ProgressEvent를 받음)
+            audio_only (bool): 오디오 스트림만 다운로드 (실패 시 비디오 포맷으로 폴백)
+            info (dict): 미리 추출한 yt-dlp info dict (None이면 캐시 또는 한 번 추출)
             
         Returns:
             str: 다운로드된 파일 경로
@@ -172,218 +455,168 @@ class VideoToTextConverter:
                 'age_limit': 99,
             }
             
-            if progress_callback:
-                # 안전한 progress_callback 래퍼 생성
-                def safe_progress_callback(value, message, **kwargs):
-                    try:
-                        # 함수 시그니처 확인
-                        import inspect
-                        sig = inspect.signature(progress_callback)
-                        param_count = len(sig.parameters)
-                        
-                        if param_count >= 5:  # 새로운 파라미터를 받을 수 있는 경우
-                            progress_callback(
-                                value, 
-                                message,
-                                download_details=kwargs.get('download_details', ''),
-                                processing_details=kwargs.get('processing_details', ''),
-                                tech_details=kwargs.get('tech_details', '')
-                            )
-                        elif param_count >= 3:  # 기본 파라미터만 받는 경우
-                            progress_callback(value, message, kwargs.get('download_details', ''))
-                        else:  # 기존 방식 (2개 파라미터)
-                            progress_callback(value, message)
-                    except Exception as e:
-                        print(f"Progress callback error: {e}")
-                        # 기본 방식으로 폴백
-                        try:
-                            progress_callback(value, message)
-                        except:
-                            pass
+            # 진행률 이벤트 채널 (콜백 시그니처는 여기서 한 번만 확인)
+            progress = ProgressReporter.wrap(progress_callback)
+            
+            if progress:
+                progress.emit(STAGE_DOWNLOAD, 10, "Starting download... / 다운로드 시작...")
                 
-                safe_progress_callback(10, "Starting download... / 다운로드 시작...")
+                # 파일 크기 포맷팅
+                def format_bytes(bytes_val):
+                    for unit in ['B', 'KB', 'MB', 'GB']:
+                        if bytes_val < 1024:
+                            return f"{bytes_val:.1f}{unit}"
+                        bytes_val /= 1024
+                    return f"{bytes_val:.1f}TB"
                 
                 def progress_hook(d):
                     try:
                         if d['status'] == 'downloading':
-                            # 상세한 다운로드 정보 수집
-                            download_info = {}
+                            downloaded = d.get('downloaded_bytes') or 0
+                            total = d.get('total_bytes') or d.get('total_bytes_estimate')
+                            if not total:
+                                progress.emit(STAGE_DOWNLOAD, 25, "Downloading... / 다운로드 중...",
+                                              download_details=f"Downloaded: {format_bytes(downloaded)}")
+                                return
+                            
+                            fraction = min(1.0, downloaded / total)
+                            speed = format_bytes(d['speed']) + "/s" if d.get('speed') else "N/A"
+                            eta = format_seconds(d.get('eta'))
                             
-                            if 'total_bytes' in d and d['total_bytes']:
-                                downloaded = d['downloaded_bytes']
-                                total = d['total_bytes']
-                                percent = (downloaded / total) * 40
-                                
-                                # 파일 크기 포맷팅
-                                def format_bytes(bytes_val):
-                                    for unit in ['B', 'KB', 'MB', 'GB']:
-                                        if bytes_val < 1024:
-                                            return f"{bytes_val:.1f}{unit}"
-                                        bytes_val /= 1024
-                                    return f"{bytes_val:.1f}TB"
-                                
-                                download_info['size'] = f"{format_bytes(downloaded)}/{format_bytes(total)}"
-                                download_info['percent'] = f"{(downloaded/total)*100:.1f}%"
-                                
-                                # 다운로드 속도
-                                if 'speed' in d and d['speed']:
-                                    speed = format_bytes(d['speed']) + "/s"
-                                    download_info['speed'] = speed
-                                
-                                # ETA 계산
-                                if 'eta' in d and d['eta']:
-                                    eta_seconds = d['eta']
-                                    if eta_seconds < 60:
-                                        eta_str = f"{eta_seconds:.0f}s"
-                                    else:
-                                        minutes = eta_seconds // 60
-                                        seconds = eta_seconds % 60
-                                        eta_str = f"{minutes:.0f}m{seconds:.0f}s"
-                                    download_info['eta'] = eta_str
-                                
-                                # 상세 정보가 있는 progress_callback 호출
-                                status_msg = f"Downloading: {download_info['percent']}"
-                                if 'speed' in download_info:
-                                    status_msg += f" at {download_info['speed']}"
-                                if 'eta' in download_info:
-                                    status_msg += f" ETA {download_info['eta']}"
-                                
-                                safe_progress_callback(
-                                    10 + percent, 
-                                    status_msg + " / 다운로드 중",
-                                    download_details=f"{download_info['size']} ({download_info.get('speed', 'N/A')}, ETA: {download_info.get('eta', 'N/A')})",
-                                    tech_details=f"Downloaded: {format_bytes(downloaded)}, Speed: {download_info.get('speed', 'Unknown')}"
-                                )
-                                
-                            elif '_percent_str' in d:
-                                percent_str = d['_percent_str'].strip('%')
-                                try:
-                                    percent = float(percent_str) * 0.4
-                                    safe_progress_callback(
-                                        10 + percent, 
-                                        f"Downloading: {percent_str}% / 다운로드 중: {percent_str}%",
-                                        download_details=f"Progress: {percent_str}%"
-                                    )
-                                except:
-                                    safe_progress_callback(25, "Downloading... / 다운로드 중...")
+                            status_msg = f"Downloading: {fraction * 100:.1f}% at {speed} ETA {eta}"
+                            progress.emit(
+                                STAGE_DOWNLOAD,
+                                10 + fraction * 40,
+                                status_msg + " / 다운로드 중",
+                                fraction=fraction,
+                                download_details=f"{format_bytes(downloaded)}/{format_bytes(total)} ({speed}, ETA: {eta})",
+                                tech_details=f"Downloaded: {format_bytes(downloaded)}, Speed: {speed}"
+                            )
                         elif d['status'] == 'finished':
                             filename = d.get('filename', 'video')
-                            safe_progress_callback(
-                                50, 
+                            progress.emit(
+                                STAGE_DOWNLOAD,
+                                50,
                                 "Download completed! / 다운로드 완료!",
+                                fraction=1.0,
                                 download_details=f"File saved: {os.path.basename(filename)}",
                                 processing_details="Preparing for text extraction / 텍스트 추출 준비"
                             )
                     except Exception as e:
-                        print(f"Progress callback error: {e}")
-                        # 에러 발생 시 기본 메시지
-                        if hasattr(progress_callback, '__call__'):
-                            try:
-                                safe_progress_callback(25, f"Downloading... / 다운로드 중... (Error: {str(e)})")
-                            except:
-                                pass
+                        print(f"Progress hook error: {e}")
                 
                 ydl_opts['progress_hooks'] = [progress_hook]
             
-            # 다중 시도 전략
+            # 다중 시도 전략 (opts, 오디오 전용 여부)
             download_strategies = [
                 # 전략 1: 최신 설정
-                ydl_opts.copy(),
+                (ydl_opts.copy(), False),
                 
                 # 전략 2: 더 낮은 품질 우선
-                {**ydl_opts, 'format': 'worst[ext=mp4]/worst'},
+                ({**ydl_opts, 'format': 'worst[ext=mp4]/worst'}, False),
                 
                 # 전략 3: 모든 포맷 허용
-                {**ydl_opts, 'format': 'best/worst'},
+                ({**ydl_opts, 'format': 'best/worst'}, False),
                 
                 # 전략 4: 기본 설정
-                {
+                ({
                     'format': 'mp4/best',
                     'outtmpl': os.path.join(temp_dir, '%(title)s.%(ext)s'),
                     'quiet': True,
                     'no_warnings': True,
-                }
+                }, False)
             ]
             
+            if audio_only:
+                # 오디오만 필요하면 오디오 스트림 우선 (opus/m4a), 비디오 포맷은 폴백으로만 사용
+                download_strategies = [
+                    ({**ydl_opts, 'format': 'bestaudio[acodec=opus]/bestaudio[ext=m4a]/bestaudio'}, True),
+                    ({**ydl_opts, 'format': 'worstaudio[acodec=opus]/worstaudio[ext=m4a]/worstaudio'}, True),
+                ] + download_strategies
+            
+            # 메타데이터는 한 번만 추출하고 모든 전략에서 재사용
+            if info is None:
+                info = self._extract_youtube_info(url)
+            
+            strategy_count = len(download_strategies)
             last_error = None
             
-            for strategy_num, strategy_opts in enumerate(download_strategies, 1):
+            for strategy_num, (strategy_opts, audio_strategy) in enumerate(download_strategies, 1):
                 try:
-                    if progress_callback:
-                        progress_callback(5 + strategy_num * 2, f"Trying strategy {strategy_num}/4... / 전략 {strategy_num}/4 시도 중...")
+                    if progress:
+                        progress.emit(STAGE_DOWNLOAD, 5 + strategy_num * 2, f"Trying strategy {strategy_num}/{strategy_count}... / 전략 {strategy_num}/{strategy_count} 시도 중...")
                     
-                    with yt_dlp.YoutubeDL(strategy_opts) as ydl:
-                        # 영상 정보 먼저 추출
-                        info = ydl.extract_info(url, download=False)
-                        title = info.get('title', 'video')
-                        
-                        # 사용 가능한 포맷 확인
-                        formats = info.get('formats', [])
-                        if not formats:
-                            continue
+                    title = info.get('title', 'video')
+                    
+                    # 사용 가능한 포맷 확인
+                    formats = info.get('formats', [])
+                    if not formats:
+                        continue
+                    
+                    # 포맷 필터링 (storyboard 제외, 오디오 전략은 오디오 코덱이 있는 포맷)
+                    valid_formats = [
+                        f for f in formats 
+                        if (f.get('acodec') != 'none' if audio_strategy else f.get('vcodec') != 'none')
+                        and f.get('ext') not in ['mhtml', 'html'] 
+                        and 'storyboard' not in (f.get('format_note') or '').lower()
+                        and f.get('protocol') != 'mhtml'
+                    ]
+                    
+                    if not valid_formats:
+                        print(f"Strategy {strategy_num}: No valid {'audio' if audio_strategy else 'video'} formats found")
+                        continue
+                    
+                    print(f"Strategy {strategy_num}: Found {len(valid_formats)} valid formats")
+                    
+                    # 다운로드 경로 설정
+                    safe_title = self._safe_file_name(title, info.get('id'))
+                    strategy_opts['outtmpl'] = os.path.join(temp_dir, f'{safe_title}.%(ext)s')
+                    
+                    # 다운로드 실행 (추출된 info 재사용, 포맷 선택만 전략별로 다시 수행)
+                    with yt_dlp.YoutubeDL(strategy_opts) as ydl_download:
+                        ydl_download.process_ie_result(copy.deepcopy(info), download=True)
+                    
+                    # 다운로드된 파일 검증
+                    media_extensions = ['.mp4', '.webm', '.mkv', '.avi', '.mov', '.flv']
+                    if audio_strategy:
+                        media_extensions += ['.m4a', '.opus', '.ogg', '.mp3', '.aac', '.wav']
+                    
+                    downloaded_files = []
+                    for filename in os.listdir(temp_dir):
+                        file_path = os.path.join(temp_dir, filename)
+                        if os.path.isfile(file_path):
+                            file_size = os.path.getsize(file_path)
+                            if file_size > 1024:  # 1KB 이상
+                                _, ext = os.path.splitext(filename.lower())
+                                if ext in media_extensions:
+                                    downloaded_files.append((file_path, file_size))
+                    
+                    if downloaded_files:
+                        # 가장 큰 파일 선택
+                        downloaded_files.sort(key=lambda x: x[1], reverse=True)
+                        selected_file = downloaded_files[0][0]
                         
-                        # 비디오 포맷 필터링 (storyboard 제외)
-                        video_formats = [
-                            f for f in formats 
-                            if f.get('vcodec') != 'none' 
-                            and f.get('ext') not in ['mhtml', 'html'] 
-                            and 'storyboard' not in f.get('format_note', '').lower()
-                            and f.get('protocol') != 'mhtml'
-                        ]
+                        # 오디오 전용 파일은 크기만 확인
+                        if audio_strategy:
+                            print(f"Success with strategy {strategy_num} (audio only)!")
+                            progress.emit(STAGE_DOWNLOAD, 50, f"Download successful with strategy {strategy_num} / 전략 {strategy_num}로 다운로드 성공",
+                                          tech_details=f"Used download strategy: {strategy_num}")
+                            return selected_file
                         
-                        if not video_formats:
-                            print(f"Strategy {strategy_num}: No valid video formats found")
+                        # 파일이 실제 비디오인지 검증 (ffprobe 헤더 조회, 프레임 디코딩 없음)
+                        try:
+                            media_info = probe_media(selected_file)
+                            if media_info.get('duration') and media_info['duration'] > 0:
+                                print(f"Success with strategy {strategy_num}!")
+                                progress.emit(STAGE_DOWNLOAD, 50, f"Download successful with strategy {strategy_num} / 전략 {strategy_num}로 다운로드 성공",
+                                              tech_details=f"Used download strategy: {strategy_num}")
+                                return selected_file
+                        except Exception as e:
+                            print(f"Strategy {strategy_num}: Video validation failed: {e}")
                             continue
-                        
-                        print(f"Strategy {strategy_num}: Found {len(video_formats)} valid formats")
-                        
-                        # 파일명 정리
-                        safe_title = re.sub(r'[<>:"/\\|?*]', '_', title)[:50]
-                        safe_title = re.sub(r'[^\w\s-]', '', safe_title).strip()
-                        
-                        # 다운로드 경로 설정
-                        strategy_opts['outtmpl'] = os.path.join(temp_dir, f'{safe_title}.%(ext)s')
-                        
-                        # 다운로드 실행
-                        with yt_dlp.YoutubeDL(strategy_opts) as ydl_download:
-                            ydl_download.download([url])
-                        
-                        # 다운로드된 파일 검증
-                        downloaded_files = []
-                        for filename in os.listdir(temp_dir):
-                            file_path = os.path.join(temp_dir, filename)
-                            if os.path.isfile(file_path):
-                                file_size = os.path.getsize(file_path)
-                                if file_size > 1024:  # 1KB 이상
-                                    _, ext = os.path.splitext(filename.lower())
-                                    if ext in ['.mp4', '.webm', '.mkv', '.avi', '.mov', '.flv']:
-                                        downloaded_files.append((file_path, file_size))
-                        
-                        if downloaded_files:
-                            # 가장 큰 파일 선택
-                            downloaded_files.sort(key=lambda x: x[1], reverse=True)
-                            selected_file = downloaded_files[0][0]
-                            
-                            # 파일이 실제 비디오인지 검증
-                            try:
-                                # 클라우드 환경에서는 MoviePy 없이 파일 존재만 확인
-                                try:
-                                    from moviepy.editor import VideoFileClip
-                                    with VideoFileClip(selected_file) as test_clip:
-                                        if test_clip.duration and test_clip.duration > 0:
-                                            print(f"Success with strategy {strategy_num}!")
-                                            return selected_file
-                                except ImportError:
-                                    # MoviePy 없으면 파일 존재와 크기만 확인
-                                    if os.path.exists(selected_file) and os.path.getsize(selected_file) > 1000:
-                                        print(f"Success with strategy {strategy_num} (no MoviePy validation)!")
-                                        return selected_file
-                            except Exception as e:
-                                print(f"Strategy {strategy_num}: Video validation failed: {e}")
-                                continue
-                        
-                        print(f"Strategy {strategy_num}: No valid files downloaded")
-                        
+                    
+                    print(f"Strategy {strategy_num}: No valid files downloaded")
+                    
                 except Exception as e:
                     last_error = e
                     print(f"Strategy {strategy_num} failed: {e}")
@@ -406,7 +639,8 @@ class VideoToTextConverter:
                 print(f"Error downloading YouTube video: {e}")
                 raise Exception(f"Download failed: {error_msg} / 다운로드 실패: {error_msg}")
     
-    def process_youtube_video(self, url, language=None, save_transcript=False, progress_callback=None):
+    def process_youtube_video(self, url, language=None, save_transcript=False, progress_callback=None, segment_callback=None,
+                              metrics=None, decode_lock=None):
         """
         YouTube 영상을 다운로드하고 텍스트를 추출합니다
         
@@ -414,64 +648,91 @@ class VideoToTextConverter:
             url (str): YouTube URL
             language (str): 언어 코드 (예: 'ko', 'en'), None이면 자동 감지
             save_transcript (bool): 텍스트 파일로 저장 여부
-            progress_callback (function): 진행률 콜백 함수
+            progress_callback (function): 진행률 콜백 함수 (인자가 1개면 ProgressEvent를 받음)
+            segment_callback (function): 세그먼트가 디코딩될 때마다 호출되는 콜백 (segment dict)
+            metrics (RunMetrics): 이어서 기록할 지표 객체 (None이면 새로 만들어 결과의 metrics에 넣음)
+            decode_lock (threading.Lock): 디코딩하는 동안만 잡을 lock (다운로드/오디오 추출 중에는 잡지 않음)
             
         Returns:
-            dict: 추출 결과 (transcript, detected_language, segments, youtube_info)
+            dict: 추출 결과 (transcript, detected_language, segments, youtube_info, metrics)
         """
         downloaded_file = None
+        metrics, owns_metrics = self._start_metrics(metrics, "youtube")
         try:
             # YouTube URL 검증
             if not self.is_youtube_url(url):
                 raise ValueError("Invalid YouTube URL / 유효하지 않은 YouTube URL입니다")
             
-            if progress_callback:
-                # 안전한 progress_callback 래퍼
-                def safe_callback(value, message, **kwargs):
-                    try:
-                        import inspect
-                        sig = inspect.signature(progress_callback)
-                        param_count = len(sig.parameters)
-                        
-                        if param_count >= 5:
-                            progress_callback(value, message, 
-                                            download_details=kwargs.get('download_details', ''),
-                                            processing_details=kwargs.get('processing_details', ''),
-                                            tech_details=kwargs.get('tech_details', ''))
-                        elif param_count >= 3:
-                            progress_callback(value, message, kwargs.get('download_details', ''))
-                        else:
-                            progress_callback(value, message)
-                    except:
-                        try:
-                            progress_callback(value, message)
-                        except:
-                            pass
-                
-                safe_callback(5, "Validating URL... / URL 검증 중...")
+            # 진행률 이벤트 채널 (다운로드/로컬 처리 단계에서 그대로 공유)
+            progress = ProgressReporter.wrap(progress_callback)
+            
+            if progress:
+                progress.emit(STAGE_VALIDATE, 5, "Validating URL... / URL 검증 중...")
+            
+            # 캐시 확인 (같은 영상 ID + 모델 + 언어면 다운로드/변환 생략)
+            cache_key = self.get_youtube_cache_key(url, language)
+            cached_result = self.transcript_cache.get(cache_key) if cache_key else None
+            if cached_result:
+                if progress:
+                    progress.emit(STAGE_FINALIZE, 85, "Loaded from cache! / 캐시에서 불러옴!",
+                                  processing_details="Same video was transcribed before / 이전에 변환한 영상입니다")
+                self._emit_segments(cached_result.get('segments', []), segment_callback)
+                if save_transcript:
+                    # 제목을 그대로 경로로 쓰지 않고 다운로드 파일과 같은 규칙으로 정리
+                    youtube_info = cached_result.get('youtube_info') or {}
+                    file_name = self._safe_file_name(youtube_info.get('title', ''), self.get_youtube_video_id(url))
+                    if cached_result.get('transcript'):
+                        self._save_transcript_file(file_name, cached_result['transcript'])
+                    self._save_subtitle_files(file_name, cached_result)
+                metrics.set('cache_hit', True)
+                self._finish_metrics(cached_result, metrics, owns_metrics)
+                return cached_result
             
             # YouTube 정보 가져오기
-            youtube_info = self.get_youtube_info(url)
+            with metrics.stage(METRIC_PROBE):
+                youtube_info = self.get_youtube_info(url)
             if not youtube_info:
                 raise Exception("Failed to get YouTube video info / YouTube 영상 정보를 가져올 수 없습니다")
             
-            # 영상 다운로드 (safe_callback 전달)
-            downloaded_file = self.download_youtube_video(url, safe_callback)
+            # 오디오 스트림 다운로드 (실패 시 비디오 포맷으로 폴백)
+            with metrics.stage(METRIC_DOWNLOAD):
+                downloaded_file = self.download_youtube_video(url, progress, audio_only=True)
+            metrics.set('download_bytes', os.path.getsize(downloaded_file))
             
-            if progress_callback:
-                safe_callback(55, "Processing downloaded video... / 다운로드된 영상 처리 중...", 
-                            processing_details="Preparing for audio extraction / 오디오 추출 준비")
+            if progress:
+                progress.emit(STAGE_EXTRACT, 55, "Processing downloaded video... / 다운로드된 영상 처리 중...",
+                              processing_details="Preparing for audio extraction / 오디오 추출 준비")
             
-            # 다운로드된 파일을 로컬 비디오 처리 메서드로 처리 (safe_callback 전달)
-            result = self.process_local_video_with_info(downloaded_file, language, save_transcript, safe_callback)
+            # 같은 채널에서 언어가 일관되게 감지됐으면 감지 단계 없이 그 언어로 고정
+            channel_id = youtube_info.get('channel_id')
+            channel_detector = None
+            channel_language = None
+            if language is None and self.language_probe and channel_id:
+                channel_detector = get_language_detector(self._get_backend().name, self._get_device())
+                channel_language = channel_detector.lookup_channel(channel_id)
+                if channel_language:
+                    metrics.set('channel_language', channel_language)
+            
+            # 다운로드된 파일을 로컬 비디오 처리 메서드로 처리 (같은 진행률 채널 전달)
+            result = self.process_local_video_with_info(downloaded_file, language or channel_language, save_transcript,
+                                                        progress, segment_callback=segment_callback, metrics=metrics,
+                                                        decode_lock=decode_lock)
+            
+            if channel_detector is not None and not channel_language:
+                channel_detector.record_channel(channel_id, result.get('detected_language'))
             
             # YouTube 정보 추가
             result['youtube_info'] = youtube_info
             
+            if cache_key:
+                self.transcript_cache.put(cache_key, result)
+            
+            self._finish_metrics(result, metrics, owns_metrics)
             return result
             
         except Exception as e:
             print(f"Error processing YouTube video: {e}")
+            self._finish_metrics(None, metrics, owns_metrics, error=e)
             raise e
         finally:
             # 임시 파일 정리
@@ -486,37 +747,33 @@ class VideoToTextConverter:
 
     def get_video_info(self, file_path):
         """
-        비디오 파일 정보를 가져옵니다
+        비디오 파일 정보를 가져옵니다 (ffprobe 한 번 호출, 경로 + 수정 시각 기준 캐시)
         
         Args:
             file_path (str): 비디오 파일 경로
             
         Returns:
-            dict: 비디오 정보 (duration, fps, size)
+            dict: 비디오 정보 (duration, fps, size, has_audio, video, audio 스트림 정보),
+                  읽을 수 없으면 None
         """
         try:
-            # MoviePy 우선 시도
-            try:
-                from moviepy.editor import VideoFileClip
-                with VideoFileClip(file_path) as video:
-                    return {
-                        'duration': video.duration,
-                        'fps': video.fps,
-                        'size': (video.w, video.h)
-                    }
-            except ImportError:
-                # MoviePy 없으면 기본 정보만 반환
-                import os
-                return {
-                    'duration': None,
-                    'fps': 30,  # 기본값
-                    'size': (1920, 1080)  # 기본값
-                }
+            return probe_media(file_path)
         except Exception as e:
             print(f"Error getting video info: {e}")
             return None
     
-    def process_local_video_with_info(self, file_path, language=None, save_transcript=False, progress_callback=None):
+    def _probe_local_file(self, file_path, metrics):
+        """원본 스트림 정보를 지표에 기록합니다 (실패해도 변환은 계속)"""
+        with metrics.stage(METRIC_PROBE):
+            media_info = self.get_video_info(file_path)
+        if media_info:
+            metrics.set('media_duration', media_info.get('duration'))
+            metrics.set('audio_codec', (media_info.get('audio') or {}).get('codec'))
+        if os.path.exists(file_path):
+            metrics.set('file_bytes', os.path.getsize(file_path))
+    
+    def process_local_video_with_info(self, file_path, language=None, save_transcript=False, progress_callback=None,
+                                      segment_callback=None, metrics=None, decode_lock=None):
         """
         비디오 파일을 처리하여 텍스트를 추출합니다
         
@@ -524,267 +781,596 @@ class VideoToTextConverter:
             file_path (str): 비디오 파일 경로
             language (str): 언어 코드 (예: 'ko', 'en'), None이면 자동 감지
             save_transcript (bool): 텍스트 파일로 저장 여부
-            progress_callback (function): 진행률 콜백 함수
+            progress_callback (function): 진행률 콜백 함수 (인자가 1개면 ProgressEvent를 받음)
+            segment_callback (function): 세그먼트가 디코딩될 때마다 호출되는 콜백 (segment dict)
+            metrics (RunMetrics): 이어서 기록할 지표 객체 (None이면 새로 만들어 결과의 metrics에 넣음)
+            decode_lock (threading.Lock): 디코딩하는 동안만 잡을 lock (오디오 추출 중에는 잡지 않음)
             
         Returns:
-            dict: 추출 결과 (transcript, detected_language, segments)
+            dict: 추출 결과 (transcript, detected_language, segments, metrics)
         """
+        metrics, owns_metrics = self._start_metrics(metrics, "local")
         try:
-            # 모델 로드
-            model = self._load_model()
+            progress = ProgressReporter.wrap(progress_callback)
+            self._probe_local_file(file_path, metrics)
             
-            # 진행률 업데이트
-            if progress_callback:
-                # 안전한 progress_callback 래퍼
-                def safe_local_callback(value, message, **kwargs):
-                    try:
-                        import inspect
-                        sig = inspect.signature(progress_callback)
-                        param_count = len(sig.parameters)
-                        
-                        if param_count >= 5:
-                            progress_callback(value, message, 
-                                            download_details=kwargs.get('download_details', ''),
-                                            processing_details=kwargs.get('processing_details', ''),
-                                            tech_details=kwargs.get('tech_details', ''))
-                        elif param_count >= 3:
-                            progress_callback(value, message, kwargs.get('processing_details', ''))
-                        else:
-                            progress_callback(value, message)
-                    except:
-                        try:
-                            progress_callback(value, message)
-                        except:
-                            pass
-                
-                safe_local_callback(60, "Extracting audio... / 오디오 추출 중...", 
-                                  processing_details="Using MoviePy for audio extraction")
+            if progress:
+                progress.emit(STAGE_EXTRACT, 60, "Extracting audio... / 오디오 추출 중...",
+                              processing_details="Decoding audio to memory via FFmpeg pipe")
             
-            # 오디오 추출 (MoviePy 우선, 없으면 FFmpeg 직접 사용)
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_audio:
-                temp_audio_path = tmp_audio.name
+            # 오디오 추출 (FFmpeg 파이프 → NumPy 버퍼, 임시 WAV 파일 없음)
+            with metrics.stage(METRIC_EXTRACT):
+                audio = load_audio_array(file_path)
             
             try:
-                # MoviePy 우선 시도
-                try:
-                    from moviepy.editor import VideoFileClip
-                    with VideoFileClip(file_path) as video:
-                        audio = video.audio
-                        audio.write_audiofile(temp_audio_path, verbose=False, logger=None)
-                        audio.close()
-                except ImportError:
-                    # MoviePy 없으면 FFmpeg 직접 사용
-                    import subprocess
-                    ffmpeg_cmd = [
-                        'ffmpeg', '-i', file_path, 
-                        '-vn',  # 비디오 스트림 제거
-                        '-acodec', 'pcm_s16le',  # WAV 포맷
-                        '-ar', '16000',  # 샘플링 레이트
-                        '-ac', '1',  # 모노
-                        '-y',  # 덮어쓰기
-                        temp_audio_path
-                    ]
-                    
-                    result = subprocess.run(ffmpeg_cmd, 
-                                          capture_output=True, 
-                                          text=True, 
-                                          timeout=300)  # 5분 타임아웃
-                    
-                    if result.returncode != 0:
-                        raise Exception(f"FFmpeg failed: {result.stderr}")
+                result = self.transcribe_audio(audio, file_path, language, save_transcript, progress, segment_callback,
+                                               metrics=metrics, decode_lock=decode_lock)
+            finally:
+                # 디코딩된 오디오 버퍼 해제
+                del audio
+            
+            self._finish_metrics(result, metrics, owns_metrics)
+            return result
                     
-                    print("Audio extracted using FFmpeg (MoviePy not available)")
-                
-                # AI 모델 로딩 완료 - 간단한 진행률 업데이트만
-                if progress_callback:
-                    safe_local_callback(65, "")
-                
-                # Whisper로 텍스트 변환 (실시간 진행률 포함)
-                transcribe_options = {
-                    "task": "transcribe",
-                    "verbose": True,  # 진행률 표시 활성화
-                    "fp16": False  # 안정성 개선
-                }
-                
-                if language:
-                    transcribe_options["language"] = language
-                
-                # 실시간 진행률 모니터링을 위한 래퍼
-                import sys
-                import io
-                from contextlib import redirect_stdout, redirect_stderr
-                
-                # 고급 진행률 캡처용 클래스
-                class ProgressCapture:
-                    def __init__(self, callback=None):
-                        self.callback = callback
-                        self.buffer = ""
-                        self.last_progress = 65
-                        self.start_time = None
-                        import time
-                        self.start_time = time.time()
-                        
-                    def write(self, text):
-                        if text and text.strip():
-                            self.buffer += text
-                            
-                            if self.callback:
-                                import re
-                                import time
-                                
-                                # 1. 기본 진행률 패턴 (예: "45%|████")
-                                progress_match = re.search(r'(\d+)%', text)
-                                if progress_match:
-                                    percent = int(progress_match.group(1))
-                                    # 65%에서 85% 사이로 매핑
-                                    mapped_percent = 65 + (percent * 0.2)
-                                    self.last_progress = mapped_percent
-                                    
-                                    # 상태 메시지 기본값
-                                    status_msg = f"AI processing: {percent}% / AI 처리중: {percent}%"
-                                    processing_details = f"Whisper AI: {percent}%"
-                                    tech_details = f"Progress: {percent}/100"
-                                    
-                                    self.callback(mapped_percent, status_msg, processing_details=processing_details, tech_details=tech_details)
-                                
-                                # 2. 상세 시간/프레임 정보 패턴 (예: "[00:45<00:30, 2954.12frames/s]")
-                                time_pattern = r'\[(\d{2}:\d{2})<(\d{2}:\d{2}),\s*([\d.]+)frames/s\]'
-                                time_match = re.search(time_pattern, text)
-                                if time_match:
-                                    elapsed_time = time_match.group(1)  # 00:45
-                                    remaining_time = time_match.group(2)  # 00:30
-                                    frame_rate = float(time_match.group(3))  # 2954.12
-                                    
-                                    # 시간 기반 진행률 계산
-                                    def parse_time(time_str):
-                                        minutes, seconds = map(int, time_str.split(':'))
-                                        return minutes * 60 + seconds
-                                    
-                                    elapsed_seconds = parse_time(elapsed_time)
-                                    remaining_seconds = parse_time(remaining_time)
-                                    
-                                    if elapsed_seconds + remaining_seconds > 0:
-                                        time_progress = elapsed_seconds / (elapsed_seconds + remaining_seconds)
-                                        # 65%~85% 범위로 매핑
-                                        mapped_percent = 65 + (time_progress * 20)
-                                        self.last_progress = mapped_percent
-                                        
-                                        # 상세 정보 구성
-                                        status_msg = f"AI processing: {time_progress*100:.1f}% / AI 처리중: {time_progress*100:.1f}%"
-                                        processing_details = f"Time: {elapsed_time} elapsed, {remaining_time} remaining"
-                                        tech_details = f"Speed: {frame_rate:.1f} frames/s, Total time: {elapsed_seconds + remaining_seconds}s"
-                                        
-                                        self.callback(mapped_percent, status_msg, processing_details=processing_details, tech_details=tech_details)
-                                
-                                # 3. 완료 상태 감지 (예: "[01:23<00:00, 2954.12frames/s]")
-                                completed_pattern = r'\[(\d{2}:\d{2})<00:00,\s*([\d.]+)frames/s\]'
-                                completed_match = re.search(completed_pattern, text)
-                                if completed_match:
-                                    total_time = completed_match.group(1)
-                                    final_frame_rate = float(completed_match.group(2))
-                                    
-                                    # 거의 완료 상태로 설정
-                                    self.last_progress = 84
-                                    status_msg = "AI processing: 99% (finalizing) / AI 처리: 99% (마무리중)"
-                                    processing_details = f"Completed in {total_time}, finalizing results"
-                                    tech_details = f"Final speed: {final_frame_rate:.1f} frames/s"
-                                    
-                                    self.callback(84, status_msg, processing_details=processing_details, tech_details=tech_details)
-                                
-                                # 4. 언어 감지 정보
-                                if 'Detected language:' in text:
-                                    lang_match = re.search(r'Detected language:\s*(\w+)', text)
-                                    if lang_match:
-                                        detected_lang = lang_match.group(1)
-                                        status_msg = f"Language detected: {detected_lang} / 언어 감지: {detected_lang}"
-                                        processing_details = f"Language: {detected_lang}"
-                                        tech_details = f"Language detection completed: {detected_lang}"
-                                        
-                                        self.callback(self.last_progress, status_msg, processing_details=processing_details, tech_details=tech_details)
-                                
-                                # 5. 성공/완료 메시지
-                                if 'Success with strategy' in text:
-                                    strategy_match = re.search(r'Success with strategy (\d+)', text)
-                                    if strategy_match:
-                                        strategy_num = strategy_match.group(1)
-                                        status_msg = f"Download successful with strategy {strategy_num} / 전략 {strategy_num}로 다운로드 성공"
-                                        processing_details = f"Download strategy {strategy_num} worked"
-                                        tech_details = f"Used download strategy: {strategy_num}"
-                                        
-                                        # 현재 진행률 유지하면서 메시지만 업데이트
-                                        self.callback(self.last_progress, status_msg, processing_details=processing_details, tech_details=tech_details)
-                                
-                                # 6. 전체 처리 시간 계산 및 표시
-                                current_time = time.time()
-                                if self.start_time:
-                                    elapsed_total = current_time - self.start_time
-                                    minutes = int(elapsed_total // 60)
-                                    seconds = int(elapsed_total % 60)
-                                    
-                                    # 긴 처리에 대한 사용자 피드백
-                                    if elapsed_total > 30:  # 30초 이상 처리 시
-                                        if hasattr(self, '_last_time_update') and current_time - self._last_time_update < 5:
-                                            pass  # 5초마다 업데이트
-                                        else:
-                                            self._last_time_update = current_time
-                                            tech_details = f"Total processing time: {minutes}m {seconds}s"
-                                            
-                        sys.__stdout__.write(text)
-                        
-                    def flush(self):
-                        sys.__stdout__.flush()
-                
-                # 안전한 progress_callback을 ProgressCapture에 전달 (safe_local_callback을 사용)
-                
-                # 진행률 캡처 설정 (safe_local_callback 사용)
-                progress_capture = ProgressCapture(safe_local_callback)
-                
+        except Exception as e:
+            print(f"Error processing video: {e}")
+            self._finish_metrics(None, metrics, owns_metrics, error=e)
+            raise e
+    
+    def transcribe_audio(self, audio, file_path, language=None, save_transcript=False, progress_callback=None,
+                         segment_callback=None, metrics=None, decode_lock=None, subtitle_writer=None):
+        """
+        이미 디코딩된 오디오를 텍스트로 변환합니다 (캐시 확인 포함)
+        
+        Args:
+            audio (numpy.ndarray): 16kHz 모노 float32 오디오
+            file_path (str): 원본 파일 경로 (저장 파일 이름용)
+            language (str): 언어 코드 (예: 'ko', 'en'), None이면 자동 감지
+            save_transcript (bool): 텍스트 파일로 저장 여부
+            progress_callback (function): 진행률 콜백 함수 (인자가 1개면 ProgressEvent를 받음)
+            segment_callback (function): 세그먼트가 디코딩될 때마다 호출되는 콜백 (segment dict)
+            metrics (RunMetrics): 이어서 기록할 지표 객체 (None이면 새로 만들어 결과의 metrics에 넣음)
+            decode_lock (threading.Lock): 디코딩하는 동안 잡을 lock (공유 모델이면 ModelPool.decode_lock,
+                기다린 시간은 queue_wait 단계로 기록)
+            subtitle_writer (SubtitleWriter): 세그먼트를 이어 쓸 자막 기록기 (닫기/삭제는 호출한 쪽에서 함,
+                쓰기 오류는 변환을 멈춤)
+            
+        Returns:
+            dict: 추출 결과 (transcript, detected_language, segments, metrics)
+        """
+        progress = ProgressReporter.wrap(progress_callback)
+        metrics, owns_metrics = self._start_metrics(metrics, "audio")
+        metrics.set('audio_seconds', len(audio) / SAMPLE_RATE)
+        
+        # 캐시 확인 (디코딩된 오디오 해시 + 모델 + 언어)
+        audio_hash = None
+        cache_key = None
+        if self.transcript_cache is not None:
+            audio_hash = hash_audio(audio)
+            cache_key = self._get_cache_key(f"audio:{audio_hash}", language)
+            cached_result = self.transcript_cache.get(cache_key)
+            if cached_result:
+                if progress:
+                    progress.emit(STAGE_FINALIZE, 65, "Loaded from cache! / 캐시에서 불러옴!",
+                                  processing_details="Same audio was transcribed before / 이전에 변환한 오디오입니다")
+                if subtitle_writer is not None:
+                    for segment in cached_result.get('segments', []):
+                        subtitle_writer.write_segment(segment)
+                self._emit_segments(cached_result.get('segments', []), segment_callback)
+                result = self._build_transcript_result(cached_result, file_path, save_transcript, progress)
+                metrics.set('cache_hit', True)
+                self._finish_metrics(result, metrics, owns_metrics)
+                return result
+        
+        if progress:
+            progress.emit(STAGE_LOAD_MODEL, 65, "Loading AI model... / AI 모델 로딩 중...",
+                          processing_details=f"Model: {self.model_size}, Engine: {self.backend}")
+        
+        # 언어 자동 감지면 작은 모델로 먼저 감지하고 본 모델은 언어를 고정해서 디코딩
+        decode_language = language
+        if language is None and self.language_probe:
+            decode_language = self._probe_language(audio, audio_hash, metrics)
+        
+        # 모델 로드 시간을 디코딩과 분리해서 기록 (청크 병렬 모드는 워커가 각자 로드)
+        if self._get_parallel_transcriber() is None:
+            with metrics.stage(METRIC_LOAD_MODEL):
+                metrics.set('device', self._load_model().device)
+        
+        # 긴 오디오는 청크가 끝날 때마다 체크포인트 저장 (중단된 변환이 있으면 이어서 진행)
+        checkpoint = self._open_checkpoint(audio, language, audio_hash)
+        if checkpoint is not None and checkpoint.resumed:
+            metrics.set('resumed_seconds', checkpoint.resume_seconds)
+        
+        # 자막 파일은 세그먼트가 디코딩되는 대로 이어서 기록 (호출한 쪽이 넘긴 기록기가 없을 때만 직접 엶)
+        own_writer = None
+        if save_transcript and subtitle_writer is None:
+            subtitle_writer = own_writer = self._open_subtitle_writer(file_path)
+        
+        # 디코딩 루프에서 직접 진행률 이벤트 발생 (stdout 캡처 없음)
+        try:
+            with metrics.hold(decode_lock), metrics.stage(METRIC_DECODE):
+                result = self._transcribe_streaming(audio, decode_language, segment_callback, progress, checkpoint,
+                                                    subtitle_writer)
+        except BaseException:
+            # 실패/중단 시 마지막으로 끝난 청크까지 저장
+            if checkpoint is not None:
+                checkpoint.flush()
+            if own_writer is not None:
+                own_writer.abort()
+            raise
+        metrics.set('cache_hit', False)
+        metrics.set('segments', len(result['segments']))
+        
+        with metrics.stage(METRIC_POSTPROCESS):
+            result = self._build_transcript_result(result, file_path, save_transcript, progress, cache_key,
+                                                   subtitle_writer=own_writer)
+        if checkpoint is not None:
+            checkpoint.complete()
+        self._finish_metrics(result, metrics, owns_metrics)
+        return result
+    
+    def _open_checkpoint(self, audio, language, audio_hash=None):
+        """
+        긴 오디오의 변환 체크포인트를 엽니다 (같은 입력과 옵션으로 중단된 변환이 있으면 이어서 진행)
+        
+        Args:
+            audio (numpy.ndarray): 16kHz 모노 float32 오디오
+            language (str): 언어 코드, None이면 자동 감지
+            audio_hash (str): 이미 계산한 오디오 해시 (None이면 계산)
+        
+        Returns:
+            TranscriptCheckpoint: 체크포인트 (비활성화, 짧은 오디오, 청크 병렬 모드면 None)
+        """
+        if self.checkpoint_store is None or len(audio) < CHECKPOINT_MIN_AUDIO_SECONDS * SAMPLE_RATE:
+            return None
+        # 청크 병렬 모드는 워커가 청크를 동시에 디코딩하므로 재개 위치를 정할 수 없음
+        if self._get_parallel_transcriber() is not None:
+            return None
+        
+        key = TranscriptCache.make_key(f"checkpoint:{audio_hash or hash_audio(audio)}", self.model_size, language,
+                                       task="transcribe", backend=self._get_backend().name, vad=self.vad_filter)
+        checkpoint = TranscriptCheckpoint(self.checkpoint_store, key)
+        if checkpoint.resumed:
+            print(f"Resuming from checkpoint: {len(checkpoint.segments)} segments, "
+                  f"{format_seconds(checkpoint.resume_seconds)} already transcribed")
+        return checkpoint
+    
+    def process_local_videos(self, file_paths, language=None, save_transcript=False, batch_size=8):
+        """
+        여러 비디오 파일을 모아서 배치 디코딩합니다 (짧은 클립이 많을 때 호출별 오버헤드 감소)
+        
+        batch_size개 파일씩 오디오를 추출한 뒤 transcribe_audio_batch로 한 번에 변환합니다.
+        
+        Args:
+            file_paths (list): 비디오 파일 경로 목록
+            language (str): 언어 코드 (예: 'ko', 'en'), None이면 파일마다 자동 감지
+            save_transcript (bool): 텍스트 파일로 저장 여부
+            batch_size (int): 한 번에 디코딩할 파일 수와 30초 윈도우 수
+        
+        Returns:
+            list: 입력 순서대로 추출 결과 (transcript, detected_language, segments, metrics),
+                  실패한 파일은 None
+        """
+        batch_size = max(1, batch_size)
+        results = [None] * len(file_paths)
+        
+        for group_start in range(0, len(file_paths), batch_size):
+            indexes = []
+            audios = []
+            metrics_list = []
+            for index in range(group_start, min(group_start + batch_size, len(file_paths))):
+                file_path = file_paths[index]
+                metrics = self.start_metrics("local")
                 try:
-                    # stdout 리다이렉트하여 Whisper 출력 캡처
-                    with redirect_stdout(progress_capture):
-                        result = model.transcribe(temp_audio_path, **transcribe_options)
+                    self._probe_local_file(file_path, metrics)
+                    with metrics.stage(METRIC_EXTRACT):
+                        audios.append(load_audio_array(file_path))
                 except Exception as e:
-                    # 리다이렉트 실패 시 기본 방식으로 처리
-                    print(f"Progress capture failed, using default method: {e}")
-                    transcribe_options["verbose"] = False  # 에러 방지
-                    result = model.transcribe(temp_audio_path, **transcribe_options)
-                
-                # 진행률 업데이트
-                if progress_callback:
-                    detected_lang = result.get("language", "unknown")
-                    safe_local_callback(85, f"Transcription completed! Language: {detected_lang} / 텍스트 변환 완료! 언어: {detected_lang}", 
-                                      processing_details=f"Final result: {detected_lang}", 
-                                      tech_details="Transcription 100% complete")
-                
-                # 결과 반환
-                transcript_result = {
-                    'transcript': result["text"].strip(),
-                    'detected_language': result.get("language", "unknown"),
-                    'segments': result.get("segments", [])
-                }
+                    print(f"Error processing video {file_path}: {e}")
+                    self.finish_metrics(None, metrics, error=e)
+                    continue
+                indexes.append(index)
+                metrics_list.append(metrics)
+            
+            if not indexes:
+                continue
+            
+            try:
+                batch_results = self.transcribe_audio_batch(audios, [file_paths[index] for index in indexes], language,
+                                                            save_transcript, batch_size, metrics=metrics_list)
+            except Exception as e:
+                print(f"Error processing batch: {e}")
+                for metrics in metrics_list:
+                    self.finish_metrics(None, metrics, error=e)
+                continue
+            finally:
+                # 디코딩된 오디오 버퍼 해제
+                del audios
+            
+            for index, metrics, result in zip(indexes, metrics_list, batch_results):
+                self.finish_metrics(result, metrics)
+                results[index] = result
+        
+        return results
+    
+    def transcribe_audio_batch(self, audios, file_paths, language=None, save_transcript=False, batch_size=8,
+                               metrics=None):
+        """
+        이미 디코딩된 여러 오디오를 한 번의 배치 디코딩으로 변환합니다 (캐시 확인 포함)
+        
+        캐시에 없는 입력의 30초 윈도우를 모아 엔진의 transcribe_batch로 함께 디코딩하고,
+        결과는 입력별 세그먼트로 나눠 반환합니다. 청크 병렬 모드 설정과 관계없이 현재 프로세스의 모델을 사용합니다.
+        
+        Args:
+            audios (list): 16kHz 모노 float32 오디오 목록
+            file_paths (list): 원본 파일 경로 목록 (저장 파일 이름용)
+            language (str): 언어 코드 (예: 'ko', 'en'), None이면 입력마다 자동 감지
+            save_transcript (bool): 텍스트 파일로 저장 여부
+            batch_size (int): 한 번에 디코딩할 30초 윈도우 수
+            metrics (list): 입력별로 이어서 기록할 지표 객체 목록 (None이면 새로 만들어 결과의 metrics에 넣음)
+        
+        Returns:
+            list: 입력 순서대로 추출 결과 (transcript, detected_language, segments, metrics)
+        """
+        count = len(audios)
+        metrics_list = []
+        owners = []
+        for index in range(count):
+            run_metrics, owns_metrics = self._start_metrics(metrics[index] if metrics else None, "audio")
+            run_metrics.set('audio_seconds', len(audios[index]) / SAMPLE_RATE)
+            metrics_list.append(run_metrics)
+            owners.append(owns_metrics)
+        
+        results = [None] * count
+        pending = []
+        try:
+            for index, audio in enumerate(audios):
+                # 캐시 확인 (디코딩된 오디오 해시 + 모델 + 언어)
+                cache_key = None
+                if self.transcript_cache is not None:
+                    cache_key = self._get_cache_key(f"audio:{hash_audio(audio)}", language)
+                    cached_result = self.transcript_cache.get(cache_key)
+                    if cached_result:
+                        results[index] = self._build_transcript_result(cached_result, file_paths[index], save_transcript)
+                        metrics_list[index].set('cache_hit', True)
+                        continue
                 
-                # 파일 저장 옵션
-                if save_transcript and transcript_result['transcript']:
-                    self._save_transcript_file(file_path, transcript_result['transcript'])
+                timeline = None
+                if self.vad_filter:
+                    audio, timeline = gate_speech(audio)
+                    # 음성이 전혀 없으면 디코딩하지 않음 (무음에서의 환각 방지)
+                    if timeline is not None and audio.size == 0:
+                        empty_result = {'text': "", 'language': language or "unknown", 'segments': []}
+                        results[index] = self._build_transcript_result(empty_result, file_paths[index], save_transcript,
+                                                                       cache_key=cache_key)
+                        metrics_list[index].set('cache_hit', False)
+                        continue
+                pending.append((index, audio, timeline, cache_key))
+            
+            if pending:
+                load_start = time.perf_counter()
+                backend = self._load_model()
+                load_seconds = time.perf_counter() - load_start
                 
-                return transcript_result
+                decode_seconds_total = sum(len(audio) for _, audio, _, _ in pending) / SAMPLE_RATE
+                print(f"Batch decode: {len(pending)} input(s), {decode_seconds_total:.1f}s of audio, batch size {batch_size}")
+                decode_start = time.perf_counter()
+                batch_results = backend.transcribe_batch([audio for _, audio, _, _ in pending], language=language,
+                                                         batch_size=batch_size)
+                decode_seconds = time.perf_counter() - decode_start
                 
-            finally:
-                # 임시 오디오 파일 정리
-                try:
-                    os.unlink(temp_audio_path)
-                except:
-                    pass
+                for (index, audio, timeline, cache_key), result in zip(pending, batch_results):
+                    run_metrics = metrics_list[index]
+                    # 공유한 모델 로드/디코딩 시간은 디코딩한 오디오 길이 비율로 나눠 기록
+                    share = (len(audio) / SAMPLE_RATE) / decode_seconds_total if decode_seconds_total > 0 else 1.0 / len(pending)
+                    run_metrics.add_stage(METRIC_LOAD_MODEL, load_seconds * share)
+                    run_metrics.add_stage(METRIC_DECODE, decode_seconds * share)
+                    run_metrics.set('device', backend.device)
+                    run_metrics.set('decode_batch', len(pending))
+                    run_metrics.set('cache_hit', False)
                     
+                    if timeline is not None:
+                        result = dict(result)
+                        result['segments'] = [timeline.remap_segment(segment) for segment in result['segments']]
+                    run_metrics.set('segments', len(result['segments']))
+                    
+                    with run_metrics.stage(METRIC_POSTPROCESS):
+                        results[index] = self._build_transcript_result(result, file_paths[index], save_transcript,
+                                                                       cache_key=cache_key)
         except Exception as e:
-            print(f"Error processing video: {e}")
-            raise e
+            for run_metrics, owns_metrics in zip(metrics_list, owners):
+                self._finish_metrics(None, run_metrics, owns_metrics, error=e)
+            raise
+        
+        for result, run_metrics, owns_metrics in zip(results, metrics_list, owners):
+            self._finish_metrics(result, run_metrics, owns_metrics)
+        return results
+    
+    def iter_segments(self, file_path, language=None):
+        """
+        비디오 파일을 변환하면서 세그먼트를 디코딩되는 즉시 하나씩 반환합니다
+        
+        Args:
+            file_path (str): 비디오 파일 경로
+            language (str): 언어 코드 (예: 'ko', 'en'), None이면 자동 감지
+            
+        Yields:
+            dict: 세그먼트 (id, start, end, text 등 Whisper 세그먼트 필드)
+        """
+        audio = load_audio_array(file_path)
+        
+        # 캐시 확인 (같은 오디오면 저장된 세그먼트를 바로 반환)
+        cache_key = None
+        if self.transcript_cache is not None:
+            cache_key = self._get_cache_key(f"audio:{hash_audio(audio)}", language)
+            cached_result = self.transcript_cache.get(cache_key)
+            if cached_result:
+                yield from cached_result.get('segments', [])
+                return
+        
+        detected_language, segments_iter = self._iter_audio_segments(audio, language)
+        segments = []
+        for segment in segments_iter:
+            segments.append(segment)
+            yield segment
+        
+        # 끝까지 변환된 경우에만 캐시에 저장
+        result = {
+            'text': "".join(segment['text'] for segment in segments),
+            'language': detected_language,
+            'segments': segments
+        }
+        self._build_transcript_result(result, file_path, cache_key=cache_key)
+    
+    def _iter_audio_segments(self, audio, language=None, checkpoint=None):
+        """
+        디코딩된 오디오를 세그먼트 스트림으로 변환합니다 (청크 병렬 모드면 워커 풀 사용)
+        
+        무음 제거가 켜져 있으면 음성 구간만 이어붙여 디코딩하고, 세그먼트 시간은 원본 기준으로 보정합니다.
+        체크포인트가 있으면 저장된 세그먼트를 먼저 내보내고 저장된 위치부터 이어서 디코딩합니다.
+        
+        Returns:
+            tuple: (언어 코드, 세그먼트 dict 제너레이터)
+        """
+        timeline = None
+        total_seconds = len(audio) / SAMPLE_RATE
+        if self.vad_filter:
+            audio, timeline = gate_speech(audio)
+        
+        if timeline is not None:
+            print(f"VAD: decoding {timeline.speech_seconds:.1f}s of {total_seconds:.1f}s "
+                  f"({len(timeline.regions)} speech regions)")
+            # 음성이 전혀 없으면 디코딩하지 않음 (무음에서의 환각 방지)
+            if audio.size == 0:
+                return language or "unknown", iter(())
+        
+        parallel_transcriber = self._get_parallel_transcriber()
+        if parallel_transcriber:
+            detected_language, segments_iter = parallel_transcriber.iter_transcribe(audio, language=language)
+        elif checkpoint is not None:
+            return self._iter_checkpointed_segments(audio, language, timeline, checkpoint)
+        else:
+            detected_language, segments_iter = self._load_model().iter_transcribe(audio, language=language)
+        
+        if timeline is None:
+            return detected_language, segments_iter
+        return detected_language, (timeline.remap_segment(segment) for segment in segments_iter)
+    
+    def _iter_checkpointed_segments(self, audio, language, timeline, checkpoint):
+        """
+        체크포인트의 세그먼트를 먼저 내보내고 재개 위치부터 이어서 디코딩합니다
+        
+        청크 경계마다 재개 위치를 저장해야 하므로 openai-whisper도 약 30초 청크 단위로 디코딩합니다.
+        
+        Args:
+            audio (numpy.ndarray): 디코딩할 오디오 (무음 제거 후)
+            language (str): 언어 코드, None이면 자동 감지 (재개하면 저장된 언어 사용)
+            timeline (SpeechTimeline): 무음 제거 시간 보정 정보 (없으면 None)
+            checkpoint (TranscriptCheckpoint): 체크포인트
+        
+        Returns:
+            tuple: (언어 코드, 세그먼트 dict 제너레이터)
+        """
+        if checkpoint.resumed and checkpoint.language:
+            language = checkpoint.language
+        
+        detected_language, segments_iter = self._load_model().iter_transcribe(
+            audio,
+            language=language,
+            start_sample=checkpoint.resume_sample,
+            initial_prompt=checkpoint.prompt,
+            chunk_callback=checkpoint.mark,
+            chunked=True
+        )
+        checkpoint.language = detected_language
+        
+        def generate():
+            yield from list(checkpoint.segments)
+            for segment in segments_iter:
+                # 엔진의 세그먼트는 그대로 두고 복사본을 원본 시간으로 보정 (재개 위치는 무음 제거 후 기준)
+                segment = dict(segment)
+                if timeline is not None:
+                    segment = timeline.remap_segment(segment)
+                segment["id"] = len(checkpoint.segments)
+                checkpoint.record(segment)
+                yield segment
+        
+        return detected_language, generate()
+    
+    def _transcribe_streaming(self, audio, language=None, segment_callback=None, progress_callback=None,
+                              checkpoint=None, subtitle_writer=None):
+        """
+        세그먼트 스트림을 소비하면서 콜백과 진행률을 갱신하고 전체 결과를 만듭니다
+        
+        Args:
+            audio (numpy.ndarray): 16kHz 모노 float32 오디오
+            language (str): 언어 코드, None이면 자동 감지
+            segment_callback (function): 세그먼트 콜백
+            progress_callback (function): 진행률 콜백 함수 또는 ProgressReporter
+            checkpoint (TranscriptCheckpoint): 진행 상태를 저장/재개할 체크포인트 (None이면 사용 안함)
+            subtitle_writer (SubtitleWriter): 세그먼트를 이어 쓸 자막 기록기 (None이면 사용 안함)
+            
+        Returns:
+            dict: model.transcribe 형식의 결과 (text, language, segments)
+        """
+        progress = ProgressReporter.wrap(progress_callback)
+        duration = len(audio) / SAMPLE_RATE
+        # 체크포인트에서 불러온 구간은 속도/남은 시간 계산에서 제외
+        resumed_seconds = checkpoint.resume_seconds if checkpoint is not None else 0.0
+        detected_language, segments_iter = self._iter_audio_segments(audio, language, checkpoint)
+        
+        if progress:
+            progress.emit(STAGE_TRANSCRIBE, 65, f"Language: {detected_language} / 언어: {detected_language}",
+                          fraction=0.0, audio_seconds=0.0, audio_total=duration,
+                          processing_details=f"Language: {detected_language}")
+        
+        decode_start = time.time()
+        segments = []
+        for segment in segments_iter:
+            segments.append(segment)
+            # 자막 기록 오류는 변환을 멈추고 호출한 쪽에서 쓰다 만 파일을 정리
+            if subtitle_writer is not None:
+                subtitle_writer.write_segment(segment)
+            self._emit_segments([segment], segment_callback)
+            
+            if progress and duration > 0:
+                # 디코딩된 오디오 위치 기준 진행률 (65%~85%)
+                audio_seconds = min(duration, segment['end'])
+                fraction = audio_seconds / duration
+                elapsed = time.time() - decode_start
+                speed = max(0.0, audio_seconds - resumed_seconds) / elapsed if elapsed > 0 else 0.0
+                eta = (duration - audio_seconds) / speed if speed > 0 else None
+                progress.emit(STAGE_TRANSCRIBE, 65 + fraction * 20,
+                              f"AI processing: {fraction * 100:.1f}% / AI 처리중: {fraction * 100:.1f}%",
+                              fraction=fraction, eta=eta, audio_seconds=audio_seconds, audio_total=duration,
+                              processing_details=f"Decoded {audio_seconds:.0f}s / {duration:.0f}s, ETA {format_seconds(eta)}",
+                              tech_details=f"Speed: {speed:.1f}x realtime, Segments: {len(segments)}, Language: {detected_language}")
+        
+        return {
+            'text': "".join(segment['text'] for segment in segments),
+            'language': detected_language,
+            'segments': segments
+        }
+    
+    def _emit_segments(self, segments, segment_callback):
+        """세그먼트 콜백을 안전하게 호출합니다 (UI 오류가 변환을 멈추지 않도록)"""
+        if not segment_callback:
+            return
+        for segment in segments:
+            try:
+                segment_callback(segment)
+            except Exception as e:
+                print(f"Segment callback error: {e}")
+    
+    def _build_transcript_result(self, result, file_path, save_transcript=False, progress_callback=None, cache_key=None,
+                                 subtitle_writer=None):
+        """
+        Whisper 결과를 반환 형식으로 정리합니다
+        
+        Args:
+            result (dict): model.transcribe 형식의 결과 (text, language, segments)
+                           또는 캐시된 추출 결과 (transcript, detected_language, segments)
+            file_path (str): 원본 비디오 파일 경로
+            save_transcript (bool): 텍스트 파일로 저장 여부
+            progress_callback (function): 진행률 콜백 함수 또는 ProgressReporter
+            cache_key (str): 결과를 저장할 캐시 키 (None이면 저장 안함)
+            subtitle_writer (SubtitleWriter): 디코딩 중에 이어 쓴 자막 (None이면 세그먼트로 새로 씀)
+            
+        Returns:
+            dict: 추출 결과 (transcript, detected_language, segments)
+        """
+        # 캐시된 결과는 이미 반환 형식이므로 Whisper 형식으로 맞춤
+        if 'transcript' in result:
+            result = {
+                'text': result['transcript'],
+                'language': result.get('detected_language', 'unknown'),
+                'segments': result.get('segments', [])
+            }
+        
+        # 진행률 업데이트
+        progress = ProgressReporter.wrap(progress_callback)
+        if progress:
+            detected_lang = result.get("language", "unknown")
+            progress.emit(STAGE_FINALIZE, 85, f"Transcription completed! Language: {detected_lang} / 텍스트 변환 완료! 언어: {detected_lang}", 
+                          fraction=1.0, processing_details=f"Final result: {detected_lang}",
+                          tech_details="Transcription 100% complete")
+        
+        # 결과 반환
+        transcript_result = {
+            'transcript': result["text"].strip(),
+            'detected_language': result.get("language", "unknown"),
+            'segments': result.get("segments", [])
+        }
+        
+        if cache_key:
+            self.transcript_cache.put(cache_key, transcript_result)
+        
+        # 파일 저장 옵션
+        if save_transcript and transcript_result['transcript']:
+            self._save_transcript_file(file_path, transcript_result['transcript'])
+        if save_transcript:
+            self._save_subtitle_files(file_path, transcript_result, subtitle_writer)
+        
+        return transcript_result
+    
+    def _open_subtitle_writer(self, video_path):
+        """
+        자막 파일을 열어 둡니다 (자막 형식을 지정하지 않았거나 열 수 없으면 None)
+        
+        Args:
+            video_path (str): 원본 비디오 파일 경로 (파일 이름용)
+        
+        Returns:
+            SubtitleWriter: 세그먼트를 이어 쓸 자막 기록기
+        """
+        if not self.subtitle_formats:
+            return None
+        video_name = os.path.splitext(os.path.basename(video_path))[0]
+        try:
+            return SubtitleWriter(self.output_dir or ".", video_name, self.subtitle_formats)
+        except Exception as e:
+            print(f"Error opening subtitle files: {e}")
+            return None
+    
+    def _save_subtitle_files(self, video_path, result, subtitle_writer=None):
+        """
+        자막 파일 저장을 마무리합니다 (디코딩 중에 이어 쓰지 않았으면 세그먼트로 새로 씀)
+        
+        Args:
+            video_path (str): 원본 비디오 파일 경로 (파일 이름용)
+            result (dict): 추출 결과 (detected_language, segments)
+            subtitle_writer (SubtitleWriter): 디코딩 중에 이어 쓴 자막 기록기
+        
+        Returns:
+            dict: 형식별 저장 경로 (저장하지 않았으면 None)
+        """
+        if subtitle_writer is None:
+            subtitle_writer = self._open_subtitle_writer(video_path)
+            if subtitle_writer is None:
+                return None
+            segments = result.get('segments', [])
+        else:
+            segments = []
+        
+        try:
+            for segment in segments:
+                subtitle_writer.write_segment(segment)
+            paths = subtitle_writer.close(result.get('detected_language'))
+            print(f"Subtitles saved to: {', '.join(paths.values())}")
+            return paths
+        except Exception as e:
+            print(f"Error saving subtitles: {e}")
+            subtitle_writer.abort()
+            return None
     
     def _save_transcript_file(self, video_path, transcript):
         """텍스트를 파일로 저장합니다"""
         try:
             video_name = os.path.splitext(os.path.basename(video_path))[0]
             transcript_path = f"{video_name}_transcript.txt"
+            if self.output_dir:
+                os.makedirs(self.output_dir, exist_ok=True)
+                transcript_path = os.path.join(self.output_dir, transcript_path)
             
             with open(transcript_path, 'w', encoding='utf-8') as f:
                 f.write(transcript)
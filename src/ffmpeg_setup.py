@@ -5,36 +5,41 @@ FFmpeg Path Configuration Module
 
 import os
 import sys
+import shutil
 from pathlib import Path
 
 
-def setup_ffmpeg_path():
-    """FFmpeg 경로를 설정합니다 / Setup FFmpeg path"""
-    
+def _get_base_path():
+    """bin 폴더를 찾을 기준 경로를 반환합니다 / Return base path for the bin folder"""
     # 현재 스크립트 위치 기준으로 bin 폴더 경로 찾기
     if hasattr(sys, '_MEIPASS'):
         # PyInstaller 번들된 실행파일인 경우
-        base_path = Path(sys._MEIPASS)
-    else:
-        # 개발 모드인 경우
-        base_path = Path(__file__).parent.parent
+        return Path(sys._MEIPASS)
+    # 개발 모드인 경우
+    return Path(__file__).parent.parent
+
+
+def setup_ffmpeg_path():
+    """FFmpeg 경로를 설정합니다 / Setup FFmpeg path"""
     
+    base_path = _get_base_path()
     ffmpeg_path = base_path / "bin" / "ffmpeg.exe"
     
     if ffmpeg_path.exists():
-        # MoviePy 설정에 FFmpeg 경로 추가
-        try:
-            import moviepy.config as config
-            config.FFMPEG_BINARY = str(ffmpeg_path)
-            
-            # 환경변수에도 추가 (추가 보장)
-            bin_dir = str(base_path / "bin")
-            current_path = os.environ.get('PATH', '')
-            if bin_dir not in current_path:
-                os.environ['PATH'] = f"{bin_dir};{current_path}"
-                
-        except ImportError:
-            pass  # moviepy가 아직 import되지 않은 경우
+        # 환경변수에 추가 (FFmpeg 파이프/ffprobe 호출용)
+        bin_dir = str(base_path / "bin")
+        current_path = os.environ.get('PATH', '')
+        if bin_dir not in current_path:
+            os.environ['PATH'] = f"{bin_dir};{current_path}"
+        
+        # MoviePy/imageio는 import 시 이 환경변수를 읽으므로 여기서 import하지 않음 (시작 시간 단축)
+        os.environ.setdefault('FFMPEG_BINARY', str(ffmpeg_path))
+        os.environ.setdefault('IMAGEIO_FFMPEG_EXE', str(ffmpeg_path))
+        
+        # 이미 import된 경우에만 MoviePy 설정 갱신
+        moviepy_config = sys.modules.get('moviepy.config')
+        if moviepy_config is not None:
+            moviepy_config.FFMPEG_BINARY = str(ffmpeg_path)
     
     return ffmpeg_path.exists()
 
@@ -46,4 +51,51 @@ def get_resource_path(relative_path):
         base_path = sys._MEIPASS
     except AttributeError:
         base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path) 
\ No newline at end of file
+    return os.path.join(base_path, relative_path)
+
+
+def get_ffmpeg_binary():
+    """
+    사용할 FFmpeg 실행파일 경로를 반환합니다 / Return the FFmpeg executable to use
+    
+    우선순위: 번들된 bin/ffmpeg.exe → 시스템 PATH → imageio-ffmpeg (MoviePy 의존성)
+    """
+    bundled_path = _get_base_path() / "bin" / "ffmpeg.exe"
+    if bundled_path.exists():
+        return str(bundled_path)
+    
+    system_path = shutil.which("ffmpeg")
+    if system_path:
+        return system_path
+    
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        pass
+    
+    return "ffmpeg"
+
+
+def get_ffprobe_binary():
+    """
+    사용할 FFprobe 실행파일 경로를 반환합니다 / Return the FFprobe executable to use
+    
+    우선순위: 번들된 bin/ffprobe.exe → 시스템 PATH → FFmpeg와 같은 폴더 (없으면 None)
+    """
+    bundled_path = _get_base_path() / "bin" / "ffprobe.exe"
+    if bundled_path.exists():
+        return str(bundled_path)
+    
+    system_path = shutil.which("ffprobe")
+    if system_path:
+        return system_path
+    
+    # imageio-ffmpeg는 ffprobe를 포함하지 않으므로 FFmpeg 옆에 있을 때만 사용
+    ffmpeg_dir = os.path.dirname(get_ffmpeg_binary())
+    for name in ("ffprobe", "ffprobe.exe"):
+        candidate = os.path.join(ffmpeg_dir, name)
+        if ffmpeg_dir and os.path.isfile(candidate):
+            return candidate
+    
+    return None
@@ -8,8 +8,11 @@ from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
 import os
 
-from .converter import VideoToTextConverter
+from .backends import BACKEND_OPTIONS, BACKEND_WHISPER
 from .ffmpeg_setup import get_resource_path
+from .media_probe import probe_media
+from .startup import prefetch_heavy_imports
+from .subtitle_writer import render_subtitles
 
 
 class VideoToTextGUI:
@@ -25,8 +28,65 @@ class VideoToTextGUI:
         
         # Initialize converter (will be loaded when needed)
         self.converter = None
+        # 마지막 변환 결과 (자막 저장용 세그먼트)
+        self.last_result = None
+        
+        self._prefetch_after_id = None
+        self._converter_lock = threading.Lock()
         
         self.create_widgets()
+        
+        # 창이 그려진 뒤 torch/whisper/yt_dlp를 백그라운드에서 미리 로드 (첫 변환 대기 시간 단축)
+        self.root.after(200, prefetch_heavy_imports)
+        
+        # 모델/GPU/엔진 선택이 바뀌면 그 모델을 미리 로드 (기본 선택도 시작 시 로드)
+        for variable in (self.model_var, self.use_gpu_var, self.backend_var):
+            variable.trace_add("write", lambda *args: self.schedule_model_prefetch())
+        self.schedule_model_prefetch()
+    
+    def _create_converter(self, **kwargs):
+        """변환기를 생성합니다 (변환기 모듈은 처음 필요할 때 import)"""
+        from .converter import VideoToTextConverter
+        return VideoToTextConverter(**kwargs)
+    
+    def get_selected_model_options(self):
+        """선택된 (모델 크기, GPU 사용, 엔진) 반환"""
+        model_display = self.model_var.get()
+        model_name = model_display.split(" (")[0] if " (" in model_display else model_display
+        return model_name, self.use_gpu_var.get(), self.get_selected_backend()
+    
+    def _get_converter(self, model_name, use_gpu, backend):
+        """선택과 같은 설정의 변환기를 반환합니다 (설정이 바뀌었으면 새로 생성)"""
+        with self._converter_lock:
+            if (self.converter is None
+                    or self.converter.model_size != model_name
+                    or self.converter.use_gpu != use_gpu
+                    or self.converter.backend != backend):
+                # 이전 변환기는 닫지 않음 (진행 중인 변환이 쓰고 있을 수 있음)
+                self.converter = self._create_converter(model_size=model_name, use_gpu=use_gpu, backend=backend)
+            return self.converter
+    
+    def schedule_model_prefetch(self):
+        """선택 변경이 잠잠해진 뒤 모델 미리 로드를 시작합니다 (콤보박스 연속 변경 시 한 번만)"""
+        if self._prefetch_after_id is not None:
+            self.root.after_cancel(self._prefetch_after_id)
+        self._prefetch_after_id = self.root.after(500, self._start_model_prefetch)
+    
+    def _start_model_prefetch(self):
+        self._prefetch_after_id = None
+        converter = self._get_converter(*self.get_selected_model_options())
+        if converter.model is not None and converter.model.model is not None:
+            return
+        
+        def load():
+            try:
+                converter.load_model()
+                print(f"Model prefetched: {converter.model_size} ({converter.backend})")
+            except Exception as e:
+                # 실패해도 변환 시작 시 다시 로드하면서 오류를 표시함
+                print(f"Model prefetch failed: {e}")
+        
+        threading.Thread(target=load, name="videoscribe-model-prefetch", daemon=True).start()
     
     def _load_icon(self):
         """아이콘 로드"""
@@ -168,6 +228,23 @@ class VideoToTextGUI:
         gpu_checkbox = ttk.Checkbutton(options_frame, text="Use GPU / GPU 사용", 
                                       variable=self.use_gpu_var)
         gpu_checkbox.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+        
+        # Transcription engine
+        ttk.Label(options_frame, text="Engine:").grid(row=1, column=2, sticky=tk.W, pady=(10, 0))
+        self.backend_var = tk.StringVar()
+        backend_combo = ttk.Combobox(options_frame, textvariable=self.backend_var,
+                                    values=list(BACKEND_OPTIONS.values()),
+                                    state="readonly", width=35)
+        backend_combo.grid(row=1, column=3, sticky=tk.W, padx=(10, 0), pady=(10, 0))
+        backend_combo.set(BACKEND_OPTIONS[BACKEND_WHISPER])
+    
+    def get_selected_backend(self):
+        """선택된 엔진 이름 반환"""
+        selected = self.backend_var.get()
+        for backend_name, display in BACKEND_OPTIONS.items():
+            if display == selected:
+                return backend_name
+        return BACKEND_WHISPER
     
     def _create_progress_section(self, parent):
         """진행률 섹션 생성"""
@@ -278,7 +355,7 @@ class VideoToTextGUI:
         
         # Initialize converter if needed
         if not self.converter:
-            self.converter = VideoToTextConverter()
+            self.converter = self._create_converter()
         
         if self.converter.is_youtube_url(url):
             try:
@@ -348,6 +425,7 @@ class VideoToTextGUI:
         self.process_btn.config(state="disabled")
         self.save_btn.config(state="disabled")
         self.result_text.delete(1.0, tk.END)
+        self.last_result = None
         
         # Start processing in a separate thread
         if self.input_type.get() == "file":
@@ -403,7 +481,12 @@ class VideoToTextGUI:
             # Step 1: Initialize (0-10%)
             if input_type == "file":
                 self.root.after(0, lambda: self.update_progress(5, "Reading video info... 영상 정보 읽는중..."))
-                video_info = self.converter.get_video_info(input_path) if self.converter else None
+                # 모델 로드 전에도 바로 읽을 수 있도록 변환기 없이 조회 (ffprobe 한 번, 결과 캐시)
+                try:
+                    video_info = probe_media(input_path)
+                except Exception as e:
+                    print(f"Error getting video info: {e}")
+                    video_info = None
                 
                 if video_info and video_info.get('duration'):
                     duration = int(video_info['duration'])
@@ -417,22 +500,19 @@ class VideoToTextGUI:
             
             self.root.after(0, lambda: self.update_progress(10, "Initialization completed... 초기화 완료"))
             
-            # Step 2: Initialize converter if not already done (10-25%)
-            if self.converter is None:
-                self.root.after(0, lambda: self.update_progress(15, "Loading AI model... AI 모델 로딩중..."))
-                # Extract model name from the display text
-                model_display = self.model_var.get()
-                model_name = model_display.split(" (")[0] if " (" in model_display else model_display
-                use_gpu = self.use_gpu_var.get()
-                
-                # Safe model loading for PyInstaller builds
-                try:
-                    self.converter = VideoToTextConverter(model_size=model_name, use_gpu=use_gpu)
-                    self.root.after(0, lambda: self.update_progress(25, "AI model loaded AI 모델 로딩 완료"))
-                except Exception as e:
-                    error_msg = f"Failed to load AI model: {str(e)}\nAI 모델 로딩 실패: {str(e)}"
-                    self.root.after(0, lambda: self.show_error(error_msg))
-                    return
+            # Step 2: Initialize converter if not already done or options changed (10-25%)
+            # 선택 변경 시 미리 로드를 시작했으면 같은 변환기를 받아 진행 중인 로드에 합류
+            self.root.after(0, lambda: self.update_progress(15, "Loading AI model... AI 모델 로딩중..."))
+            
+            # Safe model loading for PyInstaller builds
+            try:
+                self.converter = self._get_converter(*self.get_selected_model_options())
+                self.converter.load_model()
+                self.root.after(0, lambda: self.update_progress(25, "AI model loaded AI 모델 로딩 완료"))
+            except Exception as e:
+                error_msg = f"Failed to load AI model: {str(e)}\nAI 모델 로딩 실패: {str(e)}"
+                self.root.after(0, lambda: self.show_error(error_msg))
+                return
             
             # Get language setting
             language = self.language_var.get() if self.language_var.get() != "auto" else None
@@ -441,20 +521,27 @@ class VideoToTextGUI:
             def progress_callback(value, message):
                 self.root.after(0, lambda: self.update_progress(value, message))
             
+            # Show each segment as soon as it is decoded
+            def segment_callback(segment):
+                text = segment.get('text', '')
+                self.root.after(0, lambda: self.append_result_text(text))
+            
             # Process based on input type
             if input_type == "file":
                 result = self.converter.process_local_video_with_info(
                     input_path, 
                     language=language, 
                     save_transcript=False, 
-                    progress_callback=progress_callback
+                    progress_callback=progress_callback,
+                    segment_callback=segment_callback
                 )
             else:
                 result = self.converter.process_youtube_video(
                     input_path,
                     language=language,
                     save_transcript=False,
-                    progress_callback=progress_callback
+                    progress_callback=progress_callback,
+                    segment_callback=segment_callback
                 )
                 
                 # Display YouTube video information
@@ -481,16 +568,23 @@ class VideoToTextGUI:
                 self.root.after(0, lambda: self.language_detected_var.set(detected_language.upper()))
                 self.root.after(0, lambda: self.word_count_var.set(f"{word_count:,}"))
                 
+                self.last_result = result
+                
                 # Complete progress
                 self.root.after(0, lambda: self.update_progress(100, "Completed! 완료!"))
                 self.root.after(0, lambda: self.show_results(transcript))
             else:
                 self.root.after(0, lambda: self.show_error("Failed to extract text from video.\n영상에서 텍스트 추출에 실패했습니다."))
-                
+        
         except Exception as e:
             error_msg = f"Error: {str(e)}\n오류: {str(e)}"
             self.root.after(0, lambda: self.show_error(error_msg))
     
+    def append_result_text(self, text):
+        """디코딩된 세그먼트 텍스트를 결과 창에 이어 붙임"""
+        self.result_text.insert(tk.END, text)
+        self.result_text.see(tk.END)
+    
     def show_results(self, transcript):
         """결과 표시"""
         self.progress['value'] = 100
@@ -515,7 +609,7 @@ class VideoToTextGUI:
         messagebox.showerror("Error / 오류", error_msg)
     
     def save_transcript(self):
-        """텍스트 저장"""
+        """텍스트 저장 (확장자가 .srt/.vtt/.tsv/.json이면 세그먼트 타임스탬프로 자막 저장)"""
         transcript = self.result_text.get(1.0, tk.END).strip()
         if not transcript:
             return
@@ -523,11 +617,17 @@ class VideoToTextGUI:
         filename = filedialog.asksaveasfilename(
             title="Save Transcript / 텍스트 저장",
             defaultextension=".txt",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+            filetypes=[("Text files", "*.txt"), ("SubRip subtitles", "*.srt"), ("WebVTT subtitles", "*.vtt"),
+                       ("Tab-separated values", "*.tsv"), ("JSON", "*.json"), ("All files", "*.*")]
         )
         
         if filename:
             try:
+                format_name = os.path.splitext(filename)[1].lower().lstrip(".")
+                segments = (self.last_result or {}).get('segments')
+                if format_name in ("srt", "vtt", "tsv", "json") and segments:
+                    # 자막은 편집 전 세그먼트 기준
+                    transcript = render_subtitles(segments, format_name, self.last_result.get('detected_language'))
                 with open(filename, 'w', encoding='utf-8') as f:
                     f.write(transcript)
                 messagebox.showinfo("Success / 성공", f"Transcript saved to: {filename}\n텍스트가 저장되었습니다: {filename}")
@@ -0,0 +1,473 @@
+"""
+HTTP 변환 서비스 모듈
+HTTP Transcription Service Module
+
+API:
+    POST /jobs                      JSON {"url": ..., "model": ..., "language": ..., "backend": ...}
+    POST /jobs?filename=a.mp4&...   요청 본문이 업로드 파일 (application/octet-stream)
+    GET  /jobs/<id>                 작업 상태
+    GET  /jobs/<id>/segments?since=N        N번째 이후 세그먼트 (JSON)
+    GET  /jobs/<id>/segments?stream=1       완료될 때까지 세그먼트를 NDJSON으로 스트리밍
+    GET  /jobs/<id>/result          완료된 결과 (진행 중이면 202)
+    GET  /jobs/<id>/result?format=srt       완료된 결과를 자막으로 (txt, srt, vtt, tsv, json)
+    GET  /health                    서버/모델 풀 상태
+    GET  /metrics                   단계별 실행 시간 (Prometheus 텍스트 형식)
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import shutil
+import tempfile
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from .audio_utils import load_audio_array
+from .backends import BACKEND_OPTIONS, BACKEND_WHISPER
+from .converter import VideoToTextConverter
+from .model_pool import ModelPool, MODEL_MEMORY_MB
+from .subtitle_writer import SUBTITLE_MIME_TYPES, parse_formats, render_subtitles
+from .job_executor import JobExecutor, JOB_DONE, JOB_FAILED, hash_input
+from .metrics import PrometheusSink, MultiSink, sink_from_env, METRIC_PROBE, METRIC_DOWNLOAD, METRIC_EXTRACT
+
+# 업로드 읽기 단위 (1MB)
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# 스트리밍 응답에서 새 세그먼트를 확인하는 간격 (초)
+_STREAM_POLL_SECONDS = 0.25
+
+# HTTP API 세션 이름 (작업 실행기 키)
+_HTTP_SESSION = "http"
+
+
+class TranscriptionService:
+    """
+    HTTP 요청과 분리된 변환 작업 서비스
+    
+    모든 요청이 하나의 모델 풀과 작업 실행기를 공유하고, 동시에 디코딩하는 작업 수와
+    대기 작업 수를 제한합니다 (제한을 넘으면 요청을 거절하여 과부하 방지).
+    """
+    
+    def __init__(self, model_size="base", use_gpu=True, backend=BACKEND_WHISPER, max_concurrent_decodes=1,
+                 max_pending_jobs=8, max_upload_mb=2048, upload_dir=None, model_pool=None):
+        """
+        초기화
+        
+        Args:
+            model_size (str): 기본 모델 크기 (요청에서 바꿀 수 있음)
+            use_gpu (bool): GPU 사용 여부
+            backend (str): 기본 음성 인식 엔진
+            max_concurrent_decodes (int): 동시에 실행할 작업 수
+            max_pending_jobs (int): 대기+실행 중 작업 최대 수 (넘으면 429 응답)
+            max_upload_mb (int): 업로드 최대 크기 (MB, 넘으면 413 응답)
+            upload_dir (str): 업로드 임시 저장 디렉토리 (None이면 시스템 임시 디렉토리)
+            model_pool (ModelPool): 공유 모델 풀 (None이면 새로 생성)
+        """
+        self.model_size = model_size
+        self.use_gpu = use_gpu
+        self.backend = backend
+        self.max_pending_jobs = max_pending_jobs
+        self.max_upload_bytes = max_upload_mb * 1024 * 1024
+        self.upload_dir = upload_dir or tempfile.gettempdir()
+        
+        # /metrics 엔드포인트용 누적 지표 (+ VIDEOSCRIBE_METRICS_FILE 설정 시 JSON lines 파일)
+        self.prometheus = PrometheusSink()
+        env_sink = sink_from_env()
+        self.metrics_sink = MultiSink([self.prometheus, env_sink]) if env_sink else self.prometheus
+        self.model_pool = model_pool or ModelPool(
+            lambda size, gpu, engine: VideoToTextConverter(model_size=size, use_gpu=gpu, backend=engine,
+                                                           metrics_sink=self.metrics_sink)
+        )
+        self.executor = JobExecutor(max_workers=max_concurrent_decodes)
+        self.started_at = time.time()
+        self._submit_lock = threading.Lock()
+    
+    def options_from(self, params):
+        """요청 파라미터에서 변환 옵션을 만듭니다"""
+        backend = params.get('backend') or self.backend
+        if backend not in BACKEND_OPTIONS:
+            raise ValueError(f"Unknown backend: {backend}")
+        # 모델 이름만 허용 (whisper.load_model은 파일 경로도 받아 torch.load로 읽음)
+        model_size = params.get('model') or self.model_size
+        if model_size not in MODEL_MEMORY_MB:
+            raise ValueError(f"Unknown model: {model_size}")
+        language = params.get('language') or None
+        return {
+            'model_size': model_size,
+            'language': None if language == "auto" else language,
+            'backend': backend,
+            'use_gpu': self.use_gpu
+        }
+    
+    def is_saturated(self):
+        """대기 작업이 가득 찼는지 확인합니다"""
+        return self.executor.active_count() >= self.max_pending_jobs
+    
+    def submit(self, source, is_url, options, label=""):
+        """
+        변환 작업을 제출합니다
+        
+        Args:
+            source (str): 업로드된 파일 경로 또는 YouTube URL
+            is_url (bool): YouTube URL 여부
+            options (dict): 변환 옵션
+            label (str): 표시용 이름
+        
+        Returns:
+            Job: 제출된 작업 (대기 작업이 가득 차면 None)
+        """
+        with self._submit_lock:
+            if self.is_saturated():
+                return None
+            # 같은 URL + 옵션의 진행 중/완료 작업은 재사용, 업로드는 항상 새 작업
+            if is_url:
+                input_key = hash_input(source, options['model_size'], options['language'], options['backend'])
+            else:
+                input_key = uuid.uuid4().hex
+            return self.executor.submit(_HTTP_SESSION, input_key, self._run_job, source, is_url, options,
+                                        label=label or source)
+    
+    def _run_job(self, job, source, is_url, options):
+        """작업 실행 (작업 실행기 스레드)"""
+        model_key = (options['model_size'], options['use_gpu'], options['backend'])
+        # 작업이 끝날 때까지 모델을 빌려 두어 다른 작업의 모델 로드가 내리지 못하게 함
+        with self.model_pool.lease(*model_key) as converter:
+            return self._run_leased_job(job, converter, model_key, source, is_url, options)
+    
+    def _run_leased_job(self, job, converter, model_key, source, is_url, options):
+        """풀에서 빌린 변환기로 작업 실행"""
+        language = options['language']
+        downloaded_file = None
+        metrics = converter.start_metrics("youtube" if is_url else "upload")
+        
+        try:
+            cache_key = None
+            youtube_info = None
+            if is_url:
+                if not converter.is_youtube_url(source):
+                    raise ValueError("Invalid YouTube URL / 유효하지 않은 YouTube URL입니다")
+                
+                # 캐시에 있으면 다운로드 생략
+                cache_key = converter.get_youtube_cache_key(source, language)
+                cached_result = converter.transcript_cache.get(cache_key) if cache_key else None
+                if cached_result:
+                    for segment in cached_result.get('segments', []):
+                        job.segment_callback(segment)
+                    metrics.set('cache_hit', True)
+                    converter.finish_metrics(cached_result, metrics)
+                    return cached_result
+                
+                with metrics.stage(METRIC_PROBE):
+                    youtube_info = converter.get_youtube_info(source)
+                if not youtube_info:
+                    raise Exception("Failed to get YouTube video info / YouTube 영상 정보를 가져올 수 없습니다")
+                with metrics.stage(METRIC_DOWNLOAD):
+                    downloaded_file = converter.download_youtube_video(source, job.progress_callback, audio_only=True)
+                audio_source = downloaded_file
+            else:
+                audio_source = source
+            
+            # 다운로드/오디오 추출은 병렬, 같은 모델의 디코딩은 하나씩
+            with metrics.stage(METRIC_EXTRACT):
+                audio = load_audio_array(audio_source)
+            
+            # 다른 작업의 디코딩을 기다린 시간은 queue_wait 단계로 기록
+            result = converter.transcribe_audio(audio, audio_source, language,
+                                                progress_callback=job.progress_callback,
+                                                segment_callback=job.segment_callback, metrics=metrics,
+                                                decode_lock=self.model_pool.decode_lock(*model_key))
+            del audio
+            
+            if is_url:
+                result['youtube_info'] = youtube_info
+                if cache_key:
+                    converter.transcript_cache.put(cache_key, result)
+            converter.finish_metrics(result, metrics)
+            return result
+        except Exception as e:
+            converter.finish_metrics(None, metrics, error=e)
+            raise
+        finally:
+            if downloaded_file:
+                shutil.rmtree(os.path.dirname(downloaded_file), ignore_errors=True)
+            elif not is_url:
+                # 업로드 임시 파일 정리
+                try:
+                    os.unlink(source)
+                except OSError:
+                    pass
+    
+    def job_status(self, job):
+        """작업 상태 응답"""
+        snapshot = job.snapshot()
+        snapshot['links'] = {
+            'self': f"/jobs/{job.job_id}",
+            'segments': f"/jobs/{job.job_id}/segments",
+            'result': f"/jobs/{job.job_id}/result"
+        }
+        return snapshot
+    
+    def health(self):
+        """서버 상태 응답"""
+        return {
+            'status': "ok",
+            'uptime_seconds': time.time() - self.started_at,
+            'active_jobs': self.executor.active_count(),
+            'max_pending_jobs': self.max_pending_jobs,
+            'model_pool': self.model_pool.stats()
+        }
+
+
+class TranscriptionRequestHandler(BaseHTTPRequestHandler):
+    """변환 서비스 HTTP 요청 처리기"""
+    
+    protocol_version = "HTTP/1.1"
+    server_version = "VideoScribeHTTP/1.0"
+    
+    @property
+    def service(self):
+        return self.server.service
+    
+    def log_message(self, format, *args):
+        print(f"{self.address_string()} - {format % args}")
+    
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _send_error(self, status, message, headers=None):
+        self._send_json(status, {'error': message}, headers)
+    
+    def _send_subtitles(self, result, format_name):
+        try:
+            format_name, = parse_formats(format_name)
+        except ValueError as e:
+            return self._send_error(400, str(e))
+        text = render_subtitles(result.get('segments') or [], format_name, result.get('detected_language'))
+        body = text.encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", f"{SUBTITLE_MIME_TYPES[format_name]}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _route(self):
+        parsed = urlparse(self.path)
+        params = {name: values[-1] for name, values in parse_qs(parsed.query).items()}
+        parts = [part for part in parsed.path.split('/') if part]
+        return parts, params
+    
+    def _get_job(self, job_id):
+        job = self.service.executor.get_job(job_id)
+        if job is None:
+            self._send_error(404, f"Job not found: {job_id}")
+        return job
+    
+    def do_GET(self):
+        parts, params = self._route()
+        
+        if parts == ["health"]:
+            return self._send_json(200, self.service.health())
+        
+        if parts == ["metrics"]:
+            body = self.service.prometheus.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        
+        if len(parts) < 2 or parts[0] != "jobs":
+            return self._send_error(404, "Not found")
+        
+        job = self._get_job(parts[1])
+        if job is None:
+            return
+        
+        if len(parts) == 2:
+            return self._send_json(200, self.service.job_status(job))
+        
+        if parts[2:] == ["segments"]:
+            since = int(params.get('since', 0) or 0)
+            if params.get('stream') in ("1", "true"):
+                return self._stream_segments(job, since)
+            segments = job.segments_since(since)
+            return self._send_json(200, {
+                'status': job.status,
+                'segments': segments,
+                'next': since + len(segments)
+            })
+        
+        if parts[2:] == ["result"]:
+            if job.status == JOB_DONE and params.get('format'):
+                return self._send_subtitles(job.result, params['format'])
+            if job.status == JOB_DONE:
+                return self._send_json(200, job.result)
+            if job.status == JOB_FAILED:
+                return self._send_json(500, {'status': job.status, 'error': job.error})
+            return self._send_json(202, self.service.job_status(job), {"Retry-After": "2"})
+        
+        return self._send_error(404, "Not found")
+    
+    def _stream_segments(self, job, since):
+        """작업이 끝날 때까지 새 세그먼트를 NDJSON 청크로 보냅니다"""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        
+        def write_chunk(data):
+            self.wfile.write(f"{len(data):X}\r\n".encode('ascii') + data + b"\r\n")
+            self.wfile.flush()
+        
+        index = since
+        try:
+            while True:
+                active = job.active
+                segments = job.segments_since(index)
+                if segments:
+                    lines = "".join(json.dumps(segment, ensure_ascii=False, default=str) + "\n" for segment in segments)
+                    write_chunk(lines.encode('utf-8'))
+                    index += len(segments)
+                if not active:
+                    break
+                time.sleep(_STREAM_POLL_SECONDS)
+            
+            summary = {'status': job.status, 'next': index}
+            if job.error:
+                summary['error'] = job.error
+            write_chunk((json.dumps({'event': "end", **summary}) + "\n").encode('utf-8'))
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 연결을 끊어도 작업은 계속 진행
+            pass
+    
+    def do_POST(self):
+        parts, params = self._route()
+        if parts != ["jobs"]:
+            return self._send_error(404, "Not found")
+        
+        length = int(self.headers.get('Content-Length') or 0)
+        
+        # 과부하 시 본문을 읽기 전에 거절
+        if self.service.is_saturated():
+            self.close_connection = True
+            return self._send_error(429, "Too many pending jobs, retry later / 대기 작업이 많습니다",
+                                    {"Retry-After": "10", "Connection": "close"})
+        
+        content_type = (self.headers.get('Content-Type') or "").split(';')[0].strip()
+        try:
+            if content_type == "application/json":
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                url = (payload.get('url') or "").strip()
+                if not url:
+                    return self._send_error(400, "Missing 'url' / 'url'이 필요합니다")
+                options = self.service.options_from(payload)
+                job = self.service.submit(url, True, options)
+            else:
+                if length <= 0:
+                    return self._send_error(411, "Content-Length required for uploads")
+                if length > self.service.max_upload_bytes:
+                    self.close_connection = True
+                    return self._send_error(413, "Upload too large / 업로드 파일이 너무 큽니다",
+                                            {"Connection": "close"})
+                options = self.service.options_from(params)
+                filename = os.path.basename(params.get('filename') or "upload.mp4")
+                upload_path = self._receive_upload(length, filename)
+                job = self.service.submit(upload_path, False, options, label=filename)
+                if job is None:
+                    os.unlink(upload_path)
+        except ValueError as e:
+            return self._send_error(400, str(e))
+        
+        if job is None:
+            return self._send_error(429, "Too many pending jobs, retry later / 대기 작업이 많습니다",
+                                    {"Retry-After": "10"})
+        
+        self._send_json(202, self.service.job_status(job), {"Location": f"/jobs/{job.job_id}"})
+    
+    def _receive_upload(self, length, filename):
+        """요청 본문을 청크 단위로 임시 파일에 저장합니다"""
+        suffix = os.path.splitext(filename)[1] or ".bin"
+        fd, upload_path = tempfile.mkstemp(dir=self.service.upload_dir, prefix="upload_", suffix=suffix)
+        remaining = length
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                while remaining > 0:
+                    chunk = self.rfile.read(min(_UPLOAD_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        raise ValueError("Upload ended early / 업로드가 중간에 끊겼습니다")
+                    f.write(chunk)
+                    remaining -= len(chunk)
+        except Exception:
+            os.unlink(upload_path)
+            raise
+        return upload_path
+
+
+def create_server(service, host="127.0.0.1", port=8000):
+    """
+    변환 서비스 HTTP 서버를 생성합니다
+    
+    Args:
+        service (TranscriptionService): 변환 서비스
+        host (str): 바인드 주소
+        port (int): 포트
+    
+    Returns:
+        ThreadingHTTPServer: 서버 (serve_forever로 실행)
+    """
+    server = ThreadingHTTPServer((host, port), TranscriptionRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="VideoScribe HTTP transcription service / HTTP 변환 서비스")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("-m", "--model", default="base", choices=list(MODEL_MEMORY_MB), help="Default Whisper model size")
+    parser.add_argument("--backend", default=BACKEND_WHISPER, choices=list(BACKEND_OPTIONS))
+    parser.add_argument("--cpu", action="store_true", help="Do not use the GPU")
+    parser.add_argument("--max-concurrent", type=int, default=1, help="Jobs processed at the same time")
+    parser.add_argument("--max-pending", type=int, default=8, help="Queued + running jobs before returning 429")
+    parser.add_argument("--max-upload-mb", type=int, default=2048)
+    return parser
+
+
+def main(argv=None):
+    """HTTP 서비스 진입점"""
+    args = build_parser().parse_args(argv)
+    service = TranscriptionService(
+        model_size=args.model,
+        use_gpu=not args.cpu,
+        backend=args.backend,
+        max_concurrent_decodes=args.max_concurrent,
+        max_pending_jobs=args.max_pending,
+        max_upload_mb=args.max_upload_mb
+    )
+    server = create_server(service, args.host, args.port)
+    print(f"VideoScribe HTTP service on http://{args.host}:{args.port} (model {args.model}, {args.backend})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
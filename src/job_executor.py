@@ -0,0 +1,250 @@
+"""
+백그라운드 작업 실행 모듈
+Background Job Executor Module
+"""
+
+import time
+import uuid
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# 작업 상태
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+# 파일 해시 읽기 단위 (1MB)
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_input(*parts):
+    """
+    작업 입력을 식별하는 해시를 계산합니다
+    
+    Args:
+        *parts: 문자열, bytes 또는 버퍼 (파일 내용, URL, 모델 설정 등)
+    
+    Returns:
+        str: 입력 해시 (hex)
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode('utf-8')
+        elif part is None:
+            part = b""
+        elif not isinstance(part, (bytes, bytearray, memoryview)):
+            part = str(part).encode('utf-8')
+        digest.update(part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def hash_stream(stream, chunk_size=_HASH_CHUNK_SIZE):
+    """
+    파일 객체 내용을 청크 단위로 읽어 해시를 계산합니다 (전체 내용을 한 번에 복사하지 않음)
+    
+    Args:
+        stream: 읽기/seek 가능한 파일 객체 (업로드 파일 등)
+        chunk_size (int): 읽기 단위 (바이트)
+    
+    Returns:
+        str: 내용 해시 (hex)
+    """
+    digest = hashlib.sha256()
+    position = stream.tell()
+    stream.seek(0)
+    try:
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+    finally:
+        stream.seek(position)
+    return digest.hexdigest()
+
+
+class Job:
+    """백그라운드 변환 작업 하나의 상태 (워커 스레드가 갱신하고 페이지가 읽음)"""
+    
+    def __init__(self, session_id, input_key, label=""):
+        """
+        초기화
+        
+        Args:
+            session_id (str): 작업을 시작한 세션 ID
+            input_key (str): 입력 해시 (같은 세션의 같은 입력은 같은 작업)
+            label (str): 표시용 이름 (파일 이름, 영상 제목 등)
+        """
+        self.job_id = uuid.uuid4().hex
+        self.session_id = session_id
+        self.input_key = input_key
+        self.label = label
+        self.status = JOB_PENDING
+        self.percent = 0
+        self.message = ""
+        self.segments = []
+        self.result = None
+        self.error = None
+        self.error_details = ""
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+    
+    def progress_callback(self, value, message="", **kwargs):
+        """변환기 진행률 콜백"""
+        with self._lock:
+            self.percent = value
+            if message:
+                self.message = message
+    
+    def segment_callback(self, segment):
+        """변환기 세그먼트 콜백"""
+        with self._lock:
+            self.segments.append(segment)
+    
+    @property
+    def active(self):
+        return self.status in (JOB_PENDING, JOB_RUNNING)
+    
+    def live_text(self):
+        """지금까지 디코딩된 텍스트"""
+        with self._lock:
+            return "".join(segment.get('text', '') for segment in self.segments).strip()
+    
+    def segments_since(self, index):
+        """index번째 이후로 디코딩된 세그먼트 목록"""
+        with self._lock:
+            return self.segments[index:]
+    
+    def snapshot(self):
+        """현재 상태를 dict로 반환합니다"""
+        with self._lock:
+            return {
+                'job_id': self.job_id,
+                'label': self.label,
+                'status': self.status,
+                'percent': self.percent,
+                'message': self.message,
+                'segment_count': len(self.segments),
+                'error': self.error,
+                'elapsed': (self.finished_at or time.time()) - (self.started_at or self.created_at)
+            }
+
+
+class JobExecutor:
+    """
+    스크립트 실행과 분리된 작업 실행기 (모든 세션이 공유)
+    
+    작업은 (세션 ID, 입력 해시)로 저장되므로 페이지가 다시 실행되어도 결과가 유지되고,
+    같은 입력으로 버튼을 다시 눌러도 진행 중이거나 완료된 작업을 그대로 돌려줍니다.
+    """
+    
+    def __init__(self, max_workers=2, max_jobs=200, result_ttl_seconds=3600):
+        """
+        초기화
+        
+        Args:
+            max_workers (int): 동시에 실행할 작업 수
+            max_jobs (int): 보관할 최대 작업 수 (넘으면 오래된 완료 작업부터 삭제)
+            result_ttl_seconds (float): 완료된 작업 결과 보관 시간 (초)
+        """
+        self.max_jobs = max_jobs
+        self.result_ttl_seconds = result_ttl_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="videoscribe-job")
+        self._jobs = OrderedDict()
+        self._jobs_by_id = {}
+        self._lock = threading.Lock()
+    
+    def submit(self, session_id, input_key, func, *args, label="", **kwargs):
+        """
+        작업을 제출합니다 (같은 세션/입력의 작업이 이미 있으면 그 작업을 반환)
+        
+        Args:
+            session_id (str): 세션 ID
+            input_key (str): 입력 해시
+            func (function): func(job, *args, **kwargs) 형태로 실행되어 결과 dict를 반환하는 함수
+            label (str): 표시용 이름
+        
+        Returns:
+            Job: 제출되었거나 이미 있던 작업
+        """
+        key = (session_id, input_key)
+        with self._lock:
+            job = self._jobs.get(key)
+            # 실패한 작업만 다시 실행
+            if job is not None and job.status != JOB_FAILED:
+                return job
+            
+            if job is not None:
+                self._jobs_by_id.pop(job.job_id, None)
+            
+            job = Job(session_id, input_key, label)
+            self._jobs[key] = job
+            self._jobs_by_id[job.job_id] = job
+            self._jobs.move_to_end(key)
+            self._prune()
+        
+        self._executor.submit(self._run, job, func, args, kwargs)
+        return job
+    
+    def _run(self, job, func, args, kwargs):
+        """워커 스레드에서 작업을 실행합니다"""
+        import traceback
+        
+        job.status = JOB_RUNNING
+        job.started_at = time.time()
+        try:
+            job.result = func(job, *args, **kwargs)
+            job.status = JOB_DONE
+        except Exception as e:
+            print(f"Job {job.job_id} failed: {e}")
+            job.error = str(e)
+            job.error_details = traceback.format_exc()
+            job.status = JOB_FAILED
+        finally:
+            job.finished_at = time.time()
+    
+    def get(self, session_id, input_key):
+        """세션/입력에 해당하는 작업을 반환합니다 (없으면 None)"""
+        with self._lock:
+            return self._jobs.get((session_id, input_key))
+    
+    def get_job(self, job_id):
+        """작업 ID로 작업을 반환합니다 (없으면 None)"""
+        with self._lock:
+            return self._jobs_by_id.get(job_id)
+    
+    def active_count(self):
+        """대기 중이거나 실행 중인 전체 작업 수"""
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if job.active)
+    
+    def session_jobs(self, session_id):
+        """세션의 작업 목록을 반환합니다"""
+        with self._lock:
+            return [job for (job_session, _), job in self._jobs.items() if job_session == session_id]
+    
+    def has_active_jobs(self, session_id):
+        """세션에 진행 중인 작업이 있는지 확인합니다"""
+        return any(job.active for job in self.session_jobs(session_id))
+    
+    def _prune(self):
+        """만료되었거나 개수 제한을 넘은 완료 작업을 삭제합니다 (lock 안에서 호출)"""
+        now = time.time()
+        for key, job in list(self._jobs.items()):
+            if not job.active and job.finished_at and now - job.finished_at > self.result_ttl_seconds:
+                del self._jobs[key]
+                self._jobs_by_id.pop(job.job_id, None)
+        
+        for key, job in list(self._jobs.items()):
+            if len(self._jobs) <= self.max_jobs:
+                break
+            if not job.active:
+                del self._jobs[key]
+                self._jobs_by_id.pop(job.job_id, None)
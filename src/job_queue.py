@@ -0,0 +1,582 @@
+"""
+영구 작업 큐 모듈
+Persistent Job Queue Module
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import shutil
+import socket
+import sqlite3
+import argparse
+import threading
+from contextlib import closing
+
+from .audio_utils import load_audio_array
+from .backends import BACKEND_OPTIONS, BACKEND_WHISPER
+from .converter import VideoToTextConverter
+from .model_pool import ModelPool
+
+# 작업 상태
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+# 처리 단계 (순서대로 진행, 실패하면 마지막으로 완료된 단계 다음부터 재개)
+STAGE_DOWNLOAD = "download"
+STAGE_EXTRACT = "extract"
+STAGE_TRANSCRIBE = "transcribe"
+STAGES = [STAGE_DOWNLOAD, STAGE_EXTRACT, STAGE_TRANSCRIBE]
+
+# 실행 중인 작업의 updated_at을 갱신하는 간격과, 갱신이 끊긴 작업을 중단된 것으로 보는 시간 (초)
+JOB_HEARTBEAT_SECONDS = 30
+JOB_STALE_SECONDS = 120
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    source_type TEXT NOT NULL,
+    options TEXT NOT NULL,
+    status TEXT NOT NULL,
+    stage TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    stage_timings TEXT NOT NULL DEFAULT '{}',
+    download_path TEXT,
+    audio_path TEXT,
+    result_path TEXT,
+    worker TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at);
+"""
+
+# JSON으로 저장하는 컬럼
+_JSON_COLUMNS = ('options', 'stage_timings')
+
+
+def _default_base_dir():
+    return os.path.join(os.path.expanduser("~"), ".videoscribe")
+
+
+def _worker_prefix():
+    """이 프로세스의 워커 이름 앞부분 ('<호스트>:<PID>:')"""
+    return f"{socket.gethostname()}:{os.getpid()}:"
+
+
+def _pid_alive(pid):
+    """같은 호스트의 프로세스가 살아 있는지 확인합니다 (확인할 수 없으면 True)"""
+    try:
+        import psutil
+        return psutil.pid_exists(pid)
+    except ImportError:
+        pass
+    if sys.platform == "win32":
+        # Windows의 os.kill은 신호 0이어도 프로세스를 종료시키므로 사용하지 않음
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _worker_is_gone(worker):
+    """작업을 가져간 워커 프로세스가 이 호스트에서 종료되었는지 확인합니다"""
+    try:
+        host, pid, _ = (worker or "").split(":", 2)
+        pid = int(pid)
+    except ValueError:
+        return False
+    return host == socket.gethostname() and pid != os.getpid() and not _pid_alive(pid)
+
+
+def _row_to_job(row):
+    if row is None:
+        return None
+    job = dict(row)
+    for column in _JSON_COLUMNS:
+        job[column] = json.loads(job[column]) if job[column] else {}
+    return job
+
+
+class JobQueue:
+    """SQLite에 저장되는 변환 작업 큐 (프로세스를 다시 시작해도 유지)"""
+    
+    def __init__(self, db_path=None, work_dir=None, max_attempts=3):
+        """
+        초기화
+        
+        Args:
+            db_path (str): SQLite 파일 경로 (None이면 ~/.videoscribe/jobs.db)
+            work_dir (str): 작업별 중간 파일/결과 디렉토리 (None이면 ~/.videoscribe/jobs)
+            max_attempts (int): 자동 재시도를 포함한 최대 실행 횟수
+        """
+        self.db_path = db_path or os.path.join(_default_base_dir(), "jobs.db")
+        self.work_dir = work_dir or os.path.join(_default_base_dir(), "jobs")
+        self.max_attempts = max_attempts
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        os.makedirs(self.work_dir, exist_ok=True)
+        
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+    
+    def _connect(self):
+        """스레드마다 새 연결을 사용합니다 (autocommit, 잠금 대기 30초)"""
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    def job_dir(self, job_id):
+        """작업별 중간 파일 디렉토리"""
+        path = os.path.join(self.work_dir, job_id)
+        os.makedirs(path, exist_ok=True)
+        return path
+    
+    def enqueue(self, source, options=None, source_type=None):
+        """
+        작업을 큐에 추가합니다
+        
+        Args:
+            source (str): 파일 경로 또는 YouTube URL
+            options (dict): 변환 옵션 (model_size, language, backend, use_gpu)
+            source_type (str): 'file' 또는 'youtube' (None이면 자동 판단)
+        
+        Returns:
+            str: 작업 ID
+        """
+        if source_type is None:
+            # 'youtube_talk.mp4' 같은 로컬 파일이 URL로 처리되지 않도록 실제 경로를 먼저 확인
+            is_url = not os.path.exists(source) and source.startswith(("http://", "https://", "www.", "youtu"))
+            source_type = "youtube" if is_url else "file"
+        if source_type == "file":
+            source = os.path.abspath(source)
+        
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, source, source_type, options, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, source, source_type, json.dumps(options or {}), STATUS_QUEUED, now, now)
+            )
+        return job_id
+    
+    def claim(self, worker_id):
+        """
+        가장 오래된 대기 작업을 하나 가져와 실행 중으로 표시합니다
+        
+        Args:
+            worker_id (str): 워커 이름 (JobWorkerPool은 '<호스트>:<PID>:worker-N')
+        
+        Returns:
+            dict: 작업 (대기 작업이 없으면 None)
+        """
+        conn = self._connect()
+        try:
+            # 여러 워커/프로세스가 같은 작업을 가져가지 않도록 쓰기 잠금
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1", (STATUS_QUEUED,)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            
+            now = time.time()
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker = ?, attempts = attempts + 1, "
+                "started_at = COALESCE(started_at, ?), updated_at = ? WHERE id = ?",
+                (STATUS_RUNNING, worker_id, now, now, row['id'])
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return self.get(row['id'])
+    
+    def update(self, job_id, **fields):
+        """작업 필드를 갱신합니다"""
+        fields['updated_at'] = time.time()
+        for column in _JSON_COLUMNS:
+            if column in fields:
+                fields[column] = json.dumps(fields[column])
+        
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        with closing(self._connect()) as conn:
+            conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id))
+    
+    def complete_stage(self, job_id, stage, seconds, **fields):
+        """
+        단계 완료를 기록합니다 (재시작 시 다음 단계부터 진행)
+        
+        Args:
+            job_id (str): 작업 ID
+            stage (str): 완료된 단계
+            seconds (float): 단계 소요 시간
+            **fields: 함께 저장할 경로 (download_path, audio_path, result_path)
+        """
+        stage_timings = self.get(job_id)['stage_timings']
+        stage_timings[stage] = round(seconds, 3)
+        self.update(job_id, stage=stage, stage_timings=stage_timings, **fields)
+    
+    def finish(self, job_id):
+        """작업을 완료 상태로 표시합니다"""
+        self.update(job_id, status=STATUS_DONE, error=None, finished_at=time.time())
+    
+    def fail(self, job_id, error):
+        """
+        작업 실패를 기록합니다 (최대 실행 횟수 전이면 다시 대기 상태로)
+        
+        Returns:
+            str: 변경된 상태
+        """
+        job = self.get(job_id)
+        status = STATUS_QUEUED if job['attempts'] < self.max_attempts else STATUS_FAILED
+        self.update(job_id, status=status, error=str(error),
+                    finished_at=time.time() if status == STATUS_FAILED else None)
+        return status
+    
+    def retry(self, job_id):
+        """실패한 작업을 마지막으로 완료된 단계 다음부터 다시 실행하도록 대기 상태로 돌립니다"""
+        self.update(job_id, status=STATUS_QUEUED, attempts=0, error=None, finished_at=None)
+    
+    def heartbeat(self, job_ids):
+        """실행 중인 작업의 updated_at을 갱신합니다 (다른 워커 프로세스가 중단된 작업으로 보지 않도록)"""
+        if not job_ids:
+            return
+        placeholders = ", ".join("?" for _ in job_ids)
+        with closing(self._connect()) as conn:
+            conn.execute(f"UPDATE jobs SET updated_at = ? WHERE status = ? AND id IN ({placeholders})",
+                         (time.time(), STATUS_RUNNING, *job_ids))
+    
+    def recover(self, stale_seconds=JOB_STALE_SECONDS):
+        """
+        실행 중에 종료된 워커의 작업을 대기 상태로 되돌립니다
+        
+        같은 호스트에서 워커 프로세스가 종료되었거나, stale_seconds 동안 updated_at이 갱신되지 않은 작업만
+        되돌리므로 다른 work 프로세스가 실행 중인 작업은 가져가지 않습니다.
+        
+        Args:
+            stale_seconds (float): 갱신이 끊긴 작업을 중단된 것으로 보는 시간 (초)
+        
+        Returns:
+            int: 되돌린 작업 수
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            rows = conn.execute("SELECT id, worker, updated_at FROM jobs WHERE status = ?",
+                                (STATUS_RUNNING,)).fetchall()
+            stale_ids = [row['id'] for row in rows
+                         if row['updated_at'] < now - stale_seconds or _worker_is_gone(row['worker'])]
+            for job_id in stale_ids:
+                conn.execute("UPDATE jobs SET status = ?, worker = NULL, updated_at = ? WHERE id = ?",
+                             (STATUS_QUEUED, now, job_id))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return len(stale_ids)
+    
+    def get(self, job_id):
+        """작업을 반환합니다 (없으면 None)"""
+        with closing(self._connect()) as conn:
+            return _row_to_job(conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone())
+    
+    def list(self, status=None, limit=100):
+        """최근 작업 목록을 반환합니다"""
+        with closing(self._connect()) as conn:
+            if status:
+                rows = conn.execute("SELECT * FROM jobs WHERE status = ? ORDER BY created_at DESC LIMIT ?",
+                                    (status, limit)).fetchall()
+            else:
+                rows = conn.execute("SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)).fetchall()
+        return [_row_to_job(row) for row in rows]
+    
+    def counts(self):
+        """상태별 작업 수"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        return {row['status']: row['n'] for row in rows}
+
+
+class JobWorkerPool:
+    """
+    큐에서 작업을 가져와 단계별로 처리하는 워커 스레드 풀
+    
+    다운로드와 오디오 추출은 워커마다 병렬로 진행하고, 같은 모델로의 변환은
+    한 번에 하나씩 실행합니다 (모델은 ModelPool로 워커끼리 공유).
+    """
+    
+    def __init__(self, job_queue, workers=2, model_pool=None, poll_interval=1.0):
+        """
+        초기화
+        
+        Args:
+            job_queue (JobQueue): 작업 큐
+            workers (int): 워커 스레드 수
+            model_pool (ModelPool): 모델 풀 (None이면 새로 생성)
+            poll_interval (float): 대기 작업이 없을 때 다시 확인하는 간격 (초)
+        """
+        self.job_queue = job_queue
+        self.workers = max(1, workers)
+        self.model_pool = model_pool or ModelPool(
+            lambda model_size, use_gpu, backend: VideoToTextConverter(model_size=model_size, use_gpu=use_gpu,
+                                                                      backend=backend)
+        )
+        self.poll_interval = poll_interval
+        # 다운로드/추출에는 모델이 필요 없으므로 모델 없는 변환기 사용
+        self._io_converter = VideoToTextConverter(use_cache=False)
+        self._stop_event = threading.Event()
+        self._threads = []
+        self._worker_prefix = _worker_prefix()
+        # heartbeat로 updated_at을 갱신할 실행 중인 작업 ID
+        self._active_jobs = set()
+        self._active_lock = threading.Lock()
+    
+    def start(self, until_empty=False):
+        """
+        워커를 시작합니다
+        
+        Args:
+            until_empty (bool): 대기 작업이 없으면 워커 종료
+        """
+        recovered = self.job_queue.recover()
+        if recovered:
+            print(f"Job queue: resuming {recovered} interrupted job(s)")
+        
+        self._stop_event.clear()
+        for index in range(self.workers):
+            worker_id = f"{self._worker_prefix}worker-{index + 1}"
+            thread = threading.Thread(target=self._worker_loop, args=(worker_id, until_empty),
+                                      name=f"job-worker-{index + 1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        threading.Thread(target=self._heartbeat_loop, args=(list(self._threads),), name="job-heartbeat",
+                         daemon=True).start()
+    
+    def stop(self):
+        """현재 작업을 마친 뒤 워커를 종료합니다"""
+        self._stop_event.set()
+        self.join()
+    
+    def join(self):
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+    
+    def _worker_loop(self, worker_id, until_empty):
+        while not self._stop_event.is_set():
+            job = self.job_queue.claim(worker_id)
+            if job is None:
+                if until_empty:
+                    return
+                self._stop_event.wait(self.poll_interval)
+                continue
+            with self._active_lock:
+                self._active_jobs.add(job['id'])
+            try:
+                self._process(job, worker_id)
+            finally:
+                with self._active_lock:
+                    self._active_jobs.discard(job['id'])
+    
+    def _heartbeat_loop(self, threads):
+        """워커가 실행 중인 동안 작업의 updated_at을 주기적으로 갱신합니다"""
+        while not self._stop_event.wait(JOB_HEARTBEAT_SECONDS):
+            if not any(thread.is_alive() for thread in threads):
+                return
+            with self._active_lock:
+                job_ids = list(self._active_jobs)
+            try:
+                self.job_queue.heartbeat(job_ids)
+            except sqlite3.Error as e:
+                print(f"Job queue heartbeat failed: {e}")
+    
+    def _process(self, job, worker_id):
+        """작업을 마지막으로 완료된 단계 다음부터 처리합니다"""
+        import numpy as np
+        
+        job_id = job['id']
+        options = job['options']
+        completed = STAGES.index(job['stage']) + 1 if job['stage'] in STAGES else 0
+        job_dir = self.job_queue.job_dir(job_id)
+        print(f"[{worker_id}] Job {job_id[:8]}: {job['source']} (resume after: {job['stage'] or 'start'})")
+        
+        # 결과까지 저장된 뒤 중단된 작업은 완료 처리만
+        if completed >= len(STAGES):
+            self.job_queue.finish(job_id)
+            return
+        
+        try:
+            # 1. 다운로드 (로컬 파일은 경로 확인만)
+            download_path = job['download_path']
+            if completed < 1:
+                start_time = time.time()
+                if job['source_type'] == "youtube":
+                    temp_file = self._io_converter.download_youtube_video(job['source'], audio_only=True)
+                    download_path = os.path.join(job_dir, "source" + os.path.splitext(temp_file)[1])
+                    shutil.move(temp_file, download_path)
+                    shutil.rmtree(os.path.dirname(temp_file), ignore_errors=True)
+                else:
+                    if not os.path.isfile(job['source']):
+                        raise Exception(f"File not found: {job['source']} / 파일을 찾을 수 없습니다")
+                    download_path = job['source']
+                self.job_queue.complete_stage(job_id, STAGE_DOWNLOAD, time.time() - start_time,
+                                              download_path=download_path)
+            
+            # 2. 오디오 추출 (디코딩된 PCM을 저장하여 재시작 시 재사용)
+            audio_path = job['audio_path']
+            if completed < 2:
+                start_time = time.time()
+                audio = load_audio_array(download_path)
+                audio_path = os.path.join(job_dir, "audio.npy")
+                np.save(audio_path, audio)
+                self.job_queue.complete_stage(job_id, STAGE_EXTRACT, time.time() - start_time,
+                                              audio_path=audio_path)
+            else:
+                audio = np.load(audio_path)
+            
+            # 3. 텍스트 변환
+            model_key = (options.get('model_size', 'base'), options.get('use_gpu', True),
+                         options.get('backend', BACKEND_WHISPER))
+            start_time = time.time()
+            # 변환 중에는 다른 작업의 모델 로드가 이 모델을 내리지 못하도록 빌려서 사용
+            with self.model_pool.lease(*model_key) as converter, self.model_pool.decode_lock(*model_key):
+                result = converter.transcribe_audio(audio, download_path, options.get('language'))
+            del audio
+            
+            result['source'] = job['source']
+            result_path = os.path.join(job_dir, "result.json")
+            with open(result_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False, default=str)
+            with open(os.path.join(job_dir, "transcript.txt"), 'w', encoding='utf-8') as f:
+                f.write(result.get('transcript', ''))
+            
+            self.job_queue.complete_stage(job_id, STAGE_TRANSCRIBE, time.time() - start_time,
+                                          result_path=result_path)
+            self.job_queue.finish(job_id)
+            self._cleanup(job, job_dir)
+            print(f"[{worker_id}] Job {job_id[:8]}: done -> {result_path}")
+        
+        except Exception as e:
+            status = self.job_queue.fail(job_id, e)
+            print(f"[{worker_id}] Job {job_id[:8]}: failed ({status}): {e}")
+    
+    def _cleanup(self, job, job_dir):
+        """완료된 작업의 중간 파일을 삭제합니다 (결과 파일은 유지)"""
+        for filename in os.listdir(job_dir):
+            if filename in ("result.json", "transcript.txt"):
+                continue
+            try:
+                os.unlink(os.path.join(job_dir, filename))
+            except OSError:
+                pass
+
+
+def _print_job(job):
+    timings = ", ".join(f"{stage} {seconds:.1f}s" for stage, seconds in job['stage_timings'].items())
+    print(f"{job['id']}  {job['status']:<8} stage={job['stage'] or '-':<10} attempts={job['attempts']}  {job['source']}")
+    if timings:
+        print(f"    timings: {timings}")
+    if job['result_path']:
+        print(f"    result: {job['result_path']}")
+    if job['error']:
+        print(f"    error: {job['error']}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Persistent transcription job queue / 영구 변환 작업 큐")
+    parser.add_argument("--db", default=None, help="SQLite database path (default ~/.videoscribe/jobs.db)")
+    parser.add_argument("--work-dir", default=None, help="Job working directory (default ~/.videoscribe/jobs)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    add_parser = subparsers.add_parser("add", help="Queue files, directories, globs or YouTube URLs")
+    add_parser.add_argument("inputs", nargs="*")
+    add_parser.add_argument("-u", "--url-list", action="append", default=[], help="Text file with YouTube URLs")
+    add_parser.add_argument("-m", "--model", default="base", help="Whisper model size")
+    add_parser.add_argument("-l", "--language", default=None, help="Language code, default auto-detect")
+    add_parser.add_argument("--backend", default=BACKEND_WHISPER, choices=list(BACKEND_OPTIONS))
+    add_parser.add_argument("--cpu", action="store_true", help="Do not use the GPU")
+    
+    work_parser = subparsers.add_parser("work", help="Run workers")
+    work_parser.add_argument("-w", "--workers", type=int, default=2, help="Number of worker threads")
+    work_parser.add_argument("--until-empty", action="store_true", help="Exit when the queue is empty")
+    
+    status_parser = subparsers.add_parser("status", help="Show jobs")
+    status_parser.add_argument("job_id", nargs="?")
+    status_parser.add_argument("--status", default=None, help="Filter by status")
+    
+    retry_parser = subparsers.add_parser("retry", help="Requeue failed jobs (resumes at the last completed stage)")
+    retry_parser.add_argument("job_ids", nargs="*", help="Job ids (default: all failed jobs)")
+    return parser
+
+
+def main(argv=None):
+    """작업 큐 CLI 진입점"""
+    args = build_parser().parse_args(argv)
+    job_queue = JobQueue(args.db, args.work_dir)
+    
+    if args.command == "add":
+        from .batch_cli import collect_inputs
+        
+        options = {
+            'model_size': args.model,
+            'language': args.language,
+            'backend': args.backend,
+            'use_gpu': not args.cpu
+        }
+        inputs = collect_inputs(args.inputs, args.url_list)
+        for source, is_url in inputs:
+            job_id = job_queue.enqueue(source, options, "youtube" if is_url else "file")
+            print(f"Queued {job_id}  {source}")
+        return 0 if inputs else 2
+    
+    if args.command == "work":
+        pool = JobWorkerPool(job_queue, workers=args.workers)
+        pool.start(until_empty=args.until_empty)
+        try:
+            pool.join()
+        except KeyboardInterrupt:
+            print("Stopping workers after current jobs... / 현재 작업을 마친 뒤 종료합니다...")
+            pool.stop()
+        print(f"Job counts: {job_queue.counts()}")
+        return 0
+    
+    if args.command == "status":
+        jobs = [job_queue.get(args.job_id)] if args.job_id else job_queue.list(args.status)
+        for job in jobs:
+            if job:
+                _print_job(job)
+        print(f"Job counts: {job_queue.counts()}")
+        return 0
+    
+    if args.command == "retry":
+        job_ids = args.job_ids or [job['id'] for job in job_queue.list(STATUS_FAILED, limit=10000)]
+        for job_id in job_ids:
+            job_queue.retry(job_id)
+            print(f"Requeued {job_id}")
+        return 0
+    
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""
+언어 감지 모듈
+Language Detection Module
+"""
+
+import os
+import json
+import time
+import tempfile
+import threading
+from collections import OrderedDict
+
+from .audio_utils import SAMPLE_RATE, gate_speech
+from .backends import create_backend
+
+# 감지에 사용할 모델 (가장 작은 모델)
+LANGUAGE_PROBE_MODEL = "tiny"
+
+# 감지 윈도우 길이 (초)와 오디오 전체에서 고르게 뽑을 윈도우 수
+LANGUAGE_PROBE_SECONDS = 30
+LANGUAGE_PROBE_WINDOWS = 3
+
+# 이 확률보다 낮으면 언어를 고정하지 않고 본 모델이 감지하도록 둠
+LANGUAGE_MIN_PROBABILITY = 0.5
+
+# 채널의 언어를 믿고 감지를 생략하는 기준 (감지 횟수, 같은 언어 비율)
+CHANNEL_MIN_DETECTIONS = 3
+CHANNEL_MIN_SHARE = 0.9
+
+# 언어 캐시 최대 항목 수
+LANGUAGE_CACHE_SIZE = 5000
+
+
+def _default_cache_path():
+    """기본 언어 캐시 파일 경로를 반환합니다 / Return default language cache path"""
+    return os.path.join(os.path.expanduser("~"), ".videoscribe", "language_cache.json")
+
+
+class LanguageCache:
+    """소스 해시/채널별 감지 결과를 JSON 파일 하나에 저장하는 캐시 (항목 수 제한 + LRU 삭제)"""
+    
+    def __init__(self, path=None, max_entries=LANGUAGE_CACHE_SIZE):
+        """
+        초기화
+        
+        Args:
+            path (str): 캐시 파일 경로 (None이면 ~/.videoscribe/language_cache.json)
+            max_entries (int): 최대 항목 수
+        """
+        self.path = path or _default_cache_path()
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._entries.update(json.load(f))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Language cache read failed: {e}")
+    
+    def get(self, key):
+        """
+        캐시된 값을 반환합니다 (없으면 None)
+        
+        Args:
+            key (str): 'audio:<해시>' 또는 'channel:<채널 ID>'
+        
+        Returns:
+            dict: 저장된 값 또는 None
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        """
+        값을 저장하고 파일에 씁니다
+        
+        Args:
+            key (str): 캐시 키
+            value (dict): 저장할 값 (JSON 직렬화 가능)
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            
+            temp_path = None
+            try:
+                # 임시 파일에 쓴 뒤 교체 (쓰는 도중 읽기 방지)
+                fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)), suffix=".tmp")
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(self._entries, f, ensure_ascii=False)
+                os.replace(temp_path, self.path)
+            except Exception as e:
+                print(f"Language cache write failed: {e}")
+                if temp_path:
+                    try:
+                        os.unlink(temp_path)
+                    except OSError:
+                        pass
+
+
+class LanguageDetector:
+    """
+    작은 모델로 오디오 몇 구간만 보고 언어를 미리 감지하는 클래스
+    
+    본 모델의 transcribe가 끝나야 언어를 알 수 있는 대신, 변환 전에 언어를 정해
+    본 모델은 언어를 고정하고 디코딩하도록 합니다. 결과는 소스 해시와 YouTube 채널별로 캐시합니다.
+    """
+    
+    def __init__(self, load_backend, probe_seconds=LANGUAGE_PROBE_SECONDS, probe_windows=LANGUAGE_PROBE_WINDOWS,
+                 cache=None):
+        """
+        초기화
+        
+        Args:
+            load_backend (function): 감지용 음성 인식 엔진을 로드해서 반환하는 함수 (처음 감지할 때 호출)
+            probe_seconds (float): 감지 윈도우 길이 (초)
+            probe_windows (int): 오디오 전체에서 고르게 뽑을 윈도우 수
+            cache (LanguageCache): 감지 결과 캐시 (None이면 캐시하지 않음)
+        """
+        self.load_backend = load_backend
+        self.probe_seconds = probe_seconds
+        self.probe_windows = max(1, probe_windows)
+        self.cache = cache
+        # 같은 모델로 동시에 디코딩하지 않도록 감지는 하나씩 실행
+        self._lock = threading.Lock()
+    
+    def _probe_windows(self, audio):
+        """음성 구간에서 감지 윈도우를 고르게 뽑습니다"""
+        window_samples = int(self.probe_seconds * SAMPLE_RATE)
+        if self.probe_windows == 1 or len(audio) <= window_samples * self.probe_windows:
+            starts = range(0, len(audio), window_samples)
+        else:
+            # 처음, 끝, 그 사이를 같은 간격으로
+            last_start = len(audio) - window_samples
+            starts = [int(last_start * index / (self.probe_windows - 1)) for index in range(self.probe_windows)]
+        return [audio[start:start + window_samples] for start in starts][:self.probe_windows]
+    
+    def detect(self, audio, source_key=None):
+        """
+        언어를 감지합니다 (소스 키가 캐시에 있으면 감지 생략)
+        
+        Args:
+            audio (numpy.ndarray): 16kHz 모노 float32 오디오
+            source_key (str): 캐시 키 (예: 'audio:<해시>'), None이면 캐시 사용 안함
+        
+        Returns:
+            tuple: (언어 코드, 확률), 음성이 없으면 (None, 0.0)
+        """
+        if self.cache is not None and source_key:
+            cached = self.cache.get(source_key)
+            if cached:
+                return cached['language'], cached['probability']
+        
+        speech, _ = gate_speech(audio)
+        if speech.size == 0:
+            return None, 0.0
+        
+        start_time = time.perf_counter()
+        windows = self._probe_windows(speech)
+        totals = {}
+        with self._lock:
+            backend = self.load_backend()
+            for window in windows:
+                for language, probability in backend.language_probabilities(window).items():
+                    totals[language] = totals.get(language, 0.0) + probability
+        
+        language = max(totals, key=totals.get)
+        probability = totals[language] / len(windows)
+        print(f"Language probe: {language} ({probability:.2f}) from {len(windows)} window(s) "
+              f"in {time.perf_counter() - start_time:.2f}s")
+        
+        if self.cache is not None and source_key:
+            self.cache.put(source_key, {
+                'language': language,
+                'probability': round(probability, 4),
+                'detected_at': time.time()
+            })
+        return language, probability
+    
+    def lookup_channel(self, channel_id):
+        """
+        채널에서 충분히 일관되게 감지된 언어를 반환합니다
+        
+        Args:
+            channel_id (str): YouTube 채널 ID
+        
+        Returns:
+            str: 언어 코드 (기록이 부족하거나 언어가 섞여 있으면 None)
+        """
+        if self.cache is None or not channel_id:
+            return None
+        counts = (self.cache.get(f"channel:{channel_id}") or {}).get('counts') or {}
+        total = sum(counts.values())
+        if total < CHANNEL_MIN_DETECTIONS:
+            return None
+        language = max(counts, key=counts.get)
+        return language if counts[language] / total >= CHANNEL_MIN_SHARE else None
+    
+    def record_channel(self, channel_id, language):
+        """
+        채널 영상에서 감지된 언어를 기록합니다
+        
+        Args:
+            channel_id (str): YouTube 채널 ID
+            language (str): 감지된 언어 코드
+        """
+        if self.cache is None or not channel_id or not language or language == "unknown":
+            return
+        key = f"channel:{channel_id}"
+        counts = dict((self.cache.get(key) or {}).get('counts') or {})
+        counts[language] = counts.get(language, 0) + 1
+        self.cache.put(key, {'counts': counts, 'updated_at': time.time()})
+
+
+_detectors = {}
+_detectors_lock = threading.Lock()
+_language_cache = None
+
+
+def get_language_detector(backend_name, device="cpu"):
+    """
+    엔진/장치별로 공유하는 언어 감지기를 반환합니다 (감지 모델은 처음 감지할 때 한 번만 로드)
+    
+    Args:
+        backend_name (str): 음성 인식 엔진 이름
+        device (str): 장치 (cuda, cpu)
+    
+    Returns:
+        LanguageDetector: 공유 감지기
+    """
+    global _language_cache
+    with _detectors_lock:
+        detector = _detectors.get((backend_name, device))
+        if detector is None:
+            if _language_cache is None:
+                try:
+                    _language_cache = LanguageCache()
+                except Exception as e:
+                    # 캐시 파일을 만들 수 없으면 캐시 없이 감지
+                    print(f"Language cache disabled: {e}")
+            probe_backend = create_backend(backend_name, LANGUAGE_PROBE_MODEL, device)
+            detector = LanguageDetector(probe_backend.load, cache=_language_cache)
+            _detectors[(backend_name, device)] = detector
+        return detector
@@ -0,0 +1,217 @@
+"""
+미디어 정보 조회 모듈
+Media Probe Module
+"""
+
+import os
+import re
+import copy
+import json
+import threading
+import subprocess
+from fractions import Fraction
+from collections import OrderedDict
+
+from .ffmpeg_setup import get_ffmpeg_binary, get_ffprobe_binary
+
+# 조회 결과 캐시 (경로, 수정 시각, 크기) → 정보 dict
+PROBE_CACHE_SIZE = 128
+_probe_cache = OrderedDict()
+_probe_cache_lock = threading.Lock()
+
+# ffprobe가 없을 때 ffmpeg -i 출력에서 읽는 항목
+_DURATION_PATTERN = re.compile(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
+_VIDEO_STREAM_PATTERN = re.compile(r"Stream #\S+.*?: Video: (\w+).*?, (\d{2,5})x(\d{2,5})(?:.*?, ([\d.]+) fps)?")
+_AUDIO_STREAM_PATTERN = re.compile(r"Stream #\S+.*?: Audio: (\w+).*?, (\d+) Hz, ([\w.()]+)(?:.*?, (\d+) kb/s)?")
+
+# 채널 레이아웃 이름 → 채널 수
+_CHANNEL_LAYOUTS = {
+    "mono": 1,
+    "stereo": 2,
+    "2.1": 3,
+    "quad": 4,
+    "5.0": 5,
+    "5.1": 6,
+    "5.1(side)": 6,
+    "7.1": 8
+}
+
+
+def _to_float(value):
+    """ffprobe 숫자 문자열을 float로 변환합니다 (없거나 잘못된 값이면 None)"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int(value):
+    number = _to_float(value)
+    return int(number) if number is not None else None
+
+
+def _parse_frame_rate(value):
+    """'30000/1001' 형식의 프레임 레이트를 float로 변환합니다"""
+    try:
+        rate = Fraction(value)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+    return float(rate) if rate > 0 else None
+
+
+def _build_info(duration, video, audio, format_name=None, bit_rate=None):
+    """조회 결과를 get_video_info 반환 형식으로 정리합니다"""
+    return {
+        'duration': duration,
+        'fps': video.get('fps') if video else None,
+        'size': (video['width'], video['height']) if video and video.get('width') else None,
+        'format_name': format_name,
+        'bit_rate': bit_rate,
+        'has_video': video is not None,
+        'has_audio': audio is not None,
+        'video': video,
+        'audio': audio
+    }
+
+
+def _run_ffprobe(ffprobe, file_path):
+    """ffprobe JSON 출력으로 스트림/포맷 정보를 읽습니다"""
+    command = [
+        ffprobe,
+        '-v', 'error',
+        '-print_format', 'json',
+        '-show_streams',
+        '-show_format',
+        file_path
+    ]
+    completed = subprocess.run(command, capture_output=True, timeout=30)
+    if completed.returncode != 0:
+        stderr = completed.stderr.decode('utf-8', errors='replace').strip()
+        raise Exception(f"ffprobe failed: {stderr}")
+    
+    data = json.loads(completed.stdout.decode('utf-8', errors='replace') or "{}")
+    media_format = data.get('format', {})
+    streams = data.get('streams', [])
+    
+    # 첫 번째 비디오/오디오 스트림 사용 (앨범 아트 등 정지 이미지는 제외)
+    video_stream = next((stream for stream in streams if stream.get('codec_type') == "video"
+                         and not stream.get('disposition', {}).get('attached_pic')), None)
+    audio_stream = next((stream for stream in streams if stream.get('codec_type') == "audio"), None)
+    
+    video = None
+    if video_stream:
+        video = {
+            'codec': video_stream.get('codec_name'),
+            'width': _to_int(video_stream.get('width')),
+            'height': _to_int(video_stream.get('height')),
+            'fps': _parse_frame_rate(video_stream.get('avg_frame_rate')) or _parse_frame_rate(video_stream.get('r_frame_rate')),
+            'bit_rate': _to_int(video_stream.get('bit_rate'))
+        }
+    
+    audio = None
+    if audio_stream:
+        audio = {
+            'codec': audio_stream.get('codec_name'),
+            'sample_rate': _to_int(audio_stream.get('sample_rate')),
+            'channels': _to_int(audio_stream.get('channels')),
+            'channel_layout': audio_stream.get('channel_layout'),
+            'bit_rate': _to_int(audio_stream.get('bit_rate')),
+            'duration': _to_float(audio_stream.get('duration'))
+        }
+    
+    duration = _to_float(media_format.get('duration'))
+    if duration is None and audio:
+        duration = audio['duration']
+    
+    return _build_info(duration, video, audio, media_format.get('format_name'), _to_int(media_format.get('bit_rate')))
+
+
+def _run_ffmpeg_banner(file_path):
+    """ffprobe가 없을 때 ffmpeg -i 배너에서 기본 정보를 읽습니다 (프레임 디코딩 없음)"""
+    command = [get_ffmpeg_binary(), '-hide_banner', '-nostdin', '-i', file_path]
+    try:
+        completed = subprocess.run(command, capture_output=True, timeout=30)
+    except FileNotFoundError:
+        raise Exception("FFmpeg not found. Please install FFmpeg. / FFmpeg를 찾을 수 없습니다. FFmpeg를 설치해주세요.")
+    
+    # 출력 파일이 없으므로 항상 실패 코드로 끝나고, 정보는 stderr에 있음
+    banner = completed.stderr.decode('utf-8', errors='replace')
+    
+    duration = None
+    match = _DURATION_PATTERN.search(banner)
+    if match:
+        hours, minutes, seconds = match.groups()
+        duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    
+    video = None
+    match = _VIDEO_STREAM_PATTERN.search(banner)
+    if match:
+        video = {
+            'codec': match.group(1),
+            'width': int(match.group(2)),
+            'height': int(match.group(3)),
+            'fps': _to_float(match.group(4)),
+            'bit_rate': None
+        }
+    
+    audio = None
+    match = _AUDIO_STREAM_PATTERN.search(banner)
+    if match:
+        layout = match.group(3)
+        bit_rate = _to_int(match.group(4))
+        audio = {
+            'codec': match.group(1),
+            'sample_rate': int(match.group(2)),
+            'channels': _CHANNEL_LAYOUTS.get(layout),
+            'channel_layout': layout,
+            'bit_rate': bit_rate * 1000 if bit_rate else None,
+            'duration': duration
+        }
+    
+    if duration is None and video is None and audio is None:
+        raise Exception(f"Could not read media info: {banner.strip().splitlines()[-1] if banner.strip() else file_path}")
+    
+    return _build_info(duration, video, audio)
+
+
+def probe_media(file_path):
+    """
+    미디어 파일의 컨테이너/스트림 정보를 조회합니다 (경로 + 수정 시각 기준 캐시)
+    
+    ffprobe 한 번 호출로 읽고, ffprobe가 없으면 ffmpeg -i 출력에서 읽습니다.
+    
+    Args:
+        file_path (str): 비디오/오디오 파일 경로
+    
+    Returns:
+        dict: duration, fps, size, format_name, bit_rate, has_video, has_audio,
+              video (codec, width, height, fps, bit_rate),
+              audio (codec, sample_rate, channels, channel_layout, bit_rate, duration)
+    """
+    stat = os.stat(file_path)
+    cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+    
+    with _probe_cache_lock:
+        info = _probe_cache.get(cache_key)
+        if info is not None:
+            _probe_cache.move_to_end(cache_key)
+            return copy.deepcopy(info)
+    
+    ffprobe = get_ffprobe_binary()
+    if ffprobe:
+        info = _run_ffprobe(ffprobe, file_path)
+    else:
+        info = _run_ffmpeg_banner(file_path)
+    
+    with _probe_cache_lock:
+        _probe_cache[cache_key] = info
+        while len(_probe_cache) > PROBE_CACHE_SIZE:
+            _probe_cache.popitem(last=False)
+    
+    return copy.deepcopy(info)
+
+
+def clear_probe_cache():
+    """조회 결과 캐시를 비웁니다"""
+    with _probe_cache_lock:
+        _probe_cache.clear()
@@ -0,0 +1,356 @@
+"""
+변환 실행 지표 모듈
+Run Metrics Module
+"""
+
+import os
+import sys
+import json
+import time
+import weakref
+import threading
+from contextlib import contextmanager
+
+# 지표 단계 이름
+METRIC_PROBE = "probe"
+METRIC_DETECT_LANGUAGE = "detect_language"
+METRIC_DOWNLOAD = "download"
+METRIC_EXTRACT = "extract"
+METRIC_LOAD_MODEL = "load_model"
+METRIC_DECODE = "decode"
+METRIC_REFINE = "refine"
+METRIC_POSTPROCESS = "postprocess"
+METRIC_QUEUE_WAIT = "queue_wait"
+
+# 지표 기록 파일 환경 변수 (JSON lines)
+METRICS_FILE_ENV = "VIDEOSCRIBE_METRICS_FILE"
+
+# 실행 중 상주 메모리 샘플링 간격 (초)
+RSS_SAMPLE_INTERVAL = 0.25
+
+
+def process_peak_rss_mb():
+    """
+    프로세스가 시작된 뒤의 최대 상주 메모리를 반환합니다 (실행 단위가 아닌 프로세스 전체 값)
+    
+    Returns:
+        float: 최대 메모리 (MB), 측정할 수 없으면 None
+    """
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux는 KB, macOS는 바이트 단위
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def current_rss_mb():
+    """
+    현재 상주 메모리를 반환합니다
+    
+    Returns:
+        float: 상주 메모리 (MB), 측정할 수 없으면 None
+    """
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except Exception:
+        pass
+    try:
+        # psutil이 없는 Linux
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class _RssSampler:
+    """
+    실행 중인 RunMetrics들의 최대 상주 메모리를 백그라운드 스레드 하나로 기록합니다
+    
+    실행 중인 변환이 없으면 스레드를 끝내고, 다음 변환이 시작될 때 다시 띄웁니다.
+    """
+    
+    def __init__(self, interval=RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        # finish()를 부르지 않고 버려진 실행은 자동으로 빠짐
+        self._runs = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._thread = None
+    
+    def add(self, run):
+        with self._lock:
+            self._runs.add(run)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._sample, name="videoscribe-rss", daemon=True)
+                self._thread.start()
+    
+    def discard(self, run):
+        with self._lock:
+            self._runs.discard(run)
+    
+    def _sample(self):
+        while True:
+            rss_mb = current_rss_mb()
+            with self._lock:
+                runs = list(self._runs)
+                if not runs or rss_mb is None:
+                    self._thread = None
+                    return
+            for run in runs:
+                run._observe_rss(rss_mb)
+            del runs
+            time.sleep(self.interval)
+
+
+_rss_sampler = _RssSampler()
+
+
+class RunMetrics:
+    """
+    변환 한 건의 단계별 실행 시간과 자원 사용량
+    
+    YouTube 처리처럼 여러 메서드를 거치는 경우 같은 객체를 넘겨 이어서 기록하고,
+    처음 만든 쪽이 finish()로 마무리합니다.
+    """
+    
+    def __init__(self, source="", **labels):
+        """
+        초기화
+        
+        Args:
+            source (str): 입력 종류 (local, youtube, audio)
+            **labels: 함께 기록할 값 (모델 크기, 엔진 등)
+        """
+        self.source = source
+        self.labels = dict(labels)
+        self.stages = {}
+        self.values = {}
+        self.started_at = time.time()
+        self._start_time = time.perf_counter()
+        self.total_seconds = None
+        
+        # 실행 중 메모리: 시작 시점 값과 실행 동안의 최대값 (다른 실행과 겹치면 그 메모리도 포함됨)
+        self._start_rss_mb = current_rss_mb()
+        self._peak_rss_mb = self._start_rss_mb
+        if self._start_rss_mb is not None:
+            _rss_sampler.add(self)
+    
+    @contextmanager
+    def stage(self, name):
+        """with 블록의 실행 시간을 단계 시간에 더합니다"""
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start_time
+    
+    @contextmanager
+    def hold(self, lock):
+        """
+        lock을 잡은 채로 with 블록을 실행합니다 (lock을 기다린 시간은 queue_wait 단계에 더함)
+        
+        Args:
+            lock (threading.Lock): 잡을 lock (None이면 기다리지 않고 바로 실행)
+        """
+        if lock is None:
+            yield
+            return
+        with self.stage(METRIC_QUEUE_WAIT):
+            lock.acquire()
+        try:
+            yield
+        finally:
+            lock.release()
+    
+    def add_stage(self, name, seconds):
+        """이미 측정한 시간을 단계 시간에 더합니다 (배치 디코딩 시간을 입력별로 나눌 때)"""
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+    
+    def set(self, name, value):
+        """단계 외 값을 기록합니다 (audio_seconds, cache_hit 등)"""
+        self.values[name] = value
+    
+    def _observe_rss(self, rss_mb):
+        """샘플링한 상주 메모리로 최대값을 갱신합니다"""
+        if rss_mb is not None and rss_mb > self._peak_rss_mb:
+            self._peak_rss_mb = rss_mb
+    
+    def finish(self):
+        """전체 실행 시간과 실행 동안의 최대 메모리를 확정합니다"""
+        self.total_seconds = time.perf_counter() - self._start_time
+        _rss_sampler.discard(self)
+        if self._start_rss_mb is None:
+            self.values['peak_rss_mb'] = None
+            self.values['rss_growth_mb'] = None
+        else:
+            self._observe_rss(current_rss_mb())
+            self.values['peak_rss_mb'] = round(self._peak_rss_mb, 1)
+            self.values['rss_growth_mb'] = round(self._peak_rss_mb - self._start_rss_mb, 1)
+        return self
+    
+    def to_dict(self):
+        """
+        결과 dict의 metrics 항목을 만듭니다
+        
+        Returns:
+            dict: source, labels, stages (초), total_seconds, audio_seconds, rtf, peak_rss_mb, rss_growth_mb 등
+        """
+        total_seconds = self.total_seconds
+        if total_seconds is None:
+            total_seconds = time.perf_counter() - self._start_time
+        
+        metrics = {
+            'source': self.source,
+            'started_at': self.started_at,
+            'stages': {name: round(seconds, 4) for name, seconds in self.stages.items()},
+            'total_seconds': round(total_seconds, 4)
+        }
+        metrics.update(self.labels)
+        metrics.update(self.values)
+        
+        audio_seconds = self.values.get('audio_seconds')
+        if audio_seconds:
+            metrics['rtf'] = round(total_seconds / audio_seconds, 5)
+            if METRIC_DECODE in self.stages:
+                metrics['decode_rtf'] = round(self.stages[METRIC_DECODE] / audio_seconds, 5)
+        return metrics
+
+
+class JsonLinesSink:
+    """지표를 JSON lines 파일에 한 줄씩 추가하는 기록기"""
+    
+    def __init__(self, path):
+        """
+        초기화
+        
+        Args:
+            path (str): 기록 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+    
+    def emit(self, metrics):
+        line = json.dumps(metrics, ensure_ascii=False, default=str)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+
+
+class PrometheusSink:
+    """
+    지표를 누적하여 Prometheus 텍스트 형식으로 내보내는 기록기
+    
+    render() 결과를 HTTP 서비스의 /metrics 엔드포인트에서 반환합니다.
+    """
+    
+    def __init__(self, namespace="videoscribe"):
+        self.namespace = namespace
+        self._stage_seconds = {}
+        self._stage_counts = {}
+        self._runs = {}
+        self._audio_seconds = 0.0
+        self._last_peak_rss_mb = None
+        self._lock = threading.Lock()
+    
+    def emit(self, metrics):
+        labels = (metrics.get('source') or "unknown", metrics.get('model_size') or "", metrics.get('backend') or "")
+        with self._lock:
+            if metrics.get('error'):
+                status = "failed"
+            else:
+                status = "cached" if metrics.get('cache_hit') else "ok"
+            run_key = labels + (status,)
+            self._runs[run_key] = self._runs.get(run_key, 0) + 1
+            for stage, seconds in metrics.get('stages', {}).items():
+                key = labels + (stage,)
+                self._stage_seconds[key] = self._stage_seconds.get(key, 0.0) + seconds
+                self._stage_counts[key] = self._stage_counts.get(key, 0) + 1
+            self._audio_seconds += metrics.get('audio_seconds') or 0.0
+            if metrics.get('peak_rss_mb') is not None:
+                self._last_peak_rss_mb = metrics['peak_rss_mb']
+    
+    def render(self):
+        """
+        Prometheus 텍스트 형식으로 변환합니다
+        
+        Returns:
+            str: exposition 텍스트
+        """
+        prefix = self.namespace
+        
+        def label_text(source, model_size, backend, **extra):
+            pairs = [("source", source), ("model", model_size), ("backend", backend)] + list(extra.items())
+            return ",".join(f'{name}="{value}"' for name, value in pairs)
+        
+        lines = []
+        with self._lock:
+            lines.append(f"# HELP {prefix}_runs_total Completed transcription runs")
+            lines.append(f"# TYPE {prefix}_runs_total counter")
+            for (source, model_size, backend, status), count in sorted(self._runs.items()):
+                lines.append(f"{prefix}_runs_total{{{label_text(source, model_size, backend, status=status)}}} {count}")
+            
+            lines.append(f"# HELP {prefix}_stage_seconds Time spent per pipeline stage")
+            lines.append(f"# TYPE {prefix}_stage_seconds summary")
+            for (source, model_size, backend, stage), seconds in sorted(self._stage_seconds.items()):
+                labels = label_text(source, model_size, backend, stage=stage)
+                lines.append(f"{prefix}_stage_seconds_sum{{{labels}}} {seconds:.6f}")
+                lines.append(f"{prefix}_stage_seconds_count{{{labels}}} "
+                             f"{self._stage_counts[(source, model_size, backend, stage)]}")
+            
+            lines.append(f"# HELP {prefix}_audio_seconds_total Audio duration processed")
+            lines.append(f"# TYPE {prefix}_audio_seconds_total counter")
+            lines.append(f"{prefix}_audio_seconds_total {self._audio_seconds:.3f}")
+            
+            if self._last_peak_rss_mb is not None:
+                lines.append(f"# HELP {prefix}_last_run_peak_rss_bytes Peak resident memory during the most recent run")
+                lines.append(f"# TYPE {prefix}_last_run_peak_rss_bytes gauge")
+                lines.append(f"{prefix}_last_run_peak_rss_bytes {int(self._last_peak_rss_mb * 1024 * 1024)}")
+        return "\n".join(lines) + "\n"
+
+
+class MultiSink:
+    """여러 기록기에 같은 지표를 전달합니다"""
+    
+    def __init__(self, sinks):
+        self.sinks = list(sinks)
+    
+    def emit(self, metrics):
+        for sink in self.sinks:
+            sink.emit(metrics)
+
+
+def sink_from_env():
+    """
+    환경 변수로 지정된 기본 기록기를 만듭니다 (VIDEOSCRIBE_METRICS_FILE이 있으면 JSON lines)
+    
+    Returns:
+        JsonLinesSink: 기록기 또는 None
+    """
+    path = os.environ.get(METRICS_FILE_ENV)
+    if not path:
+        return None
+    try:
+        return JsonLinesSink(path)
+    except OSError as e:
+        print(f"Metrics file disabled: {e}")
+        return None
+
+
+def emit_metrics(sink, metrics):
+    """기록기 오류가 변환을 멈추지 않도록 지표를 전달합니다"""
+    if sink is None:
+        return
+    try:
+        sink.emit(metrics)
+    except Exception as e:
+        print(f"Metrics sink error: {e}")
@@ -0,0 +1,351 @@
+"""
+모델 웜 풀 모듈
+Model Warm Pool Module
+"""
+
+import gc
+import time
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from .backends import BACKEND_WHISPER, BACKEND_FASTER_WHISPER
+
+# 모델 크기별 대략적인 상주 메모리 (MB, openai-whisper fp32 기준)
+MODEL_MEMORY_MB = {
+    "tiny": 150,
+    "base": 300,
+    "small": 1000,
+    "medium": 3000,
+    "large": 6200
+}
+
+# faster-whisper 양자화 모델의 메모리 비율 (CPU int8, GPU float16)
+_FASTER_WHISPER_MEMORY_RATIO = {
+    "cpu": 0.35,
+    "cuda": 0.5
+}
+
+# 기본 메모리 예산 (MB) - RAM은 large 모델 하나(약 6200MB)와 작은 모델 몇 개가 함께 들어가는 크기
+# 예산보다 큰 모델도 로드는 되지만, 그 전에 사용 중이 아닌 다른 모델을 모두 내림
+DEFAULT_RAM_BUDGET_MB = 8192
+DEFAULT_VRAM_BUDGET_MB = 6144
+
+
+def estimate_model_memory_mb(model_size, backend=BACKEND_WHISPER, device="cpu"):
+    """
+    모델이 차지할 메모리를 추정합니다
+    
+    Args:
+        model_size (str): 모델 크기
+        backend (str): 음성 인식 엔진 이름
+        device (str): 장치 (cuda, cpu)
+    
+    Returns:
+        float: 예상 메모리 (MB)
+    """
+    memory_mb = MODEL_MEMORY_MB.get(model_size, MODEL_MEMORY_MB["large"])
+    if backend == BACKEND_FASTER_WHISPER:
+        memory_mb *= _FASTER_WHISPER_MEMORY_RATIO.get(device, 1.0)
+    return memory_mb
+
+
+def _resolve_device(use_gpu):
+    """GPU 사용 여부로 실제 장치를 결정합니다"""
+    if not use_gpu:
+        return "cpu"
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+class _PoolEntry:
+    """풀에 올라간 변환기 하나"""
+    
+    def __init__(self, converter, device, memory_mb, load_seconds):
+        self.converter = converter
+        self.device = device
+        self.memory_mb = memory_mb
+        self.load_seconds = load_seconds
+        self.hits = 0
+        # lease()로 빌려 쓰는 중인 작업 수 (0보다 크면 풀에서 내리지 않음)
+        self.users = 0
+
+
+class ModelPool:
+    """
+    여러 세션이 공유하는 모델 웜 풀 (메모리 예산 + LRU 삭제)
+    
+    같은 (모델 크기, GPU 사용, 엔진) 조합은 한 번만 로드하고, 새 모델을 올릴 때
+    장치별 예산(RAM/VRAM)을 넘으면 가장 오래 사용하지 않은 모델부터 내립니다.
+    변환에 쓰는 동안은 lease()로 빌려서 다른 세션의 로드가 모델을 내리지 못하게 합니다.
+    """
+    
+    def __init__(self, converter_factory, ram_budget_mb=DEFAULT_RAM_BUDGET_MB, vram_budget_mb=DEFAULT_VRAM_BUDGET_MB):
+        """
+        초기화
+        
+        Args:
+            converter_factory (function): (model_size, use_gpu, backend)를 받아 VideoToTextConverter를 만드는 함수
+            ram_budget_mb (float): CPU 모델 메모리 예산 (MB)
+            vram_budget_mb (float): GPU 모델 메모리 예산 (MB)
+        """
+        self.converter_factory = converter_factory
+        self.budgets = {
+            "cpu": ram_budget_mb,
+            "cuda": vram_budget_mb
+        }
+        self._entries = OrderedDict()
+        self._loading_locks = {}
+        self._decode_locks = {}
+        self._lock = threading.Lock()
+        
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.prefetches = 0
+        self.total_load_seconds = 0.0
+    
+    def get(self, model_size, use_gpu=True, backend=BACKEND_WHISPER):
+        """
+        로드된 변환기를 반환합니다 (없으면 예산에 맞춰 로드)
+        
+        반환된 변환기는 다른 모델을 로드할 때 내려질 수 있으므로, 변환에 쓸 때는 lease()를 사용합니다.
+        
+        Args:
+            model_size (str): 모델 크기
+            use_gpu (bool): GPU 사용 여부
+            backend (str): 음성 인식 엔진 이름
+        
+        Returns:
+            VideoToTextConverter: 모델이 로드된 변환기
+        """
+        return self._checkout((model_size, use_gpu, backend), pin=False).converter
+    
+    @contextmanager
+    def lease(self, model_size, use_gpu=True, backend=BACKEND_WHISPER):
+        """
+        변환기를 빌려 with 블록 안에서 사용합니다 (블록이 끝날 때까지 풀에서 내리지 않음)
+        
+        Args:
+            model_size (str): 모델 크기
+            use_gpu (bool): GPU 사용 여부
+            backend (str): 음성 인식 엔진 이름
+        
+        Yields:
+            VideoToTextConverter: 모델이 로드된 변환기
+        """
+        entry = self._checkout((model_size, use_gpu, backend), pin=True)
+        try:
+            yield entry.converter
+        finally:
+            with self._lock:
+                entry.users -= 1
+    
+    def _checkout(self, key, pin):
+        """
+        풀의 항목을 반환합니다 (없으면 로드, pin이면 같은 lock 안에서 사용 중으로 표시)
+        
+        Returns:
+            _PoolEntry: 풀 항목
+        """
+        model_size, use_gpu, backend = key
+        
+        with self._lock:
+            entry = self._touch(key, pin)
+            if entry is not None:
+                return entry
+            loading_lock = self._loading_locks.setdefault(key, threading.Lock())
+        
+        # 같은 모델을 여러 세션이 동시에 요청해도 한 번만 로드
+        with loading_lock:
+            try:
+                with self._lock:
+                    entry = self._touch(key, pin)
+                    if entry is not None:
+                        return entry
+                    self.misses += 1
+                    
+                    # 로드 전에 자리를 먼저 비움 (로드 중 메모리 초과 방지)
+                    device = _resolve_device(use_gpu)
+                    memory_mb = estimate_model_memory_mb(model_size, backend, device)
+                    evicted = self._evict(device, memory_mb)
+                self._close_evicted(device, evicted)
+                
+                start_time = time.time()
+                converter = self.converter_factory(model_size, use_gpu, backend)
+                loaded_backend = converter.load_model()
+                load_seconds = time.time() - start_time
+                
+                # 실제로 만들어진 엔진 기준으로 다시 계산 (faster-whisper가 없으면 openai-whisper로 대체됨)
+                device = loaded_backend.device
+                memory_mb = estimate_model_memory_mb(model_size, loaded_backend.name, device)
+                
+                with self._lock:
+                    evicted = self._evict(device, memory_mb)
+                    entry = _PoolEntry(converter, device, memory_mb, load_seconds)
+                    if pin:
+                        entry.users += 1
+                    self._entries[key] = entry
+                    self.total_load_seconds += load_seconds
+                self._close_evicted(device, evicted)
+            finally:
+                # 로드에 실패해도 '로드 중' 표시를 지워 다음 요청이 다시 시도할 수 있게 함
+                with self._lock:
+                    if self._loading_locks.get(key) is loading_lock:
+                        del self._loading_locks[key]
+            
+            print(f"Model pool: loaded {model_size} ({loaded_backend.name}, {device}) in {load_seconds:.1f}s, "
+                  f"~{memory_mb:.0f}MB, {self.used_memory_mb(device):.0f}/{self.budgets.get(device, 0):.0f}MB used")
+            return entry
+    
+    def prefetch(self, model_size, use_gpu=True, backend=BACKEND_WHISPER):
+        """
+        모델을 백그라운드 스레드에서 미리 로드합니다
+        (로드 중에 같은 모델로 get()을 호출하면 새로 로드하지 않고 진행 중인 로드를 기다림)
+        
+        Args:
+            model_size (str): 모델 크기
+            use_gpu (bool): GPU 사용 여부
+            backend (str): 음성 인식 엔진 이름
+        
+        Returns:
+            bool: 새로 로드를 시작했는지 여부 (이미 로드되었거나 로드 중이면 False)
+        """
+        key = (model_size, use_gpu, backend)
+        with self._lock:
+            if key in self._entries or key in self._loading_locks:
+                return False
+            self.prefetches += 1
+        
+        threading.Thread(target=self._prefetch, args=key, name=f"videoscribe-prefetch-{model_size}", daemon=True).start()
+        return True
+    
+    def _prefetch(self, model_size, use_gpu, backend):
+        try:
+            self.get(model_size, use_gpu, backend)
+        except Exception as e:
+            # 실패해도 작업 시작 시 다시 로드하면서 오류를 보고함
+            print(f"Model pool: prefetch of {model_size} ({backend}) failed: {e}")
+    
+    def is_loaded(self, model_size, use_gpu=True, backend=BACKEND_WHISPER):
+        """모델이 풀에 로드되어 있는지 확인합니다"""
+        with self._lock:
+            return (model_size, use_gpu, backend) in self._entries
+    
+    def decode_lock(self, model_size, use_gpu=True, backend=BACKEND_WHISPER):
+        """
+        같은 모델로의 변환을 한 번에 하나로 제한하는 lock을 반환합니다
+        (openai-whisper는 디코딩 중 모델에 kv-cache hook을 걸므로 동시 디코딩 불가)
+        """
+        with self._lock:
+            return self._decode_locks.setdefault((model_size, use_gpu, backend), threading.Lock())
+    
+    def _touch(self, key, pin=False):
+        """캐시 적중 시 LRU 순서를 갱신하고 항목을 반환합니다 (lock 안에서 호출)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        entry.hits += 1
+        self.hits += 1
+        if pin:
+            entry.users += 1
+        return entry
+    
+    def _evict(self, device, required_mb):
+        """
+        장치 예산 안에 required_mb가 들어갈 때까지 오래된 모델을 풀에서 뺍니다 (lock 안에서 호출)
+        
+        lease()로 사용 중인 모델은 건너뛰고, 뺀 모델의 해제는 lock 밖에서 _close_evicted로 합니다.
+        
+        Returns:
+            list: 풀에서 뺀 (key, _PoolEntry) 목록
+        """
+        budget = self.budgets.get(device)
+        if budget is None:
+            return []
+        
+        evicted = []
+        for key in list(self._entries):
+            if self.used_memory_mb(device) + required_mb <= budget:
+                break
+            entry = self._entries[key]
+            if entry.device != device or entry.users:
+                continue
+            del self._entries[key]
+            evicted.append((key, entry))
+            self.evictions += 1
+        
+        if self.used_memory_mb(device) + required_mb > budget:
+            print(f"Model pool: ~{required_mb:.0f}MB exceeds the {device} budget of {budget:.0f}MB "
+                  f"(models in use stay loaded)")
+        return evicted
+    
+    def _close_evicted(self, device, evicted):
+        """풀에서 뺀 모델을 해제합니다"""
+        for key, entry in evicted:
+            print(f"Model pool: evicted {key[0]} ({key[2]}, {entry.device}), freed ~{entry.memory_mb:.0f}MB")
+            entry.converter.close()
+        
+        if evicted:
+            self._release_memory(device)
+    
+    def _release_memory(self, device):
+        """내린 모델의 메모리를 실제로 반환합니다"""
+        gc.collect()
+        if device == "cuda":
+            try:
+                import torch
+                torch.cuda.empty_cache()
+            except ImportError:
+                pass
+    
+    def used_memory_mb(self, device):
+        """장치별 풀이 사용 중인 예상 메모리 (MB)"""
+        return sum(entry.memory_mb for entry in self._entries.values() if entry.device == device)
+    
+    def clear(self):
+        """풀의 모든 모델을 내립니다"""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            entry.converter.close()
+        self._release_memory("cuda")
+    
+    def stats(self):
+        """
+        풀 통계를 반환합니다
+        
+        Returns:
+            dict: hits, misses, evictions, prefetches, hit_rate, total_load_seconds, models
+        """
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'prefetches': self.prefetches,
+                'hit_rate': self.hits / requests if requests else 0.0,
+                'total_load_seconds': self.total_load_seconds,
+                'memory_mb': {device: self.used_memory_mb(device) for device in self.budgets},
+                'budget_mb': dict(self.budgets),
+                'models': [
+                    {
+                        'model_size': key[0],
+                        'use_gpu': key[1],
+                        'backend': key[2],
+                        'device': entry.device,
+                        'memory_mb': entry.memory_mb,
+                        'load_seconds': entry.load_seconds,
+                        'hits': entry.hits,
+                        'in_use': entry.users
+                    }
+                    for key, entry in self._entries.items()
+                ]
+            }
@@ -0,0 +1,173 @@
+"""
+병렬 청크 변환 모듈
+Parallel Chunked Transcription Module
+"""
+
+import os
+import itertools
+
+from .audio_utils import SAMPLE_RATE, split_audio_on_silence
+from .backends import BACKEND_WHISPER, create_backend
+
+# 워커 프로세스별로 한 번만 로드되는 엔진
+_worker_backend = None
+
+
+def _init_worker(backend_name, model_size, threads_per_worker):
+    """워커 프로세스 초기화 - 음성 인식 엔진을 CPU에 로드합니다"""
+    global _worker_backend
+    
+    # 워커끼리 코어를 나눠 쓰도록 스레드 수 제한
+    _worker_backend = create_backend(backend_name, model_size, "cpu", cpu_threads=threads_per_worker).load()
+
+
+def _transcribe_chunk(chunk_audio, offset_seconds, options):
+    """
+    하나의 오디오 청크를 변환하고 타임스탬프를 원본 기준으로 보정합니다
+    
+    Args:
+        chunk_audio (numpy.ndarray): 청크 오디오
+        offset_seconds (float): 원본 오디오에서의 청크 시작 시간
+        options (dict): 엔진 transcribe 옵션 (language, task)
+    
+    Returns:
+        dict: 청크 결과 (text, language, segments)
+    """
+    result = _worker_backend.transcribe(chunk_audio, **options)
+    
+    segments = []
+    for segment in result.get("segments", []):
+        segment = dict(segment)
+        segment["start"] = segment["start"] + offset_seconds
+        segment["end"] = segment["end"] + offset_seconds
+        segments.append(segment)
+    
+    return {
+        'text': result.get("text", ""),
+        'language': result.get("language"),
+        'segments': segments
+    }
+
+
+class ParallelTranscriber:
+    """무음 경계로 나눈 청크를 여러 CPU 워커 프로세스에서 병렬 변환하는 클래스"""
+    
+    def __init__(self, model_size="base", max_workers=None, chunk_seconds=30.0, backend=BACKEND_WHISPER):
+        """
+        초기화
+        
+        Args:
+            model_size (str): Whisper 모델 크기
+            backend (str): 음성 인식 엔진 이름
+            max_workers (int): 워커 프로세스 수 (None이면 CPU 코어 수 기반)
+            chunk_seconds (float): 청크 최대 길이 (초)
+        """
+        cpu_count = os.cpu_count() or 1
+        self.model_size = model_size
+        self.backend = backend
+        self.max_workers = max_workers or max(1, min(4, cpu_count // 2))
+        self.threads_per_worker = max(1, cpu_count // self.max_workers)
+        self.chunk_seconds = chunk_seconds
+        self._executor = None
+    
+    def _get_executor(self):
+        """워커 풀을 생성합니다 (한 번 로드된 모델은 다음 작업에서도 재사용)"""
+        if self._executor is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            
+            # torch가 이미 로드된 프로세스에서 fork하면 멈출 수 있으므로 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.backend, self.model_size, self.threads_per_worker)
+            )
+        return self._executor
+    
+    def iter_transcribe(self, audio, language=None, task="transcribe", progress_callback=None):
+        """
+        오디오를 청크로 나눠 병렬로 변환하고 세그먼트를 원래 순서대로 내보냅니다
+        
+        Args:
+            audio (numpy.ndarray): 16kHz 모노 float32 오디오
+            language (str): 언어 코드, None이면 첫 청크에서 자동 감지
+            task (str): Whisper task (transcribe, translate)
+            progress_callback (function): 진행률 콜백 (완료 청크 수, 전체 청크 수)
+            
+        Returns:
+            tuple: (언어 코드, 세그먼트 dict 제너레이터)
+        """
+        chunks = split_audio_on_silence(audio, SAMPLE_RATE, target_seconds=self.chunk_seconds)
+        executor = self._get_executor()
+        
+        options = {
+            "task": task
+        }
+        
+        def submit(index):
+            start, end = chunks[index]
+            return executor.submit(_transcribe_chunk, audio[start:end], start / SAMPLE_RATE, options)
+        
+        if language:
+            options["language"] = language
+        
+        # 언어가 없으면 첫 청크로 감지한 뒤 나머지 청크에 고정 (청크마다 언어가 달라지는 것 방지)
+        first_result = None
+        if language is None:
+            first_result = submit(0).result()
+            language = first_result['language']
+            if language:
+                options["language"] = language
+        
+        futures = [submit(index) for index in range(1 if first_result else 0, len(chunks))]
+        
+        def generate():
+            # 완료 순서와 관계없이 원래 청크 순서대로 결과를 꺼냄
+            ordered_results = itertools.chain(
+                [first_result] if first_result else [],
+                (future.result() for future in futures)
+            )
+            segment_id = 0
+            try:
+                for done, chunk_result in enumerate(ordered_results, 1):
+                    if progress_callback:
+                        progress_callback(done, len(chunks))
+                    # 세그먼트 id 재부여
+                    for segment in chunk_result['segments']:
+                        segment["id"] = segment_id
+                        segment_id += 1
+                        yield segment
+            finally:
+                # 소비자가 중간에 멈추면 남은 청크 취소
+                for future in futures:
+                    future.cancel()
+        
+        return language, generate()
+    
+    def transcribe(self, audio, language=None, task="transcribe", progress_callback=None):
+        """
+        오디오를 청크로 나눠 병렬로 변환하고 결과를 합칩니다
+        
+        Args:
+            audio (numpy.ndarray): 16kHz 모노 float32 오디오
+            language (str): 언어 코드, None이면 첫 청크에서 자동 감지
+            task (str): Whisper task (transcribe, translate)
+            progress_callback (function): 진행률 콜백 (완료 청크 수, 전체 청크 수)
+            
+        Returns:
+            dict: model.transcribe와 같은 형태의 결과 (text, language, segments)
+        """
+        language, segments_iter = self.iter_transcribe(audio, language, task, progress_callback)
+        segments = list(segments_iter)
+        return {
+            'text': "".join(segment['text'] for segment in segments),
+            'language': language,
+            'segments': segments
+        }
+    
+    def close(self):
+        """워커 풀을 종료합니다"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,180 @@
+"""
+진행률 이벤트 모듈
+Progress Event Module
+"""
+
+import inspect
+import time
+
+# 처리 단계
+STAGE_VALIDATE = "validate"
+STAGE_DOWNLOAD = "download"
+STAGE_EXTRACT = "extract"
+STAGE_LOAD_MODEL = "load_model"
+STAGE_TRANSCRIBE = "transcribe"
+STAGE_FINALIZE = "finalize"
+
+# 콜백 호출 방식
+_MODE_EVENT = "event"      # callback(event)
+_MODE_TWO = "two"          # callback(value, message)
+_MODE_THREE = "three"      # callback(value, message, details)
+_MODE_KWARGS = "kwargs"    # callback(value, message, download_details=..., processing_details=..., tech_details=...)
+
+
+class ProgressEvent:
+    """구조화된 진행률 이벤트"""
+    
+    def __init__(self, stage, percent, message="", fraction=None, elapsed=0.0, eta=None,
+                 audio_seconds=None, audio_total=None, download_details="", processing_details="", tech_details=""):
+        """
+        초기화
+        
+        Args:
+            stage (str): 처리 단계 (download, extract, load_model, transcribe, finalize 등)
+            percent (float): 전체 진행률 (0~100)
+            message (str): 상태 메시지
+            fraction (float): 현재 단계 진행률 (0.0~1.0, 모르면 None)
+            elapsed (float): 작업 시작 후 경과 시간 (초)
+            eta (float): 현재 단계 남은 시간 추정 (초, 모르면 None)
+            audio_seconds (float): 디코딩 완료된 오디오 길이 (초)
+            audio_total (float): 전체 오디오 길이 (초)
+        """
+        self.stage = stage
+        self.percent = percent
+        self.message = message
+        self.fraction = fraction
+        self.elapsed = elapsed
+        self.eta = eta
+        self.audio_seconds = audio_seconds
+        self.audio_total = audio_total
+        self.download_details = download_details
+        self.processing_details = processing_details
+        self.tech_details = tech_details
+    
+    def to_dict(self):
+        """JSON 직렬화용 dict로 변환합니다"""
+        return dict(self.__dict__)
+    
+    def __repr__(self):
+        return f"ProgressEvent(stage={self.stage!r}, percent={self.percent:.1f}, message={self.message!r})"
+
+
+def _resolve_mode(callback):
+    """콜백 시그니처를 한 번만 확인하여 호출 방식을 정합니다"""
+    try:
+        parameters = inspect.signature(callback).parameters.values()
+    except (TypeError, ValueError):
+        return _MODE_TWO
+    
+    if any(p.kind == p.VAR_KEYWORD for p in parameters):
+        return _MODE_KWARGS
+    
+    positional = [p for p in parameters if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+    has_var_positional = any(p.kind == p.VAR_POSITIONAL for p in parameters)
+    
+    if len(positional) >= 5:
+        return _MODE_KWARGS
+    if len(positional) >= 3 or has_var_positional:
+        return _MODE_THREE
+    if len(positional) == 1:
+        return _MODE_EVENT
+    return _MODE_TWO
+
+
+class ProgressReporter:
+    """
+    진행률 이벤트를 만들어 콜백에 전달하는 클래스
+    
+    인자가 1개인 콜백은 ProgressEvent를 받고, 기존 콜백은 (value, message, ...) 형식으로 받습니다.
+    """
+    
+    def __init__(self, callback=None):
+        """
+        초기화
+        
+        Args:
+            callback (function): 진행률 콜백 (None이면 아무것도 하지 않음)
+        """
+        self.callback = callback
+        self.mode = _resolve_mode(callback) if callback else None
+        self.start_time = time.time()
+        self.last_percent = 0
+        self._stage_start = {}
+    
+    @classmethod
+    def wrap(cls, callback):
+        """콜백을 ProgressReporter로 감쌉니다 (이미 감싼 경우 그대로 반환)"""
+        if isinstance(callback, cls):
+            return callback
+        return cls(callback)
+    
+    def __bool__(self):
+        return self.callback is not None
+    
+    def __call__(self, value, message, **kwargs):
+        """기존 (value, message, **details) 호출 방식 호환"""
+        self.emit(kwargs.pop('stage', None), value, message, **kwargs)
+    
+    def emit(self, stage, percent, message="", fraction=None, eta=None, audio_seconds=None, audio_total=None,
+             download_details="", processing_details="", tech_details=""):
+        """
+        진행률 이벤트를 발생시킵니다
+        
+        Args:
+            stage (str): 처리 단계
+            percent (float): 전체 진행률 (0~100)
+            message (str): 상태 메시지
+            fraction (float): 현재 단계 진행률 (0.0~1.0)
+            eta (float): 남은 시간 (초, None이면 단계 진행률로 추정)
+            audio_seconds (float): 디코딩 완료된 오디오 길이 (초)
+            audio_total (float): 전체 오디오 길이 (초)
+        
+        Returns:
+            ProgressEvent: 발생한 이벤트 (콜백이 없으면 None)
+        """
+        if self.callback is None:
+            return None
+        
+        now = time.time()
+        if stage and stage not in self._stage_start:
+            self._stage_start[stage] = now
+        
+        # 단계 진행률로 남은 시간 추정
+        if eta is None and stage and fraction:
+            stage_elapsed = now - self._stage_start[stage]
+            eta = stage_elapsed * (1.0 - fraction) / fraction
+        
+        self.last_percent = percent
+        event = ProgressEvent(stage or "", percent, message, fraction=fraction, elapsed=now - self.start_time,
+                              eta=eta, audio_seconds=audio_seconds, audio_total=audio_total,
+                              download_details=download_details, processing_details=processing_details,
+                              tech_details=tech_details)
+        self._dispatch(event)
+        return event
+    
+    def _dispatch(self, event):
+        """호출 방식에 맞춰 콜백을 실행합니다 (콜백 오류가 작업을 멈추지 않도록)"""
+        try:
+            if self.mode == _MODE_EVENT:
+                self.callback(event)
+            elif self.mode == _MODE_KWARGS:
+                self.callback(event.percent, event.message,
+                              download_details=event.download_details,
+                              processing_details=event.processing_details,
+                              tech_details=event.tech_details)
+            elif self.mode == _MODE_THREE:
+                self.callback(event.percent, event.message, event.download_details or event.processing_details)
+            else:
+                self.callback(event.percent, event.message)
+        except Exception as e:
+            print(f"Progress callback error: {e}")
+
+
+def format_seconds(seconds):
+    """초를 짧은 시간 문자열로 변환합니다 (예: 45s, 3m12s)"""
+    if seconds is None:
+        return "N/A"
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    minutes = seconds // 60
+    return f"{minutes:.0f}m{seconds % 60:.0f}s"
@@ -0,0 +1,135 @@
+"""
+시작 시간 최적화 모듈
+Startup Import Prefetch Module
+"""
+
+import time
+import threading
+import importlib
+
+# UI 표시에는 필요 없지만 첫 변환에 필요한 무거운 모듈 (가져오는 순서대로)
+HEAVY_MODULES = ("torch", "whisper", "yt_dlp")
+
+_prefetcher = None
+_prefetcher_lock = threading.Lock()
+
+
+class ImportPrefetcher:
+    """무거운 모듈을 백그라운드 스레드에서 미리 import하고 소요 시간을 기록하는 클래스"""
+    
+    def __init__(self, modules=HEAVY_MODULES):
+        """
+        초기화
+        
+        Args:
+            modules (tuple): 미리 가져올 모듈 이름 목록
+        """
+        self.modules = tuple(modules)
+        self.timings = {}
+        self.errors = {}
+        self._done = threading.Event()
+        self._thread = None
+    
+    def start(self):
+        """백그라운드 import를 시작합니다 (이미 시작했으면 무시)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="videoscribe-prefetch", daemon=True)
+            self._thread.start()
+        return self
+    
+    def _run(self):
+        try:
+            for name in self.modules:
+                start_time = time.perf_counter()
+                try:
+                    importlib.import_module(name)
+                except Exception as e:
+                    # 선택 의존성이 없어도 앱은 동작해야 함
+                    self.errors[name] = str(e)
+                self.timings[name] = time.perf_counter() - start_time
+        finally:
+            self._done.set()
+            self.report()
+    
+    @property
+    def done(self):
+        return self._done.is_set()
+    
+    def wait(self, timeout=None):
+        """
+        백그라운드 import가 끝날 때까지 기다립니다
+        
+        Returns:
+            bool: 완료 여부
+        """
+        return self._done.wait(timeout)
+    
+    def report(self):
+        """모듈별 import 시간을 출력합니다"""
+        parts = []
+        for name in self.modules:
+            if name in self.timings:
+                status = " (unavailable)" if name in self.errors else ""
+                parts.append(f"{name} {self.timings[name]:.2f}s{status}")
+        total = sum(self.timings.values())
+        print(f"Startup prefetch: {', '.join(parts)} - total {total:.2f}s")
+
+
+def prefetch_heavy_imports(modules=HEAVY_MODULES):
+    """
+    프로세스당 한 번만 무거운 모듈의 백그라운드 import를 시작합니다
+    
+    Args:
+        modules (tuple): 미리 가져올 모듈 이름 목록
+    
+    Returns:
+        ImportPrefetcher: 공유 prefetcher
+    """
+    global _prefetcher
+    with _prefetcher_lock:
+        if _prefetcher is None:
+            _prefetcher = ImportPrefetcher(modules).start()
+        return _prefetcher
+
+
+def cuda_available(wait=True):
+    """
+    GPU(CUDA) 사용 가능 여부를 반환합니다 (torch를 필요할 때만 import)
+    
+    Args:
+        wait (bool): torch가 아직 로드 중이면 기다릴지 여부
+    
+    Returns:
+        bool: 사용 가능 여부 (wait=False이고 아직 모르면 None)
+    """
+    # 백그라운드 import 중이면 UI를 막지 않고 '아직 모름'을 반환
+    prefetcher = _prefetcher
+    if not wait and prefetcher is not None and not prefetcher.done:
+        return None
+    
+    try:
+        import torch
+    except ImportError:
+        return False
+    return torch.cuda.is_available()
+
+
+def get_package_version(distribution, default="Not installed"):
+    """
+    패키지를 import하지 않고 설치된 버전을 읽습니다
+    
+    Args:
+        distribution (str): 배포 이름 (예: 'yt-dlp')
+        default (str): 설치되지 않았을 때 반환할 값
+    
+    Returns:
+        str: 버전 문자열
+    """
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        return default
+    try:
+        return version(distribution)
+    except PackageNotFoundError:
+        return default
@@ -0,0 +1,310 @@
+"""
+자막 내보내기 모듈
+Subtitle Export Module
+"""
+
+import io
+import os
+import json
+
+from .transcript_cache import _json_default
+
+# 지원하는 출력 형식 (확장자)
+SUBTITLE_FORMATS = ("txt", "srt", "vtt", "tsv", "json")
+
+# 다운로드/HTTP 응답용 MIME 타입
+SUBTITLE_MIME_TYPES = {
+    "txt": "text/plain",
+    "srt": "application/x-subrip",
+    "vtt": "text/vtt",
+    "tsv": "text/tab-separated-values",
+    "json": "application/json"
+}
+
+
+def format_timestamp(seconds, decimal_marker=","):
+    """
+    초를 자막 타임스탬프로 변환합니다
+    
+    Args:
+        seconds (float): 시간 (초)
+        decimal_marker (str): 밀리초 구분자 (SRT는 ',', WebVTT는 '.')
+    
+    Returns:
+        str: 'HH:MM:SS,mmm' 형식 문자열
+    """
+    milliseconds = int(round(max(0.0, seconds) * 1000))
+    hours, milliseconds = divmod(milliseconds, 3600000)
+    minutes, milliseconds = divmod(milliseconds, 60000)
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}{decimal_marker}{milliseconds:03d}"
+
+
+def parse_formats(formats):
+    """
+    출력 형식 목록을 정리합니다
+    
+    Args:
+        formats (str or list): 'srt,vtt' 같은 쉼표 구분 문자열 또는 형식 목록
+    
+    Returns:
+        tuple: 중복을 제거한 형식 목록 (입력 순서 유지)
+    """
+    if isinstance(formats, str):
+        formats = formats.split(",")
+    parsed = []
+    for name in formats or ():
+        name = name.strip().lower().lstrip(".")
+        if not name:
+            continue
+        if name not in SUBTITLE_FORMATS:
+            raise ValueError(f"Unsupported subtitle format: {name} / 지원하지 않는 자막 형식입니다: {name}")
+        if name not in parsed:
+            parsed.append(name)
+    return tuple(parsed)
+
+
+class CueWriter:
+    """세그먼트를 받는 즉시 텍스트 스트림에 한 항목씩 쓰는 기본 클래스 (전체 텍스트를 모으지 않음)"""
+    
+    def __init__(self, stream):
+        """
+        초기화
+        
+        Args:
+            stream (file): 쓰기용 텍스트 스트림
+        """
+        self.stream = stream
+        self.count = 0
+    
+    def begin(self):
+        """머리말을 씁니다"""
+    
+    def write(self, segment):
+        """
+        세그먼트 하나를 씁니다
+        
+        Args:
+            segment (dict): start, end, text를 가진 세그먼트
+        """
+        text = segment.get('text', "").strip()
+        if not text:
+            return
+        self.count += 1
+        self.write_cue(segment, text)
+    
+    def write_cue(self, segment, text):
+        raise NotImplementedError
+    
+    def end(self, language=None):
+        """
+        맺음말을 씁니다
+        
+        Args:
+            language (str): 감지된 언어 코드
+        """
+
+
+class TextCueWriter(CueWriter):
+    """세그먼트마다 한 줄씩 쓰는 텍스트 형식"""
+    
+    def write_cue(self, segment, text):
+        self.stream.write(f"{text}\n")
+
+
+class SrtCueWriter(CueWriter):
+    """SubRip (.srt) 형식"""
+    
+    def write_cue(self, segment, text):
+        start = format_timestamp(segment['start'])
+        end = format_timestamp(segment['end'])
+        self.stream.write(f"{self.count}\n{start} --> {end}\n{text.replace('-->', '->')}\n\n")
+
+
+class VttCueWriter(CueWriter):
+    """WebVTT (.vtt) 형식"""
+    
+    def begin(self):
+        self.stream.write("WEBVTT\n\n")
+    
+    def write_cue(self, segment, text):
+        start = format_timestamp(segment['start'], ".")
+        end = format_timestamp(segment['end'], ".")
+        self.stream.write(f"{start} --> {end}\n{text.replace('-->', '->')}\n\n")
+
+
+class TsvCueWriter(CueWriter):
+    """탭 구분 (.tsv) 형식 (시작/끝은 밀리초 정수)"""
+    
+    def begin(self):
+        self.stream.write("start\tend\ttext\n")
+    
+    def write_cue(self, segment, text):
+        start = int(round(segment['start'] * 1000))
+        end = int(round(segment['end'] * 1000))
+        text = " ".join(text.split())
+        self.stream.write(f"{start}\t{end}\t{text}\n")
+
+
+class JsonCueWriter(CueWriter):
+    """JSON (.json) 형식 - 세그먼트 배열을 한 항목씩 쓰고 마지막에 언어를 붙임"""
+    
+    def begin(self):
+        self.stream.write('{"segments": [')
+    
+    def write(self, segment):
+        # 텍스트가 없는 세그먼트도 원본 그대로 보존
+        self.stream.write(",\n" if self.count else "\n")
+        self.stream.write(json.dumps(segment, ensure_ascii=False, default=_json_default))
+        self.count += 1
+    
+    def end(self, language=None):
+        self.stream.write(f"\n], \"language\": {json.dumps(language)}}}\n")
+
+
+CUE_WRITERS = {
+    "txt": TextCueWriter,
+    "srt": SrtCueWriter,
+    "vtt": VttCueWriter,
+    "tsv": TsvCueWriter,
+    "json": JsonCueWriter
+}
+
+
+class SubtitleWriter:
+    """
+    변환 중에 세그먼트가 나올 때마다 여러 형식의 자막 파일에 이어 쓰는 클래스
+    
+    write_segment를 segment_callback으로 넘기면 긴 변환도 자막 전체를 메모리에 만들지 않고
+    디코딩된 만큼 파일에 기록됩니다.
+    """
+    
+    def __init__(self, output_dir, base_name, formats=("srt",)):
+        """
+        초기화 (형식마다 '<base_name>.<형식>' 파일을 엶)
+        
+        Args:
+            output_dir (str): 출력 디렉토리 (없으면 생성)
+            base_name (str): 확장자를 뺀 파일 이름
+            formats (str or list): 출력 형식 목록
+        """
+        self.paths = {}
+        self._files = []
+        self._writers = []
+        os.makedirs(output_dir, exist_ok=True)
+        try:
+            for name in parse_formats(formats):
+                path = os.path.join(output_dir, f"{base_name}.{name}")
+                stream = open(path, 'w', encoding='utf-8')
+                self.paths[name] = path
+                self._files.append(stream)
+                writer = CUE_WRITERS[name](stream)
+                writer.begin()
+                self._writers.append(writer)
+        except BaseException:
+            self.abort()
+            raise
+    
+    def write_segment(self, segment):
+        """
+        세그먼트 하나를 모든 형식에 씁니다 (이미 쓴 항목은 바로 디스크로 내보냄)
+        
+        Args:
+            segment (dict): start, end, text를 가진 세그먼트
+        """
+        for writer in self._writers:
+            writer.write(segment)
+        for stream in self._files:
+            stream.flush()
+    
+    def close(self, language=None):
+        """
+        맺음말을 쓰고 파일을 닫습니다
+        
+        Args:
+            language (str): 감지된 언어 코드
+        
+        Returns:
+            dict: 형식별 저장 경로
+        """
+        try:
+            for writer in self._writers:
+                writer.end(language)
+        finally:
+            for stream in self._files:
+                stream.close()
+            self._writers = []
+            self._files = []
+        return dict(self.paths)
+    
+    def abort(self):
+        """변환이 실패했을 때 파일을 닫고 쓰다 만 자막을 삭제합니다"""
+        for stream in self._files:
+            try:
+                stream.close()
+            except OSError:
+                pass
+        for path in self.paths.values():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        self._writers = []
+        self._files = []
+        self.paths = {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+
+def write_subtitles(segments, output_dir, base_name, formats=("srt",), language=None):
+    """
+    이미 끝난 변환 결과의 세그먼트로 자막 파일을 씁니다
+    
+    Args:
+        segments (list): 세그먼트 목록
+        output_dir (str): 출력 디렉토리
+        base_name (str): 확장자를 뺀 파일 이름
+        formats (str or list): 출력 형식 목록
+        language (str): 감지된 언어 코드
+    
+    Returns:
+        dict: 형식별 저장 경로
+    """
+    writer = SubtitleWriter(output_dir, base_name, formats)
+    try:
+        for segment in segments:
+            writer.write_segment(segment)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.close(language)
+
+
+def render_subtitles(segments, format_name, language=None):
+    """
+    세그먼트를 자막 문자열로 만듭니다 (다운로드 버튼/HTTP 응답용)
+    
+    Args:
+        segments (list): 세그먼트 목록
+        format_name (str): 출력 형식 (txt, srt, vtt, tsv, json)
+        language (str): 감지된 언어 코드
+    
+    Returns:
+        str: 자막 내용
+    """
+    name, = parse_formats([format_name])
+    stream = io.StringIO()
+    writer = CUE_WRITERS[name](stream)
+    writer.begin()
+    for segment in segments:
+        writer.write(segment)
+    writer.end(language)
+    return stream.getvalue()
@@ -0,0 +1,156 @@
+"""
+변환 결과 캐시 모듈
+Transcript Cache Module
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+
+
+def _default_cache_dir():
+    """기본 캐시 디렉토리를 반환합니다 / Return default cache directory"""
+    return os.path.join(os.path.expanduser("~"), ".videoscribe", "transcript_cache")
+
+
+def _json_default(value):
+    """NumPy 스칼라 등 JSON 기본 지원 밖의 값을 변환합니다"""
+    if hasattr(value, 'item'):
+        return value.item()
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+def hash_audio(audio):
+    """
+    디코딩된 오디오 샘플의 해시를 계산합니다
+    
+    Args:
+        audio (numpy.ndarray): float32 모노 오디오
+    
+    Returns:
+        str: 오디오 내용 해시 (hex)
+    """
+    import numpy as np
+    
+    # 복사 없이 버퍼를 그대로 해시
+    return hashlib.blake2b(memoryview(np.ascontiguousarray(audio)), digest_size=20).hexdigest()
+
+
+class TranscriptCache:
+    """디스크 기반 변환 결과 캐시 (크기 제한 + LRU 삭제)"""
+    
+    def __init__(self, cache_dir=None, max_size_mb=500):
+        """
+        초기화
+        
+        Args:
+            cache_dir (str): 캐시 디렉토리 (None이면 ~/.videoscribe/transcript_cache)
+            max_size_mb (int): 캐시 최대 크기 (MB)
+        """
+        self.cache_dir = cache_dir or _default_cache_dir()
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    @staticmethod
+    def make_key(source_id, model_size, language=None, task="transcribe", backend="whisper", vad=False):
+        """
+        캐시 키를 생성합니다
+        
+        Args:
+            source_id (str): 오디오 해시 또는 YouTube 영상 ID (예: 'audio:...', 'youtube:...')
+            model_size (str): Whisper 모델 크기
+            language (str): 언어 코드, None이면 자동 감지
+            task (str): Whisper task
+            backend (str): 음성 인식 엔진 이름
+            vad (bool): 무음 제거(VAD) 후 변환 여부
+        
+        Returns:
+            str: 캐시 키 (hex)
+        """
+        key_parts = [source_id, backend, model_size, language or "auto", task]
+        if vad:
+            key_parts.append("vad")
+        key_source = json.dumps(key_parts)
+        return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+    
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, key):
+        """
+        캐시된 결과를 반환합니다 (없으면 None)
+        
+        Args:
+            key (str): 캐시 키
+        
+        Returns:
+            dict: 캐시된 결과 또는 None
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+            # 접근 시간 갱신 (LRU 순서)
+            os.utime(entry_path, None)
+            return result
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Transcript cache read failed: {e}")
+            return None
+    
+    def put(self, key, result):
+        """
+        결과를 캐시에 저장하고 크기 제한을 넘으면 오래된 항목을 삭제합니다
+        
+        Args:
+            key (str): 캐시 키
+            result (dict): 저장할 결과 (JSON 직렬화 가능, 실행별 metrics는 저장하지 않음)
+        """
+        result = {key: value for key, value in result.items() if key != 'metrics'}
+        try:
+            # 임시 파일에 쓴 뒤 교체 (쓰는 도중 읽기 방지)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False, default=_json_default)
+            os.replace(temp_path, self._entry_path(key))
+        except Exception as e:
+            print(f"Transcript cache write failed: {e}")
+            try:
+                os.unlink(temp_path)
+            except Exception:
+                pass
+            return
+        
+        self._evict()
+    
+    def _evict(self):
+        """최근에 사용되지 않은 항목부터 삭제하여 크기 제한을 맞춥니다"""
+        with self._lock:
+            entries = []
+            total_size = 0
+            for filename in os.listdir(self.cache_dir):
+                if not filename.endswith(".json"):
+                    continue
+                entry_path = os.path.join(self.cache_dir, filename)
+                try:
+                    stat = os.stat(entry_path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry_path))
+                total_size += stat.st_size
+            
+            entries.sort()
+            for _, size, entry_path in entries:
+                if total_size <= self.max_size_bytes:
+                    break
+                try:
+                    os.unlink(entry_path)
+                    total_size -= size
+                except OSError:
+                    pass
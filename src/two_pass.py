@@ -0,0 +1,331 @@
+"""
+초안-보정 2단계 변환 모듈
+Two-Pass Draft and Refine Module
+"""
+
+import os
+import shutil
+
+from .audio_utils import SAMPLE_RATE, load_audio_array
+from .transcript_cache import hash_audio
+from .metrics import METRIC_EXTRACT, METRIC_DOWNLOAD, METRIC_PROBE, METRIC_LOAD_MODEL, METRIC_REFINE
+from .progress import ProgressReporter, STAGE_TRANSCRIBE, STAGE_EXTRACT
+
+# 초안에 사용할 기본 모델
+DEFAULT_DRAFT_MODEL = "tiny"
+
+# 저신뢰 세그먼트 기준 (openai-whisper의 온도 폴백 기준과 같음)
+LOW_CONFIDENCE_LOGPROB = -1.0
+HIGH_COMPRESSION_RATIO = 2.4
+
+# 보정 구간 앞뒤 여유 (초), 이 간격 이내의 저신뢰 구간은 하나로 합침, 합친 구간 최대 길이 (Whisper 윈도우)
+REFINE_PAD_SECONDS = 0.3
+REFINE_MERGE_GAP_SECONDS = 1.0
+REFINE_MAX_REGION_SECONDS = 30.0
+
+
+def is_low_confidence(segment):
+    """
+    세그먼트를 큰 모델로 다시 디코딩해야 하는지 판단합니다
+    
+    Args:
+        segment (dict): Whisper 세그먼트 (avg_logprob, compression_ratio)
+    
+    Returns:
+        bool: 평균 로그 확률이 낮거나 압축률이 높으면(반복) True
+    """
+    avg_logprob = segment.get('avg_logprob')
+    compression_ratio = segment.get('compression_ratio')
+    return ((avg_logprob is not None and avg_logprob < LOW_CONFIDENCE_LOGPROB)
+            or (compression_ratio is not None and compression_ratio > HIGH_COMPRESSION_RATIO))
+
+
+def find_refine_regions(segments, total_seconds, pad_seconds=REFINE_PAD_SECONDS,
+                        merge_gap_seconds=REFINE_MERGE_GAP_SECONDS, max_region_seconds=REFINE_MAX_REGION_SECONDS):
+    """
+    저신뢰 세그먼트를 다시 디코딩할 오디오 구간으로 묶습니다
+    
+    여유 구간은 이웃 세그먼트의 오디오와 겹치지 않게 자르고, 가까운 구간은 Whisper 윈도우 길이까지 합칩니다.
+    합친 구간 사이의 세그먼트도 함께 교체됩니다.
+    
+    Args:
+        segments (list): 초안 세그먼트 목록 (원본 기준 시간)
+        total_seconds (float): 전체 오디오 길이 (초)
+        pad_seconds (float): 구간 앞뒤 여유 (초)
+        merge_gap_seconds (float): 이 간격 이내면 앞 구간과 합침 (초)
+        max_region_seconds (float): 합친 구간 최대 길이 (초)
+    
+    Returns:
+        list: (시작 초, 끝 초, 첫 세그먼트 번호, 마지막 세그먼트 번호) 튜플 목록
+    """
+    regions = []
+    for index, segment in enumerate(segments):
+        if not is_low_confidence(segment):
+            continue
+        
+        previous_end = segments[index - 1]['end'] if index > 0 else 0.0
+        next_start = segments[index + 1]['start'] if index + 1 < len(segments) else total_seconds
+        start = max(0.0, previous_end, segment['start'] - pad_seconds)
+        end = min(total_seconds, next_start, segment['end'] + pad_seconds)
+        if end <= start:
+            continue
+        
+        if regions:
+            region_start, region_end, first_index, _ = regions[-1]
+            if start - region_end <= merge_gap_seconds and end - region_start <= max_region_seconds:
+                regions[-1] = (region_start, max(region_end, end), first_index, index)
+                continue
+        regions.append((start, end, index, index))
+    return regions
+
+
+def splice_segments(segments, regions, refined_segments):
+    """
+    초안 세그먼트에서 보정 구간을 다시 디코딩한 세그먼트로 교체합니다
+    
+    Args:
+        segments (list): 초안 세그먼트 목록
+        regions (list): find_refine_regions 결과
+        refined_segments (list): 구간별 보정 세그먼트 목록 (원본 기준 시간)
+    
+    Returns:
+        list: 합친 세그먼트 목록 (id 재부여, 초안 세그먼트는 복사본)
+    """
+    spliced = []
+    position = 0
+    for (_, _, first_index, last_index), replacements in zip(regions, refined_segments):
+        spliced.extend(dict(segment) for segment in segments[position:first_index])
+        spliced.extend(replacements)
+        position = last_index + 1
+    spliced.extend(dict(segment) for segment in segments[position:])
+    
+    for segment_id, segment in enumerate(spliced):
+        segment['id'] = segment_id
+    return spliced
+
+
+class TwoPassTranscriber:
+    """
+    작은 모델로 초안을 먼저 만들고, 저신뢰 구간만 선택한 큰 모델로 다시 디코딩하는 클래스
+    
+    초안 세그먼트는 segment_callback으로 바로 전달되므로 수 초 안에 전체 텍스트를 볼 수 있고,
+    큰 모델은 전체 오디오 대신 저신뢰 구간만 디코딩합니다. 캐시, 지표, 다운로드는 초안 변환기를 사용합니다.
+    """
+    
+    def __init__(self, draft_converter, refine_converter, refine_model_size=None, draft_lock=None, refine_lock=None):
+        """
+        초기화
+        
+        Args:
+            draft_converter (VideoToTextConverter): 초안용 변환기 (tiny/base)
+            refine_converter (VideoToTextConverter 또는 function): 보정용 변환기,
+                함수면 초안이 끝난 뒤 호출하여 받음 (큰 모델 로드를 초안 디코딩과 겹칠 때)
+            refine_model_size (str): 보정 모델 크기 (refine_converter가 함수일 때 캐시 키/표시용)
+            draft_lock (threading.Lock): 초안 디코딩 동안 잡을 lock (공유 모델이면 ModelPool.decode_lock)
+            refine_lock (threading.Lock): 보정 디코딩 동안 잡을 lock
+        """
+        self.draft_converter = draft_converter
+        self._refine_converter = refine_converter
+        self.refine_model_size = refine_model_size or getattr(refine_converter, 'model_size', None)
+        self.draft_lock = draft_lock
+        self.refine_lock = refine_lock
+    
+    def _get_refine_converter(self):
+        """보정용 변환기를 반환합니다 (함수로 받았으면 처음 한 번 호출)"""
+        if not hasattr(self._refine_converter, 'transcribe_audio'):
+            self._refine_converter = self._refine_converter()
+        return self._refine_converter
+    
+    def transcribe_audio(self, audio, file_path, language=None, save_transcript=False, progress_callback=None,
+                         segment_callback=None, metrics=None, draft_callback=None, decode_lock=None):
+        """
+        이미 디코딩된 오디오를 초안 → 보정 순서로 변환합니다 (VideoToTextConverter.transcribe_audio와 같은 형식)
+        
+        Args:
+            audio (numpy.ndarray): 16kHz 모노 float32 오디오
+            file_path (str): 원본 파일 경로 (저장 파일 이름용)
+            language (str): 언어 코드, None이면 초안에서 감지한 언어로 보정
+            save_transcript (bool): 텍스트 파일로 저장 여부
+            progress_callback (function): 진행률 콜백 함수 (인자가 1개면 ProgressEvent를 받음)
+            segment_callback (function): 초안 세그먼트가 디코딩될 때마다 호출되는 콜백 (segment dict)
+            metrics (RunMetrics): 이어서 기록할 지표 객체 (None이면 새로 만들어 결과의 metrics에 넣음)
+            draft_callback (function): 초안이 완성되면 호출되는 콜백 (초안 결과 dict)
+            decode_lock (threading.Lock): 초안 디코딩 동안 잡을 lock (None이면 생성할 때 받은 draft_lock)
+        
+        Returns:
+            dict: 추출 결과 (transcript, detected_language, segments, refine, metrics)
+        """
+        converter = self.draft_converter
+        progress = ProgressReporter.wrap(progress_callback)
+        metrics, owns_metrics = converter._start_metrics(metrics, "audio")
+        metrics.set('draft_model', converter.model_size)
+        metrics.set('refine_model', self.refine_model_size)
+        
+        try:
+            # 최종 결과 캐시 (오디오 + 초안 모델 + 보정 모델 + 언어)
+            cache_key = None
+            if converter.transcript_cache is not None:
+                source_id = f"twopass:{self.refine_model_size}:audio:{hash_audio(audio)}"
+                cache_key = converter._get_cache_key(source_id, language)
+                cached_result = converter.transcript_cache.get(cache_key)
+                if cached_result:
+                    converter._emit_segments(cached_result.get('segments', []), segment_callback)
+                    result = converter._build_transcript_result(cached_result, file_path, save_transcript, progress)
+                    result['refine'] = cached_result.get('refine')
+                    metrics.set('cache_hit', True)
+                    converter._finish_metrics(result, metrics, owns_metrics)
+                    return result
+            
+            # 1단계: 초안 (세그먼트는 디코딩되는 즉시 전달)
+            draft = converter.transcribe_audio(audio, file_path, language, progress_callback=progress,
+                                               segment_callback=segment_callback, metrics=metrics,
+                                               decode_lock=decode_lock or self.draft_lock)
+            if draft_callback:
+                try:
+                    draft_callback(draft)
+                except Exception as e:
+                    print(f"Draft callback error: {e}")
+            
+            # 2단계: 저신뢰 구간만 큰 모델로 다시 디코딩
+            draft_segments = draft.get('segments', [])
+            total_seconds = len(audio) / SAMPLE_RATE
+            regions = find_refine_regions(draft_segments, total_seconds)
+            refine_language = language or draft.get('detected_language')
+            if refine_language == "unknown":
+                refine_language = None
+            
+            refined_seconds = sum(end - start for start, end, _, _ in regions)
+            print(f"Two-pass: refining {len(regions)} region(s), {refined_seconds:.1f}s of {total_seconds:.1f}s "
+                  f"with {self.refine_model_size}")
+            if progress:
+                progress.emit(STAGE_TRANSCRIBE, 85,
+                              f"Draft ready, refining {len(regions)} region(s) with {self.refine_model_size} / "
+                              f"초안 완료, {len(regions)}개 구간 보정 중",
+                              processing_details=f"Re-decoding {refined_seconds:.0f}s of {total_seconds:.0f}s "
+                                                 f"flagged as low-confidence")
+            
+            refined_segments = []
+            if regions:
+                with metrics.stage(METRIC_LOAD_MODEL):
+                    backend = self._get_refine_converter()._load_model()
+                clips = [audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)] for start, end, _, _ in regions]
+                with metrics.hold(self.refine_lock), metrics.stage(METRIC_REFINE):
+                    clip_results = backend.transcribe_batch(clips, language=refine_language)
+                
+                for (start, end, _, _), clip_result in zip(regions, clip_results):
+                    segments = []
+                    for segment in clip_result.get('segments', []):
+                        segment = dict(segment)
+                        segment['start'] = min(end, segment['start'] + start)
+                        segment['end'] = min(end, max(segment['start'], segment['end'] + start))
+                        segments.append(segment)
+                    refined_segments.append(segments)
+            
+            segments = splice_segments(draft_segments, regions, refined_segments)
+            metrics.set('refined_regions', len(regions))
+            metrics.set('refined_seconds', round(refined_seconds, 3))
+            metrics.set('segments', len(segments))
+            
+            result = converter._build_transcript_result({
+                'text': "".join(segment['text'] for segment in segments),
+                'language': refine_language or draft.get('detected_language', "unknown"),
+                'segments': segments
+            }, file_path, save_transcript, progress)
+            result['refine'] = {
+                'draft_model': converter.model_size,
+                'refine_model': self.refine_model_size,
+                'regions': len(regions),
+                'refined_seconds': refined_seconds,
+                'draft_transcript': draft.get('transcript', "")
+            }
+            if cache_key:
+                converter.transcript_cache.put(cache_key, result)
+            
+            converter._finish_metrics(result, metrics, owns_metrics)
+            return result
+        
+        except Exception as e:
+            converter._finish_metrics(None, metrics, owns_metrics, error=e)
+            raise
+    
+    def process_local_video_with_info(self, file_path, language=None, save_transcript=False, progress_callback=None,
+                                      segment_callback=None, metrics=None, draft_callback=None, decode_lock=None):
+        """
+        비디오 파일의 오디오를 한 번 추출하여 초안 → 보정 순서로 변환합니다
+        
+        Args:
+            file_path (str): 비디오 파일 경로
+            (나머지 인자는 transcribe_audio와 같음)
+        
+        Returns:
+            dict: 추출 결과 (transcript, detected_language, segments, refine, metrics)
+        """
+        converter = self.draft_converter
+        metrics, owns_metrics = converter._start_metrics(metrics, "local")
+        try:
+            progress = ProgressReporter.wrap(progress_callback)
+            converter._probe_local_file(file_path, metrics)
+            
+            if progress:
+                progress.emit(STAGE_EXTRACT, 60, "Extracting audio... / 오디오 추출 중...",
+                              processing_details="Decoding audio to memory via FFmpeg pipe")
+            with metrics.stage(METRIC_EXTRACT):
+                audio = load_audio_array(file_path)
+            
+            try:
+                result = self.transcribe_audio(audio, file_path, language, save_transcript, progress, segment_callback,
+                                               metrics=metrics, draft_callback=draft_callback, decode_lock=decode_lock)
+            finally:
+                del audio
+            
+            converter._finish_metrics(result, metrics, owns_metrics)
+            return result
+        
+        except Exception as e:
+            print(f"Error processing video: {e}")
+            converter._finish_metrics(None, metrics, owns_metrics, error=e)
+            raise
+    
+    def process_youtube_video(self, url, language=None, save_transcript=False, progress_callback=None,
+                              segment_callback=None, metrics=None, draft_callback=None, decode_lock=None):
+        """
+        YouTube 오디오를 내려받아 초안 → 보정 순서로 변환합니다
+        
+        Args:
+            url (str): YouTube URL
+            (나머지 인자는 transcribe_audio와 같음)
+        
+        Returns:
+            dict: 추출 결과 (transcript, detected_language, segments, refine, youtube_info, metrics)
+        """
+        converter = self.draft_converter
+        metrics, owns_metrics = converter._start_metrics(metrics, "youtube")
+        downloaded_file = None
+        try:
+            if not converter.is_youtube_url(url):
+                raise ValueError("Invalid YouTube URL / 유효하지 않은 YouTube URL입니다")
+            
+            progress = ProgressReporter.wrap(progress_callback)
+            with metrics.stage(METRIC_PROBE):
+                youtube_info = converter.get_youtube_info(url)
+            if not youtube_info:
+                raise Exception("Failed to get YouTube video info / YouTube 영상 정보를 가져올 수 없습니다")
+            
+            with metrics.stage(METRIC_DOWNLOAD):
+                downloaded_file = converter.download_youtube_video(url, progress, audio_only=True)
+            metrics.set('download_bytes', os.path.getsize(downloaded_file))
+            
+            result = self.process_local_video_with_info(downloaded_file, language, save_transcript, progress,
+                                                        segment_callback, metrics=metrics,
+                                                        draft_callback=draft_callback, decode_lock=decode_lock)
+            result['youtube_info'] = youtube_info
+            converter._finish_metrics(result, metrics, owns_metrics)
+            return result
+        
+        except Exception as e:
+            print(f"Error processing YouTube video: {e}")
+            converter._finish_metrics(None, metrics, owns_metrics, error=e)
+            raise
+        finally:
+            if downloaded_file and os.path.exists(downloaded_file):
+                shutil.rmtree(os.path.dirname(downloaded_file), ignore_errors=True)
@@ -1,13 +1,23 @@
 import streamlit as st
 import tempfile
 import os
-import torch
-import traceback
-import whisper
+import shutil
+import time
+import uuid
+from contextlib import ExitStack
 
-# 모듈 임포트
+# 모듈 임포트 (torch/whisper/yt_dlp는 UI 표시 후 백그라운드에서 로드)
+from src.startup import prefetch_heavy_imports, cuda_available, get_package_version
 from src.ffmpeg_setup import setup_ffmpeg_path
 from src.converter import VideoToTextConverter
+from src.backends import BACKEND_OPTIONS, BACKEND_WHISPER
+from src.model_pool import ModelPool, DEFAULT_RAM_BUDGET_MB, DEFAULT_VRAM_BUDGET_MB
+from src.two_pass import TwoPassTranscriber, DEFAULT_DRAFT_MODEL
+from src.subtitle_writer import render_subtitles, SUBTITLE_MIME_TYPES
+from src.job_executor import JobExecutor, JOB_FAILED, hash_input, hash_stream
+
+# 업로드 파일 복사/해시 단위 (1MB) - 파일 크기와 관계없이 추가 메모리를 일정하게 유지
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 # 환경 감지 헬퍼 함수 / Environment Detection Helper
 def is_cloud_environment():
@@ -40,13 +50,11 @@ def setup_ffmpeg_safely():
 # FFmpeg 설정 실행
 setup_ffmpeg_safely()
 
-# yt-dlp 버전 확인을 위한 임포트
-try:
-    import yt_dlp
-    YT_DLP_VERSION = yt_dlp.version.__version__
-except (ImportError, AttributeError) as e:
-    YT_DLP_VERSION = "Not installed"
-    print(f"yt-dlp not available: {e}")
+# 무거운 모듈 미리 로드 시작 (프로세스당 한 번, 페이지 렌더링을 막지 않음)
+import_prefetcher = prefetch_heavy_imports()
+
+# yt-dlp 버전 확인 (패키지 메타데이터만 읽고 import하지 않음)
+YT_DLP_VERSION = get_package_version("yt-dlp")
 
 # 환경 감지 / Environment Detection
 def get_environment_config():
@@ -55,13 +63,18 @@ def get_environment_config():
         return {
             "max_file_size_mb": 200,
             "max_file_display": "200MB",
-            "environment": "☁️ Cloud Environment"
+            "environment": "☁️ Cloud Environment",
+            # 모델 풀 메모리 예산 (MB), 환경 변수로 조정 가능
+            "model_ram_budget_mb": int(os.getenv('VIDEOSCRIBE_MODEL_RAM_MB', 1536)),
+            "model_vram_budget_mb": int(os.getenv('VIDEOSCRIBE_MODEL_VRAM_MB', 0))
         }
     else:
         return {
             "max_file_size_mb": 2048,  # 2GB
             "max_file_display": "2GB", 
-            "environment": "🏠 Local Environment"
+            "environment": "🏠 Local Environment",
+            "model_ram_budget_mb": int(os.getenv('VIDEOSCRIBE_MODEL_RAM_MB', DEFAULT_RAM_BUDGET_MB)),
+            "model_vram_budget_mb": int(os.getenv('VIDEOSCRIBE_MODEL_VRAM_MB', DEFAULT_VRAM_BUDGET_MB))
         }
 
 # 현재 테마 감지 함수 / Current Theme Detection Function
@@ -414,27 +427,262 @@ h3 {
 </style>
 """, unsafe_allow_html=True)
 
-# GPU 사용 가능 여부 확인 / Check GPU availability
-use_gpu = torch.cuda.is_available()
-
-# 캐시된 변환기 로딩 / Load Cached Converter
+# 모든 세션이 공유하는 모델 웜 풀 / Shared Model Warm Pool
 @st.cache_resource
-def load_video_converter(model_name, use_gpu=True):
+def get_model_pool():
+    """세션 간 공유되는 모델 풀 (메모리 예산을 넘으면 오래 사용하지 않은 모델부터 해제)"""
+    return ModelPool(
+        lambda model_size, gpu, backend: VideoToTextConverter(model_size=model_size, use_gpu=gpu, backend=backend),
+        ram_budget_mb=ENV_CONFIG['model_ram_budget_mb'],
+        vram_budget_mb=ENV_CONFIG['model_vram_budget_mb']
+    )
+
+# 작업/모델 풀 키에 쓰는 실제 GPU 사용 여부 / Effective GPU Setting
+def resolve_use_gpu(use_gpu, wait=True):
+    """GPU 설정을 실제 사용 여부로 변환 (클라우드이거나 GPU가 없으면 False, wait=False에서 확인 중이면 None)"""
+    if not use_gpu or is_cloud_environment():
+        return False
+    return cuda_available(wait=wait)
+
+# 풀에서 변환기 로딩 / Load Converter from Pool
+def load_video_converter(model_name, use_gpu=True, backend=BACKEND_WHISPER):
     """비디오 변환기 로딩 (오류 처리 강화)"""
     try:
         # 클라우드 환경에서는 GPU 사용 안함
         if is_cloud_environment():
             use_gpu = False
         
-        converter = VideoToTextConverter(model_size=model_name, use_gpu=use_gpu)
-        return converter
+        return get_model_pool().get(model_name, use_gpu, backend)
     except Exception as e:
         st.error(f"❌ Failed to load AI model: {str(e)} / AI 모델 로딩 실패: {str(e)}")
         st.info("💡 Try using a smaller model (tiny/base) or refresh the page / 더 작은 모델을 사용하거나 페이지를 새로고침해보세요")
         st.stop()
 
+# 세션이 공유하는 백그라운드 작업 실행기 / Shared Background Job Executor
+@st.cache_resource
+def get_job_executor():
+    """스크립트 실행과 분리된 변환 작업 실행기 (페이지가 다시 실행되어도 작업과 결과 유지)"""
+    return JobExecutor(max_workers=int(os.getenv('VIDEOSCRIBE_JOB_WORKERS', 2)))
+
+def get_session_id():
+    """브라우저 세션별 ID"""
+    if 'session_id' not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    return st.session_state.session_id
+
+def get_upload_hash(uploaded_file):
+    """업로드 파일 내용 해시 (다시 실행될 때마다 계산하지 않도록 세션에 저장)"""
+    upload_id = getattr(uploaded_file, 'file_id', None) or f"{uploaded_file.name}:{uploaded_file.size}"
+    upload_hashes = st.session_state.setdefault('upload_hashes', {})
+    if upload_id not in upload_hashes:
+        upload_hashes[upload_id] = hash_stream(uploaded_file, UPLOAD_CHUNK_SIZE)
+    return upload_hashes[upload_id]
+
+def save_upload_to_disk(uploaded_file):
+    """업로드 파일을 청크 단위로 임시 파일에 복사 (내용 전체를 bytes로 만들지 않음)"""
+    suffix = os.path.splitext(uploaded_file.name)[1] or ".bin"
+    uploaded_file.seek(0)
+    with tempfile.NamedTemporaryFile(delete=False, prefix="upload_", suffix=suffix) as tmp_file:
+        try:
+            shutil.copyfileobj(uploaded_file, tmp_file, UPLOAD_CHUNK_SIZE)
+        except Exception:
+            tmp_file.close()
+            os.unlink(tmp_file.name)
+            raise
+        return tmp_file.name
+
+def get_transcriber(leases, model_pool, model_name, use_gpu, backend, draft_first=False):
+    """
+    선택한 모델의 변환기와 디코딩하는 동안 잡을 lock을 반환합니다
+    (풀의 변환기는 세션끼리 공유하므로 같은 모델로 동시에 디코딩하지 않도록 decode_lock을 잡음.
+    다운로드/오디오 추출 중에는 잡지 않으므로 다른 세션의 작업과 겹쳐서 진행됨.
+    변환기는 leases(ExitStack)가 닫힐 때까지 빌려 두므로 다른 세션의 모델 로드가 내리지 못함.
+    초안 모드는 작은 모델 초안 → 선택한 모델로 저신뢰 구간만 보정하고, 보정 lock은 변환기 안에서 잡음)
+    """
+    if not draft_first or model_name == DEFAULT_DRAFT_MODEL:
+        converter = leases.enter_context(model_pool.lease(model_name, use_gpu, backend))
+        return converter, model_pool.decode_lock(model_name, use_gpu, backend)
+    
+    # 큰 모델은 초안을 디코딩하는 동안 백그라운드에서 로드
+    model_pool.prefetch(model_name, use_gpu, backend)
+    transcriber = TwoPassTranscriber(
+        leases.enter_context(model_pool.lease(DEFAULT_DRAFT_MODEL, use_gpu, backend)),
+        lambda: leases.enter_context(model_pool.lease(model_name, use_gpu, backend)),
+        refine_model_size=model_name,
+        refine_lock=model_pool.decode_lock(model_name, use_gpu, backend)
+    )
+    return transcriber, model_pool.decode_lock(DEFAULT_DRAFT_MODEL, use_gpu, backend)
+
+def run_upload_job(job, model_pool, temp_file_path, model_name, language, use_gpu, backend, draft_first=False):
+    """파일 업로드 변환 작업 (백그라운드 스레드에서 실행)"""
+    try:
+        with ExitStack() as leases:
+            job.progress_callback(15, "🤖 Step 2/6: Loading AI model / AI 모델 로딩중...")
+            converter, decode_lock = get_transcriber(leases, model_pool, model_name, use_gpu, backend, draft_first)
+            
+            job.progress_callback(30, "⚙️ Step 3/6: Preparing audio extraction / 오디오 추출 준비중...")
+            return converter.process_local_video_with_info(
+                temp_file_path,
+                language=language,
+                save_transcript=False,
+                progress_callback=job.progress_callback,
+                segment_callback=job.segment_callback,
+                decode_lock=decode_lock
+            )
+    finally:
+        # 임시 파일 정리 / Clean up temporary files
+        try:
+            os.unlink(temp_file_path)
+        except:
+            pass
+
+def run_youtube_job(job, model_pool, youtube_url, model_size, language, use_gpu, backend, draft_first=False):
+    """YouTube 변환 작업 (백그라운드 스레드에서 실행)"""
+    with ExitStack() as leases:
+        job.progress_callback(5, "🤖 Loading AI model / AI 모델 로딩중...")
+        converter, decode_lock = get_transcriber(leases, model_pool, model_size, use_gpu, backend, draft_first)
+        
+        return converter.process_youtube_video(
+            youtube_url,
+            language=language,
+            save_transcript=False,
+            progress_callback=job.progress_callback,
+            segment_callback=job.segment_callback,
+            decode_lock=decode_lock
+        )
+
+def upload_step_message(value):
+    """파일 업로드 진행률에 맞는 단계 메시지"""
+    if value >= 40 and value < 60:
+        return "🎵 Step 4/6: Extracting audio from video / 비디오에서 오디오 추출중..."
+    elif value == 60:
+        return "✅ Step 4/6: Audio extraction completed / 오디오 추출 완료"
+    elif value >= 65 and value < 85:
+        return "🔄 Step 5/6: Starting AI transcription / AI 텍스트 변환 시작..."
+    elif value == 85:
+        return "✅ Step 5/6: Transcription completed / 텍스트 변환 완료"
+    elif value >= 90:
+        return "📝 Step 6/6: Finalizing results / 결과 정리중..."
+    return ""
+
+def youtube_step_message(value):
+    """YouTube 진행률에 맞는 단계 메시지"""
+    if value >= 10 and value < 50:
+        return "📥 Step 4/6: Downloading video / 비디오 다운로드중..."
+    elif value == 50:
+        return "✅ Step 4/6: Download completed / 다운로드 완료"
+    elif value >= 55 and value < 65:
+        return "🎵 Step 5/6: Extracting audio / 오디오 추출중..."
+    elif value >= 65 and value < 85:
+        return "🤖 Step 6/6: AI transcription in progress / AI 텍스트 변환 진행중..."
+    elif value == 85:
+        return "✅ Step 6/6: Transcription completed / 텍스트 변환 완료"
+    elif value >= 90:
+        return "📝 Finalizing results / 결과 정리중..."
+    return ""
+
+def render_job(job, step_message_func, download_name, key_prefix):
+    """작업 상태를 표시합니다 (진행 중이면 진행률과 실시간 텍스트, 완료되면 결과)"""
+    snapshot = job.snapshot()
+    
+    if job.active:
+        # 간단한 퍼센트와 단계 메시지만 표시
+        st.text(f"{min(snapshot['percent'], 95):.0f}%")
+        step_message = step_message_func(snapshot['percent']) or snapshot['message']
+        if step_message:
+            st.markdown(f"**• {step_message}**")
+        
+        # 실시간 변환 텍스트 (세그먼트가 디코딩될 때마다 갱신)
+        live_text = job.live_text()
+        if live_text:
+            st.text_area(
+                "Live transcript / 실시간 변환 텍스트:",
+                value=live_text,
+                height=200,
+                disabled=True,
+                key=f"live_transcript_{key_prefix}_{snapshot['segment_count']}"
+            )
+        return
+    
+    if job.status == JOB_FAILED:
+        st.text("0%")
+        st.markdown("**• ❌ Conversion failed / 변환 실패**")
+        st.error(f"❌ Error occurred: {job.error} / 오류가 발생했습니다: {job.error}")
+        
+        # 상세 에러 정보 표시
+        with st.expander("🔍 Error Details / 에러 상세 정보"):
+            st.code(job.error_details)
+        return
+    
+    # Step 6/6: 완료 (100%)
+    st.text("100%")
+    st.markdown("**• 🎉 Step 6/6: All completed! / 모든 단계 완료!**")
+    
+    # 결과 표시
+    st.success("🎉 Transcription completed successfully! / 텍스트 변환이 성공적으로 완료되었습니다!")
+    
+    # 변환된 텍스트 / Converted Text
+    st.subheader("📝 Transcribed Text / 변환된 텍스트")
+    
+    result = job.result or {}
+    transcript_text = result.get("transcript", "").strip()
+    
+    if transcript_text:
+        # 텍스트 영역 / Text Area (작업별 key로 편집 내용 유지)
+        edited_text = st.text_area(
+            "Edit the text if needed / 필요시 텍스트를 편집하세요:",
+            value=transcript_text,
+            height=300,
+            help="You can edit the transcribed text before downloading / 다운로드 전에 변환된 텍스트를 편집할 수 있습니다",
+            key=f"edit_transcript_{job.job_id}"
+        )
+        
+        # 통계 정보 / Statistics
+        word_count = len(edited_text.split())
+        char_count = len(edited_text)
+        detected_lang = result.get("detected_language", "unknown")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Language / 언어", detected_lang.upper())
+        with col2:
+            st.metric("Words / 단어수", word_count)
+        with col3:
+            st.metric("Characters / 문자수", char_count)
+        
+        # 다운로드 버튼 / Download Button
+        st.download_button(
+            label="📥 Download Text File / 텍스트 파일 다운로드",
+            data=edited_text,
+            file_name=download_name,
+            mime="text/plain",
+            use_container_width=True,
+            key=f"download_transcript_{job.job_id}"
+        )
+        
+        # 자막 다운로드 / Subtitle Downloads (편집 전 세그먼트 타임스탬프 기준)
+        segments = result.get("segments") or []
+        if segments:
+            base_name = os.path.splitext(download_name)[0]
+            if base_name.endswith("_transcript"):
+                base_name = base_name[:-len("_transcript")]
+            subtitle_columns = st.columns(3)
+            for column, (format_name, label) in zip(subtitle_columns, (("srt", "SRT"), ("vtt", "WebVTT"), ("json", "JSON"))):
+                with column:
+                    st.download_button(
+                        label=f"🎬 {label}",
+                        data=render_subtitles(segments, format_name, detected_lang),
+                        file_name=f"{base_name}.{format_name}",
+                        mime=SUBTITLE_MIME_TYPES[format_name],
+                        use_container_width=True,
+                        key=f"download_{format_name}_{job.job_id}"
+                    )
+    else:
+        st.warning("⚠️ No speech detected in the file. Please check if the file contains audio. / 파일에서 음성이 감지되지 않았습니다. 파일에 오디오가 포함되어 있는지 확인해주세요.")
+
 # 파일 업로드 처리 함수 / File Upload Processing Function
-def process_file_upload(uploaded_file, selected_model, selected_language, use_gpu):
+def process_file_upload(uploaded_file, selected_model, selected_language, use_gpu, selected_backend=BACKEND_WHISPER,
+                        draft_first=False):
     """파일 업로드 처리 함수"""
     if uploaded_file is not None:
         # 파일 크기 체크
@@ -473,197 +721,59 @@ def process_file_upload(uploaded_file, selected_model, selected_language, use_gp
             }
             model_info = {
                 "Selected Model": model_options_display[selected_model].split(' /')[0],
+                "Engine": BACKEND_OPTIONS[selected_backend],
                 "Language": language_options_display[selected_language].split(' /')[0]
             }
             st.json(model_info)
         
+        executor = get_job_executor()
+        session_id = get_session_id()
+        
+        # 같은 파일 + 같은 설정이면 같은 작업 (다시 실행되어도 재변환하지 않음)
+        use_gpu = resolve_use_gpu(use_gpu)
+        input_key = hash_input(get_upload_hash(uploaded_file), selected_model, selected_language, selected_backend, use_gpu,
+                               draft_first)
+        job = executor.get(session_id, input_key)
+        
         # 변환 버튼 / Convert Button
         if st.button("🚀 Convert to Text / 텍스트 변환", type="primary", use_container_width=True):
-            
-            # 간단한 퍼센트 표시만
-            progress_container = st.container()
-            
-            with progress_container:
-                # 퍼센트 표시만
-                progress_percent = st.empty()
+            if job is None or job.status == JOB_FAILED:
+                # 업로드 파일을 임시 파일로 저장한 뒤 백그라운드 작업으로 변환
+                temp_file_path = save_upload_to_disk(uploaded_file)
                 
-                # 상태 텍스트와 단계별 진행 표시
-                status_text = st.empty()
-                progress_steps = st.empty()
-            
-            def update_progress_gui_style(value, step_message=""):
-                """간단한 퍼센트만 표시 (파일 업로드용)"""
-                progress_percent.text(f"{value}%")
-                if step_message:
-                    progress_steps.markdown(f"**• {step_message}**")
-                else:
-                    status_text.text("")  # 기존 상태 메시지 지우기
-            
-            try:
-                # Step 1/6: 파일 정보 읽기 (5%)
-                update_progress_gui_style(5, "📹 Step 1/6: Reading video information / 영상 정보 읽는중...")
-                
-                with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-                    tmp_file.write(uploaded_file.read())
-                    temp_file_path = tmp_file.name
-                
-                # Step 1/6: 완료 (10%)
-                update_progress_gui_style(10, "✅ Step 1/6: Video info loaded / 영상 정보 로딩 완료")
-                
-                # Step 2/6: AI 모델 로딩 (15%)
-                update_progress_gui_style(15, "🤖 Step 2/6: Loading AI model / AI 모델 로딩중...")
-                
-                use_gpu = torch.cuda.is_available()
-                converter = load_video_converter(selected_model, use_gpu)
-                
-                # Step 2/6: 완료 (25%)
-                update_progress_gui_style(25, "✅ Step 2/6: AI model loaded / AI 모델 로딩 완료")
-                
-                # Step 3/6: 오디오 추출 준비 (30%)
-                update_progress_gui_style(30, "⚙️ Step 3/6: Preparing audio extraction / 오디오 추출 준비중...")
-                
-                # 언어 설정
                 language = None if selected_language == "auto" else selected_language
-                
-                # 간단한 GUI 스타일 진행률 콜백 함수 (파일 업로드용)
-                def progress_callback(value, message="", **kwargs):
-                    # 복잡한 기술 정보는 무시하고 단계별 메시지만 표시
-                    if value >= 40 and value < 60:
-                        step_msg = "🎵 Step 4/6: Extracting audio from video / 비디오에서 오디오 추출중..."
-                    elif value == 60:
-                        step_msg = "✅ Step 4/6: Audio extraction completed / 오디오 추출 완료"
-                    elif value >= 65 and value < 85:
-                        step_msg = "🔄 Step 5/6: Starting AI transcription / AI 텍스트 변환 시작..."
-                    elif value == 85:
-                        step_msg = "✅ Step 5/6: Transcription completed / 텍스트 변환 완료"
-                    elif value >= 90:
-                        step_msg = "📝 Step 6/6: Finalizing results / 결과 정리중..."
-                    else:
-                        step_msg = ""
-                    
-                    # 간단한 진행률만 표시 (기술적 세부사항은 무시)
-                    update_progress_gui_style(min(value, 95), step_msg)
-                
-                # 변환 실행
-                result = converter.process_local_video_with_info(
-                    temp_file_path, 
-                    language=language, 
-                    save_transcript=False,
-                    progress_callback=progress_callback
-                )
-                
-                # Step 6/6: 완료 (100%)
-                update_progress_gui_style(100, "🎉 Step 6/6: All completed! / 모든 단계 완료!")
-                
-                # 결과 표시
-                st.success("🎉 Transcription completed successfully! / 텍스트 변환이 성공적으로 완료되었습니다!")
-                
-                # 변환된 텍스트 / Converted Text
-                st.subheader("📝 Transcribed Text / 변환된 텍스트")
-                
-                transcript_text = result.get("transcript", "").strip()
-                
-                if transcript_text:
-                    # 텍스트 영역 / Text Area
-                    edited_text = st.text_area(
-                        "Edit the text if needed / 필요시 텍스트를 편집하세요:",
-                        value=transcript_text,
-                        height=300,
-                        help="You can edit the transcribed text before downloading / 다운로드 전에 변환된 텍스트를 편집할 수 있습니다"
-                    )
-                    
-                    # 통계 정보 / Statistics
-                    word_count = len(edited_text.split())
-                    char_count = len(edited_text)
-                    detected_lang = result.get("detected_language", "unknown")
-                    
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Language / 언어", detected_lang.upper())
-                    with col2:
-                        st.metric("Words / 단어수", word_count)
-                    with col3:
-                        st.metric("Characters / 문자수", char_count)
-                    
-                    # 다운로드 버튼 / Download Button
-                    st.download_button(
-                        label="📥 Download Text File / 텍스트 파일 다운로드",
-                        data=edited_text,
-                        file_name=f"{uploaded_file.name.split('.')[0]}_transcript.txt",
-                        mime="text/plain",
-                        use_container_width=True
-                    )
-                else:
-                    st.warning("⚠️ No speech detected in the file. Please check if the file contains audio. / 파일에서 음성이 감지되지 않았습니다. 파일에 오디오가 포함되어 있는지 확인해주세요.")
-                
-                # 임시 파일 정리 / Clean up temporary files
-                try:
-                    os.unlink(temp_file_path)
-                except:
-                    pass
-                    
-            except Exception as e:
-                st.error(f"❌ Error occurred: {str(e)} / 오류가 발생했습니다: {str(e)}")
-                update_progress_gui_style(0, "❌ Conversion failed / 변환 실패")
-                
-                # 임시 파일 정리 / Clean up temporary files
-                try:
-                    if 'temp_file_path' in locals():
-                        os.unlink(temp_file_path)
-                except:
-                    pass
+                job = executor.submit(session_id, input_key, run_upload_job, get_model_pool(), temp_file_path,
+                                      selected_model, language, use_gpu, selected_backend, draft_first,
+                                      label=uploaded_file.name)
+        
+        if job is not None:
+            render_job(job, upload_step_message, f"{uploaded_file.name.split('.')[0]}_transcript.txt", "upload")
 
 # YouTube 비디오 처리 함수 / YouTube Video Processing Function
-def process_youtube_video(youtube_url, model_size, language, use_gpu):
-    """YouTube 비디오를 처리하고 결과를 표시합니다 (간단한 진행률 표시)"""
+def process_youtube_video(youtube_url, model_size, language, use_gpu, backend=BACKEND_WHISPER, start=False,
+                          draft_first=False):
+    """YouTube 변환 작업을 시작하거나 진행 중인 작업 상태를 표시합니다"""
+    executor = get_job_executor()
+    session_id = get_session_id()
     
-    # 간단한 퍼센트 표시만
-    progress_container = st.container()
+    use_gpu = resolve_use_gpu(use_gpu)
     
-    with progress_container:
-        # 퍼센트 표시만
-        progress_percent = st.empty()
-        
-        # 상태 텍스트와 단계별 진행 표시
-        status_text = st.empty()
-        progress_steps = st.empty()
+    # 같은 URL + 같은 설정이면 같은 작업
+    input_key = hash_input(youtube_url.strip(), model_size, language, backend, use_gpu, draft_first)
+    job = executor.get(session_id, input_key)
     
-    def update_progress_gui_style(value, step_message=""):
-        """간단한 퍼센트만 표시"""
-        progress_percent.text(f"{value}%")
-        
-        if step_message:
-            progress_steps.markdown(f"**• {step_message}**")
-        else:
-            status_text.text("")  # 기존 상태 메시지 지우기
+    if start and (job is None or job.status == JOB_FAILED):
+        lang = None if language == "auto" else language
+        youtube_info = st.session_state.get('youtube_info') or {}
+        job = executor.submit(session_id, input_key, run_youtube_job, get_model_pool(), youtube_url,
+                              model_size, lang, use_gpu, backend, draft_first,
+                              label=youtube_info.get('title', youtube_url))
     
-    try:
-        # Step 1/6: 초기화 (5%)
-        update_progress_gui_style(5, "📹 Step 1/6: Reading video information / 영상 정보 읽는중...")
-        
-        # 변환기 로딩
-        converter = load_video_converter(model_size, use_gpu)
-        
-        # URL 검증
-        if not converter.is_youtube_url(youtube_url):
-            st.error("❌ Invalid YouTube URL / 유효하지 않은 YouTube URL입니다")
-            return
-        
-        # Step 1/6: 완료 (10%)
-        update_progress_gui_style(10, "✅ Step 1/6: Video info loaded / 영상 정보 로딩 완료")
-        
-        # Step 2/6: AI 모델 로딩 (15%)
-        update_progress_gui_style(15, "🤖 Step 2/6: Loading AI model / AI 모델 로딩중...")
-        
-        # YouTube 정보 가져오기
-        youtube_info = converter.get_youtube_info(youtube_url)
-        if not youtube_info:
-            st.error("❌ Failed to get YouTube video information / YouTube 영상 정보를 가져올 수 없습니다")
-            return
-        
-        # Step 2/6: 완료 (25%)
-        update_progress_gui_style(25, "✅ Step 2/6: AI model loaded / AI 모델 로딩 완료")
-        
+    if job is None:
+        return
+    
+    youtube_info = (job.result or {}).get('youtube_info') or st.session_state.get('youtube_info')
+    if youtube_info:
         # 영상 정보 표시 (GUI와 동일한 형식)
         with st.expander("📺 YouTube Video Information / 유튜브 영상 정보", expanded=True):
             col1, col2 = st.columns(2)
@@ -682,104 +792,13 @@ def process_youtube_video(youtube_url, model_size, language, use_gpu):
                     duration_str = "--:--:--"
                 st.write(f"**Duration / 재생시간:** {duration_str}")
                 st.write(f"**Views / 조회수:** {youtube_info.get('view_count', 'Unknown'):,}" if isinstance(youtube_info.get('view_count'), int) else f"**Views / 조회수:** Unknown")
-        
-        # Step 3/6: 오디오 추출 준비 (30%)
-        update_progress_gui_style(30, "⚙️ Step 3/6: Preparing audio extraction / 오디오 추출 준비중...")
-        
-        # 언어 설정
-        lang = None if language == "auto" else language
-        
-        # 간단한 GUI 스타일 진행률 콜백 함수 (YouTube용)
-        def progress_callback(value, message="", **kwargs):
-            # 복잡한 기술 정보는 무시하고 단계별 메시지만 표시
-            if value >= 10 and value < 50:
-                step_msg = "📥 Step 4/6: Downloading video / 비디오 다운로드중..."
-            elif value == 50:
-                step_msg = "✅ Step 4/6: Download completed / 다운로드 완료"
-            elif value >= 55 and value < 65:
-                step_msg = "🎵 Step 5/6: Extracting audio / 오디오 추출중..."
-            elif value >= 65 and value < 85:
-                step_msg = "🤖 Step 6/6: AI transcription in progress / AI 텍스트 변환 진행중..."
-            elif value == 85:
-                step_msg = "✅ Step 6/6: Transcription completed / 텍스트 변환 완료"
-            elif value >= 90:
-                step_msg = "📝 Finalizing results / 결과 정리중..."
-            else:
-                step_msg = ""
-            
-            # 간단한 진행률만 표시 (기술적 세부사항은 무시)
-            update_progress_gui_style(min(value, 95), step_msg)
-        
-        # YouTube 비디오 처리
-        result = converter.process_youtube_video(
-            youtube_url,
-            language=lang,
-            save_transcript=False,
-            progress_callback=progress_callback
-        )
-        
-        # Step 6/6: 완료 (100%)
-        update_progress_gui_style(100, "🎉 Step 6/6: All completed! / 모든 단계 완료!")
-        
-        # 결과 표시
-        st.success("🎉 YouTube transcription completed successfully! / YouTube 텍스트 변환이 성공적으로 완료되었습니다!")
-        
-        # 변환된 텍스트 / Converted Text
-        st.subheader("📝 Transcribed Text / 변환된 텍스트")
-        
-        transcript_text = result.get("transcript", "").strip()
-        
-        if transcript_text:
-            # 텍스트 영역 / Text Area
-            edited_text = st.text_area(
-                "Edit the text if needed / 필요시 텍스트를 편집하세요:",
-                value=transcript_text,
-                height=300,
-                help="You can edit the transcribed text before downloading / 다운로드 전에 변환된 텍스트를 편집할 수 있습니다"
-            )
-            
-            # 통계 정보 / Statistics
-            word_count = len(edited_text.split())
-            char_count = len(edited_text)
-            detected_lang = result.get("detected_language", "unknown")
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Language / 언어", detected_lang.upper())
-            with col2:
-                st.metric("Words / 단어수", word_count)
-            with col3:
-                st.metric("Characters / 문자수", char_count)
-            
-            # 파일명 생성 (YouTube 제목 기반)
-            safe_title = "".join(c for c in youtube_info['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()[:50]
-            filename = f"{safe_title}_transcript.txt" if safe_title else "youtube_transcript.txt"
-            
-            # 다운로드 버튼 / Download Button
-            st.download_button(
-                label="📥 Download Text File / 텍스트 파일 다운로드",
-                data=edited_text,
-                file_name=filename,
-                mime="text/plain",
-                use_container_width=True
-            )
-        else:
-            st.warning("⚠️ No speech detected in the video. Please check if the video contains audio. / 영상에서 음성이 감지되지 않았습니다. 영상에 오디오가 포함되어 있는지 확인해주세요.")
-        
-    except Exception as e:
-        st.error(f"❌ Error occurred: {str(e)} / 오류가 발생했습니다: {str(e)}")
-        
-        # 상세 에러 정보 표시
-        with st.expander("🔍 Error Details / 에러 상세 정보"):
-            st.text(f"Error Type: {type(e).__name__}")
-            st.text(f"Error Message: {str(e)}")
-            st.code(traceback.format_exc())
-        
-        # 진행률 리셋
-        try:
-            update_progress_gui_style(0, "❌ Conversion failed / 변환 실패")
-        except:
-            pass
+    
+    # 파일명 생성 (YouTube 제목 기반)
+    title = (youtube_info or {}).get('title', '')
+    safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()[:50]
+    filename = f"{safe_title}_transcript.txt" if safe_title else "youtube_transcript.txt"
+    
+    render_job(job, youtube_step_message, filename, "youtube")
 
 # 사이드바 설정 / Sidebar Configuration  
 with st.sidebar:
@@ -914,6 +933,23 @@ with st.sidebar:
         index=1
     )
     
+    # 초안 먼저 보기 / Draft First
+    draft_first = st.checkbox(
+        "Draft first, then refine / 초안 먼저 보고 보정",
+        value=False,
+        disabled=selected_model == DEFAULT_DRAFT_MODEL,
+        help="Shows a tiny-model draft within seconds, then re-decodes only low-confidence parts with the selected model "
+             "/ tiny 모델 초안을 먼저 보여주고, 신뢰도가 낮은 부분만 선택한 모델로 다시 변환합니다"
+    )
+    
+    # 엔진 선택 / Engine Selection
+    selected_backend = st.selectbox(
+        "Engine / 엔진:",
+        options=list(BACKEND_OPTIONS.keys()),
+        format_func=lambda x: BACKEND_OPTIONS[x],
+        help="faster-whisper uses int8 quantization on CPU (typically 3-4x faster) / faster-whisper는 CPU에서 int8 양자화로 보통 3-4배 빠릅니다"
+    )
+    
     # 언어 선택 / Language Selection
     language_options = {
         "auto": "🌐 Auto Detect / 자동감지",
@@ -935,8 +971,13 @@ with st.sidebar:
     # GPU 설정 / GPU Settings
     st.markdown("---")
     
-    # GPU 사용 가능 여부 표시
-    if torch.cuda.is_available():
+    # GPU 사용 가능 여부 표시 (torch 로드 중이면 기다리지 않음)
+    gpu_status = cuda_available(wait=False)
+    if gpu_status is None:
+        gpu_available = False
+        st.info("⏳ Detecting GPU... / GPU 확인 중...")
+        use_gpu_option = st.session_state.get('use_gpu_setting', False)
+    elif gpu_status:
         gpu_available = True
         st.success("🚀 GPU Available / GPU 사용 가능")
         
@@ -955,7 +996,28 @@ with st.sidebar:
         st.session_state.use_gpu_setting = True
     
     # GPU 설정 적용
-    st.session_state.use_gpu_setting = use_gpu_option if torch.cuda.is_available() else False
+    st.session_state.use_gpu_setting = use_gpu_option if gpu_status is not False else False
+    
+    # 모델/엔진/GPU 선택이 바뀌면 백그라운드에서 미리 로드 (변환 시작 시 진행 중인 로드에 합류)
+    prefetch_gpu = resolve_use_gpu(st.session_state.use_gpu_setting, wait=False)
+    if prefetch_gpu is not None:
+        prefetch_key = (selected_model, prefetch_gpu, selected_backend)
+        if st.session_state.get('prefetched_model') != prefetch_key:
+            st.session_state.prefetched_model = prefetch_key
+            get_model_pool().prefetch(*prefetch_key)
+        if not get_model_pool().is_loaded(*prefetch_key):
+            st.caption(f"⏳ Loading {selected_model} model in background... / 모델 미리 로딩 중...")
+    
+    # 모델 풀 상태 / Model Pool Status
+    with st.expander("🧠 Loaded Models / 로드된 모델", expanded=False):
+        pool_stats = get_model_pool().stats()
+        st.caption(f"Hits {pool_stats['hits']} · Misses {pool_stats['misses']} · "
+                   f"Evictions {pool_stats['evictions']} · Load time {pool_stats['total_load_seconds']:.1f}s")
+        st.caption(f"RAM {pool_stats['memory_mb']['cpu']:.0f}/{pool_stats['budget_mb']['cpu']:.0f}MB · "
+                   f"VRAM {pool_stats['memory_mb']['cuda']:.0f}/{pool_stats['budget_mb']['cuda']:.0f}MB")
+        for model_info in pool_stats['models']:
+            st.caption(f"• {model_info['model_size']} ({model_info['backend']}, {model_info['device']}) "
+                       f"~{model_info['memory_mb']:.0f}MB, loaded in {model_info['load_seconds']:.1f}s")
 
 # 메인 페이지 헤더 / Main Page Header
 st.markdown("""
@@ -1102,7 +1164,8 @@ with tab1:
         help=f"Maximum file size: {ENV_CONFIG['max_file_display']} / 최대 파일 크기: {ENV_CONFIG['max_file_display']}"
     )
     
-    process_file_upload(uploaded_file, selected_model, selected_language, st.session_state.get('use_gpu_setting', False))
+    process_file_upload(uploaded_file, selected_model, selected_language, st.session_state.get('use_gpu_setting', False),
+                        selected_backend, draft_first)
 
 with tab2:
     # YouTube URL 입력 / YouTube URL Input
@@ -1232,7 +1295,8 @@ with tab2:
         
         # 검증 버튼 클릭 처리
         if validate_clicked:
-            converter_temp = load_video_converter("base", False)
+            # URL 검증과 정보 조회에는 모델이 필요 없으므로 풀을 거치지 않음
+            converter_temp = VideoToTextConverter(model_size="base", use_gpu=False)
             if converter_temp.is_youtube_url(youtube_url):
                 try:
                     with st.spinner("Getting video info... / 영상 정보 가져오는 중..."):
@@ -1273,18 +1337,18 @@ with tab2:
             st.success(f"✅ **Valid Video Found:**\n\n**Title:** {info['title']}\n\n**Duration:** {duration_str}\n\n**Uploader:** {info['uploader']}")
             
             # 처리 버튼 - 항상 표시
-            if st.button("🚀 **Extract Text from YouTube / 유튜브에서 텍스트 추출**", type="primary", use_container_width=True):
-                # GPU 설정 가져오기
-                current_use_gpu = st.session_state.get('use_gpu_setting', torch.cuda.is_available())
-                
-                # 디버깅 정보 표시 (숨김)
-                # st.info(f"🔧 Processing with: Model={selected_model}, Language={selected_language}, GPU={current_use_gpu}")
-                
-                try:
-                    process_youtube_video(st.session_state.youtube_url, selected_model, selected_language, current_use_gpu)
-                except Exception as e:
-                    st.error(f"❌ Processing failed: {str(e)}")
-                    st.exception(e)
+            extract_clicked = st.button("🚀 **Extract Text from YouTube / 유튜브에서 텍스트 추출**", type="primary", use_container_width=True)
+            
+            # GPU 설정 가져오기
+            current_use_gpu = st.session_state.get('use_gpu_setting', cuda_available())
+            
+            # 버튼을 누르면 작업 시작, 이후 실행에서는 진행 중/완료된 작업 상태만 표시
+            try:
+                process_youtube_video(st.session_state.youtube_url, selected_model, selected_language, current_use_gpu,
+                                      selected_backend, start=extract_clicked, draft_first=draft_first)
+            except Exception as e:
+                st.error(f"❌ Processing failed: {str(e)}")
+                st.exception(e)
         
         elif youtube_url and youtube_url.strip() and not st.session_state.youtube_validated:
             st.info("👆 Click 'Validate' to check the YouTube URL / 'Validate' 버튼을 클릭하여 YouTube URL을 확인하세요")
@@ -1357,4 +1421,14 @@ st.markdown(
     </div>
     """, 
     unsafe_allow_html=True
-) 
\ No newline at end of file
+) 
+
+# 페이지를 먼저 그린 뒤 백그라운드 로드가 끝나면 한 번 다시 실행 (GPU 상태 표시) / Rerun once prefetch finishes
+if not import_prefetcher.done:
+    import_prefetcher.wait()
+    st.rerun()
+
+# 진행 중인 작업이 있으면 잠시 후 페이지를 다시 실행하여 상태 갱신 / Poll running jobs
+if get_job_executor().has_active_jobs(get_session_id()):
+    time.sleep(1.0)
+    st.rerun()
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# 저장소 루트를 import 경로에 추가 (src, tools 패키지)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
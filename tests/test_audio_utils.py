@@ -0,0 +1,50 @@
+"""
+오디오 유틸리티 테스트
+Audio Utility Tests
+"""
+
+import sys
+
+import pytest
+
+from src import audio_utils
+
+FAKE_FFMPEG = """#!{python}
+import sys
+# 파이프 버퍼보다 훨씬 많은 경고를 stderr에 먼저 쓴 뒤 PCM 출력
+for i in range(20000):
+    sys.stderr.write(f"warning {{i}}\\n")
+sys.stderr.flush()
+sys.stdout.buffer.write(b"\\0" * 16000 * 4)
+sys.exit({code})
+"""
+
+
+def _fake_ffmpeg(tmp_path, monkeypatch, code):
+    path = tmp_path / "ffmpeg"
+    path.write_text(FAKE_FFMPEG.format(python=sys.executable, code=code))
+    path.chmod(0o755)
+    monkeypatch.setattr(audio_utils, "get_ffmpeg_binary", lambda: str(path))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs an executable script")
+def test_load_audio_array_survives_noisy_stderr(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    _fake_ffmpeg(tmp_path, monkeypatch, 0)
+    
+    audio = audio_utils.load_audio_array("input.mp4")
+    
+    assert audio.size == 16000
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs an executable script")
+def test_load_audio_array_reports_stderr_tail(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    _fake_ffmpeg(tmp_path, monkeypatch, 1)
+    
+    with pytest.raises(Exception) as error:
+        audio_utils.load_audio_array("input.mp4")
+    
+    message = str(error.value)
+    assert "warning 19999" in message
+    assert "warning 0\n" not in message
@@ -0,0 +1,80 @@
+"""
+음성 인식 엔진 테스트
+Transcription Backend Tests
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.audio_utils import SAMPLE_RATE
+from src.backends import TranscriptionBackend
+
+
+class RecordingBackend(TranscriptionBackend):
+    """받은 오디오 길이마다 세그먼트 하나를 돌려주고 호출을 기록하는 엔진"""
+    
+    name = "fake"
+    
+    def __init__(self):
+        super().__init__("tiny", "cpu")
+        self.calls = []
+    
+    def load(self):
+        return self
+    
+    def transcribe(self, audio, language=None, task="transcribe", initial_prompt=None, verbose=None):
+        self.calls.append((len(audio), initial_prompt))
+        seconds = len(audio) / SAMPLE_RATE
+        text = f" {len(self.calls)}"
+        return {
+            'text': text,
+            'language': language or "en",
+            'segments': [{'id': 0, 'seek': 0, 'start': 0.0, 'end': seconds, 'text': text}]
+        }
+
+
+def speech_with_pauses(seconds=90):
+    # 20초마다 1초 무음이 있는 음성
+    audio = np.full(seconds * SAMPLE_RATE, 0.1, dtype=np.float32)
+    for start in range(20, seconds, 20):
+        audio[start * SAMPLE_RATE:(start + 1) * SAMPLE_RATE] = 0.0
+    return audio
+
+
+def test_default_iter_transcribe_matches_whole_file_transcribe():
+    audio = speech_with_pauses()
+    whole_file = RecordingBackend().transcribe(audio, language="en")
+    
+    backend = RecordingBackend()
+    language, segments = backend.iter_transcribe(audio, language="en")
+    
+    assert language == "en"
+    assert list(segments) == whole_file['segments']
+    assert backend.calls == [(len(audio), None)]
+
+
+def test_single_pass_resume_offsets_segments():
+    audio = speech_with_pauses()
+    marks = []
+    backend = RecordingBackend()
+    
+    _, segments = backend.iter_transcribe(audio, language="en", start_sample=30 * SAMPLE_RATE,
+                                          initial_prompt=" before", chunk_callback=lambda *mark: marks.append(mark))
+    segments = list(segments)
+    
+    assert backend.calls == [(60 * SAMPLE_RATE, " before")]
+    assert [(segment['start'], segment['end']) for segment in segments] == [(30.0, 90.0)]
+    assert marks == [(len(audio), " 1")]
+
+
+def test_chunked_iter_transcribe_is_opt_in():
+    audio = speech_with_pauses()
+    backend = RecordingBackend()
+    
+    _, segments = backend.iter_transcribe(audio, language="en", chunked=True)
+    segments = list(segments)
+    
+    assert len(backend.calls) > 1
+    assert segments[-1]['end'] == pytest.approx(90.0)
+    assert [segment['id'] for segment in segments] == list(range(len(segments)))
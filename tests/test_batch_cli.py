@@ -0,0 +1,51 @@
+"""
+배치 CLI 테스트
+Batch CLI Tests
+"""
+
+import os
+
+from src import batch_cli
+from src.backends import FasterWhisperBackend, WhisperBackend
+from src.converter import VideoToTextConverter
+
+
+def test_collect_inputs_keeps_local_youtube_named_files(tmp_path):
+    media = tmp_path / "youtube_talk.mp4"
+    media.write_bytes(b"")
+    (tmp_path / "notes.txt").write_text("skip me")
+    
+    inputs = batch_cli.collect_inputs([str(media), str(tmp_path)])
+    
+    assert inputs == [(str(media), False)]
+
+
+def test_collect_inputs_reads_url_lists(tmp_path):
+    url_list = tmp_path / "urls.txt"
+    url_list.write_text("# comment\nhttps://youtu.be/abc\n\nyoutu.be/abc\nhttps://youtu.be/abc\n")
+    
+    inputs = batch_cli.collect_inputs(["https://youtu.be/xyz"], url_lists=[str(url_list)])
+    
+    assert inputs == [("https://youtu.be/abc", True), ("youtu.be/abc", True), ("https://youtu.be/xyz", True)]
+
+
+def test_collect_inputs_expands_globs(tmp_path):
+    for name in ("b.wav", "a.mp3", "c.txt"):
+        (tmp_path / name).write_bytes(b"")
+    
+    inputs = batch_cli.collect_inputs([os.path.join(str(tmp_path), "*")])
+    
+    assert [os.path.basename(source) for source, _ in inputs] == ["a.mp3", "b.wav"]
+
+
+def test_decode_batch_is_ignored_for_backends_that_cannot_batch_inputs(tmp_path, capsys):
+    converter = VideoToTextConverter(use_gpu=False, use_cache=False, use_checkpoints=False)
+    converter.model = FasterWhisperBackend("tiny", "cpu")
+    
+    batch = batch_cli.BatchTranscriber(converter, str(tmp_path), decode_batch=8)
+    
+    assert batch.decode_batch == 1
+    assert "--decode-batch 8 is ignored" in capsys.readouterr().err
+    
+    converter.model = WhisperBackend("tiny", "cpu")
+    assert batch_cli.BatchTranscriber(converter, str(tmp_path), decode_batch=8).decode_batch == 8
@@ -0,0 +1,58 @@
+"""
+벤치마크 도구 테스트
+Benchmark Tool Tests
+"""
+
+import json
+import wave
+
+import pytest
+
+from tools import benchmark
+
+
+def _write_results(path, rtf, peak_rss_mb):
+    stats = {'wall_seconds': 1.0, 'rtf': rtf, 'peak_rss_mb': peak_rss_mb, 'bytes_written': 0}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'runs': [{'results': [{
+            'media': "tone_1s.wav",
+            'model': "tiny",
+            'backend': "whisper",
+            'stages': {'transcribe': stats},
+            'end_to_end': stats
+        }]}]}, f)
+    return str(path)
+
+
+def test_measure_reports_stats():
+    value, stats = benchmark.measure(lambda: 42, audio_seconds=2.0)
+    
+    assert value == 42
+    assert stats['wall_seconds'] >= 0
+    assert stats['rtf'] is not None
+    assert stats['peak_rss_mb'] is None or stats['peak_rss_mb'] > 0
+
+
+def test_measure_generated_wav(tmp_path):
+    pytest.importorskip("numpy")
+    path = str(tmp_path / "tone_1s.wav")
+    
+    result, stats = benchmark.measure(lambda: benchmark.generate_media("tone", 1, path), audio_seconds=1.0)
+    
+    assert result == path
+    with wave.open(path, 'rb') as wav_file:
+        assert wav_file.getframerate() == benchmark.SAMPLE_RATE
+        assert wav_file.getnframes() == benchmark.SAMPLE_RATE
+    assert stats['rtf'] == pytest.approx(stats['wall_seconds'], abs=1e-3)
+
+
+def test_compare_prints_change(tmp_path, capsys):
+    old_path = _write_results(tmp_path / "before.json", 0.5, 300.0)
+    new_path = _write_results(tmp_path / "after.json", 0.25, 280.0)
+    
+    assert benchmark.compare(old_path, new_path) == 0
+    
+    output = capsys.readouterr().out
+    assert "transcribe" in output
+    assert "end_to_end" in output
+    assert "-50.0%" in output
@@ -0,0 +1,68 @@
+"""
+체크포인트 재개 테스트
+Checkpoint Resume Tests
+"""
+
+from types import SimpleNamespace
+
+from src.audio_utils import SAMPLE_RATE, SpeechTimeline
+from src.backends import FasterWhisperBackend, BACKEND_FASTER_WHISPER
+from src.checkpoint import CheckpointStore, TranscriptCheckpoint
+from src.converter import VideoToTextConverter
+
+
+class FakeWhisperModel:
+    """받은 오디오 길이를 기록하고 정해진 세그먼트(받은 오디오 기준 시간)를 내보내는 faster-whisper 모델"""
+    
+    def __init__(self, segments):
+        self.segments = segments
+        self.calls = []
+    
+    def transcribe(self, audio, language=None, task="transcribe", beam_size=5, initial_prompt=None):
+        self.calls.append((len(audio), initial_prompt))
+        segments = (
+            SimpleNamespace(id=index, seek=0, start=start, end=end, text=text, tokens=[], temperature=0.0,
+                            avg_logprob=-0.2, compression_ratio=1.2, no_speech_prob=0.01)
+            for index, (start, end, text) in enumerate(self.segments)
+        )
+        return segments, SimpleNamespace(language="en", language_probability=0.99, all_language_probs=None)
+
+
+def make_converter(segments):
+    converter = VideoToTextConverter(backend=BACKEND_FASTER_WHISPER, use_cache=False, use_checkpoints=False)
+    backend = FasterWhisperBackend("tiny", "cpu")
+    backend.model = FakeWhisperModel(segments)
+    converter.model = backend
+    return converter, backend.model
+
+
+def test_faster_whisper_resume_with_vad(tmp_path):
+    # 원본 20초 중 5~10초, 15~20초가 음성 → 무음 제거 후 10초를 디코딩
+    timeline = SpeechTimeline([(5 * SAMPLE_RATE, 10 * SAMPLE_RATE), (15 * SAMPLE_RATE, 20 * SAMPLE_RATE)])
+    gated_audio = [0.0] * (10 * SAMPLE_RATE)
+    store = CheckpointStore(str(tmp_path))
+    
+    # 첫 실행: 첫 세그먼트 후 중단
+    converter, _ = make_converter([(0.0, 4.0, " one"), (4.0, 9.0, " two")])
+    checkpoint = TranscriptCheckpoint(store, "key")
+    _, segments = converter._iter_checkpointed_segments(gated_audio, None, timeline, checkpoint)
+    first = next(segments)
+    next(segments, None)
+    assert (first['start'], first['end']) == (5.0, 9.0)
+    checkpoint.flush()
+    segments.close()
+    
+    # 재개 위치는 무음 제거 후 오디오 기준 (원본 기준 9초가 아님)
+    resumed = TranscriptCheckpoint(store, "key")
+    assert resumed.resume_sample == 4 * SAMPLE_RATE
+    assert [segment['text'] for segment in resumed.segments] == [" one"]
+    
+    # 재개: 남은 6초만 디코딩하고 시간은 원본 기준으로 보정
+    converter, model = make_converter([(0.0, 5.0, " two")])
+    _, segments = converter._iter_checkpointed_segments(gated_audio, None, timeline, resumed)
+    segments = list(segments)
+    
+    assert model.calls == [(6 * SAMPLE_RATE, " one")]
+    assert [segment['text'] for segment in segments] == [" one", " two"]
+    assert [(segment['start'], segment['end']) for segment in segments] == [(5.0, 9.0), (9.0, 19.0)]
+    assert [segment['id'] for segment in segments] == [0, 1]
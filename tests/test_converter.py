@@ -0,0 +1,119 @@
+"""
+변환기 테스트
+Converter Tests
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src import converter as converter_module
+from src.audio_utils import SAMPLE_RATE
+from src.backends import TranscriptionBackend
+from src.converter import VideoToTextConverter
+
+
+class FakeBackend(TranscriptionBackend):
+    """모델 없이 정해진 세그먼트를 돌려주고, 디코딩할 때 lock이 잡혀 있었는지 기록하는 엔진"""
+    
+    name = "fake"
+    
+    def __init__(self, lock=None):
+        super().__init__("tiny", "cpu")
+        self.lock = lock
+        self.locked_during_decode = []
+    
+    def load(self):
+        return self
+    
+    def transcribe(self, audio, language=None, task="transcribe", initial_prompt=None, verbose=None):
+        self.locked_during_decode.append(self.lock.locked() if self.lock else None)
+        return {
+            'text': " Hello world",
+            'language': language or "en",
+            'segments': [{'id': 0, 'seek': 0, 'start': 0.0, 'end': 1.5, 'text': " Hello world"}]
+        }
+
+
+def make_converter(backend):
+    converter = VideoToTextConverter(use_gpu=False, use_cache=False, use_checkpoints=False, language_probe=False,
+                                     vad_filter=False)
+    converter.model = backend
+    return converter
+
+
+def test_decode_lock_is_held_only_while_decoding(monkeypatch):
+    decode_lock = threading.Lock()
+    backend = FakeBackend(decode_lock)
+    converter = make_converter(backend)
+    extract_locked = []
+    
+    def fake_load_audio_array(file_path):
+        extract_locked.append(decode_lock.locked())
+        return np.zeros(2 * SAMPLE_RATE, dtype=np.float32)
+    
+    monkeypatch.setattr(converter_module, "load_audio_array", fake_load_audio_array)
+    monkeypatch.setattr(converter, "_probe_local_file", lambda file_path, metrics: None)
+    
+    result = converter.process_local_video_with_info("clip.wav", language="en", decode_lock=decode_lock)
+    
+    assert result['transcript'] == "Hello world"
+    assert extract_locked == [False]
+    assert backend.locked_during_decode == [True]
+    assert not decode_lock.locked()
+
+
+def test_time_waiting_for_decode_lock_is_recorded():
+    decode_lock = threading.Lock()
+    converter = make_converter(FakeBackend(decode_lock))
+    decode_lock.acquire()
+    threading.Timer(0.2, decode_lock.release).start()
+    
+    result = converter.transcribe_audio(np.zeros(SAMPLE_RATE, dtype=np.float32), "clip.wav", language="en",
+                                        decode_lock=decode_lock)
+    
+    assert result['metrics']['stages']['queue_wait'] >= 0.15
+    assert result['metrics']['stages']['decode'] < result['metrics']['stages']['queue_wait']
+
+
+def test_youtube_cache_hit_saves_under_a_sanitized_name(tmp_path):
+    output_dir = tmp_path / "out"
+    converter = VideoToTextConverter(use_gpu=False, cache_dir=str(tmp_path / "cache"), use_checkpoints=False,
+                                     output_dir=str(output_dir), subtitle_formats="srt")
+    url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+    converter.transcript_cache.put(converter.get_youtube_cache_key(url), {
+        'transcript': "Hello world",
+        'detected_language': "en",
+        'segments': [{'id': 0, 'start': 0.0, 'end': 1.5, 'text': " Hello world"}],
+        'youtube_info': {'title': "../AC/DC: Live?"}
+    })
+    
+    converter.process_youtube_video(url, save_transcript=True)
+    
+    assert sorted(os.listdir(output_dir)) == ["_AC_DC_ Live_.srt", "_AC_DC_ Live__transcript.txt"]
+
+
+def test_backend_is_created_once_under_concurrent_access(monkeypatch):
+    created = []
+    
+    def slow_create_backend(name, model_size, device):
+        created.append(name)
+        time.sleep(0.05)
+        return FakeBackend()
+    
+    monkeypatch.setattr(converter_module, "create_backend", slow_create_backend)
+    converter = VideoToTextConverter(use_gpu=False, use_cache=False, use_checkpoints=False)
+    backends = []
+    threads = [threading.Thread(target=lambda: backends.append(converter._get_backend())) for _ in range(4)]
+    threads.append(threading.Thread(target=converter.load_model))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(created) == 1
+    assert all(backend is converter.model for backend in backends)
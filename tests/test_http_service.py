@@ -0,0 +1,125 @@
+"""
+HTTP 변환 서비스 테스트
+HTTP Transcription Service Tests
+"""
+
+import json
+import time
+import threading
+import http.client
+
+import pytest
+
+from src.http_service import TranscriptionService, create_server
+
+RESULT = {
+    'transcript': "Hello world",
+    'detected_language': "en",
+    'segments': [{'id': 0, 'start': 0.0, 'end': 1.5, 'text': " Hello world"}]
+}
+
+
+class FakeModelPool:
+    """모델을 로드하지 않는 풀 (health 응답용)"""
+    
+    def stats(self):
+        return {'models': []}
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = TranscriptionService(use_gpu=False, max_pending_jobs=2, upload_dir=str(tmp_path),
+                                   model_pool=FakeModelPool())
+    # 모델 없이 바로 끝나는 작업
+    service._run_job = lambda job, source, is_url, options: dict(RESULT, source=source, options=options)
+    return service
+
+
+@pytest.fixture
+def server(service):
+    server = create_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def request(server, method, path, body=None, headers=None):
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+    try:
+        connection.request(method, path, body=body, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, response.getheader("Content-Type"), response.read()
+    finally:
+        connection.close()
+
+
+def post_json(server, payload):
+    return request(server, "POST", "/jobs", json.dumps(payload), {"Content-Type": "application/json"})
+
+
+def wait_for_result(server, job_id, query=""):
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        status, content_type, body = request(server, "GET", f"/jobs/{job_id}/result{query}")
+        if status != 202:
+            return status, content_type, body
+        time.sleep(0.05)
+    raise AssertionError("Job did not finish")
+
+
+def test_rejects_unknown_model(server):
+    status, _, body = post_json(server, {'url': "https://youtu.be/abc", 'model': "/tmp/model.pt"})
+    
+    assert status == 400
+    assert "Unknown model" in json.loads(body)['error']
+
+
+def test_rejects_unknown_backend_and_missing_url(server):
+    assert post_json(server, {'url': "https://youtu.be/abc", 'backend': "nope"})[0] == 400
+    assert post_json(server, {'model': "tiny"})[0] == 400
+
+
+def test_rejects_large_upload(server, service):
+    service.max_upload_bytes = 10
+    status, _, _ = request(server, "POST", "/jobs?filename=a.mp4", b"x" * 11,
+                           {"Content-Type": "application/octet-stream"})
+    
+    assert status == 413
+
+
+def test_rejects_when_saturated(server, service):
+    service.max_pending_jobs = 0
+    status, _, _ = post_json(server, {'url': "https://youtu.be/abc"})
+    
+    assert status == 429
+
+
+def test_result_retrieval(server):
+    status, _, body = post_json(server, {'url': "https://youtu.be/abc", 'model': "tiny", 'language': "en"})
+    assert status == 202
+    job_id = json.loads(body)['job_id']
+    
+    status, _, body = wait_for_result(server, job_id)
+    result = json.loads(body)
+    assert status == 200
+    assert result['transcript'] == "Hello world"
+    assert result['options']['model_size'] == "tiny"
+    
+    status, content_type, body = wait_for_result(server, job_id, "?format=srt")
+    assert status == 200
+    assert content_type.startswith("application/x-subrip")
+    assert body.decode('utf-8') == "1\n00:00:00,000 --> 00:00:01,500\nHello world\n\n"
+    
+    assert wait_for_result(server, job_id, "?format=doc")[0] == 400
+
+
+def test_upload_result_retrieval(server):
+    status, _, body = request(server, "POST", "/jobs?filename=clip.wav", b"RIFF....",
+                              {"Content-Type": "application/octet-stream"})
+    assert status == 202
+    
+    status, _, body = wait_for_result(server, json.loads(body)['job_id'])
+    assert status == 200
+    assert json.loads(body)['source'].endswith(".wav")
@@ -0,0 +1,92 @@
+"""
+작업 큐 테스트
+Job Queue Tests
+"""
+
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import time
+
+from src.job_queue import JobQueue, STATUS_QUEUED, STATUS_RUNNING, STATUS_FAILED
+
+
+def make_queue(tmp_path, **kwargs):
+    return JobQueue(db_path=str(tmp_path / "jobs.db"), work_dir=str(tmp_path / "jobs"), **kwargs)
+
+
+def backdate(job_queue, job_id, seconds):
+    # update()는 updated_at을 현재 시각으로 덮어쓰므로 직접 수정
+    with sqlite3.connect(job_queue.db_path) as conn:
+        conn.execute("UPDATE jobs SET updated_at = ? WHERE id = ?", (time.time() - seconds, job_id))
+
+
+def test_enqueue_detects_source_type(tmp_path):
+    job_queue = make_queue(tmp_path)
+    media = tmp_path / "youtube_talk.mp4"
+    media.write_bytes(b"")
+    
+    file_job = job_queue.get(job_queue.enqueue(str(media)))
+    url_job = job_queue.get(job_queue.enqueue("https://youtu.be/abc"))
+    
+    assert (file_job['source_type'], file_job['source']) == ("file", str(media))
+    assert (url_job['source_type'], url_job['source']) == ("youtube", "https://youtu.be/abc")
+
+
+def test_claim_takes_oldest_job_once(tmp_path):
+    job_queue = make_queue(tmp_path)
+    first = job_queue.enqueue("https://youtu.be/first")
+    job_queue.enqueue("https://youtu.be/second")
+    
+    job = job_queue.claim("worker-1")
+    
+    assert job['id'] == first
+    assert (job['status'], job['worker'], job['attempts']) == (STATUS_RUNNING, "worker-1", 1)
+    assert job_queue.claim("worker-2")['id'] != first
+    assert job_queue.claim("worker-3") is None
+
+
+def test_failed_job_is_requeued_until_max_attempts(tmp_path):
+    job_queue = make_queue(tmp_path, max_attempts=2)
+    job_id = job_queue.enqueue("https://youtu.be/abc")
+    
+    job_queue.claim("worker-1")
+    assert job_queue.fail(job_id, "network error") == STATUS_QUEUED
+    job_queue.claim("worker-1")
+    assert job_queue.fail(job_id, "network error") == STATUS_FAILED
+    assert job_queue.get(job_id)['error'] == "network error"
+
+
+def test_recover_requeues_only_jobs_of_finished_or_silent_workers(tmp_path):
+    job_queue = make_queue(tmp_path)
+    live_id = job_queue.enqueue("https://youtu.be/live")
+    gone_id = job_queue.enqueue("https://youtu.be/gone")
+    stale_id = job_queue.enqueue("https://youtu.be/stale")
+    
+    # 다른 work 프로세스(살아 있음)가 실행 중인 작업
+    job_queue.claim(f"{socket.gethostname()}:{os.getppid()}:worker-1")
+    # 종료된 프로세스의 작업
+    finished = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+    job_queue.claim(f"{socket.gethostname()}:{int(finished.stdout)}:worker-1")
+    # 다른 호스트에서 heartbeat가 끊긴 작업
+    job_queue.claim("other-host:1:worker-1")
+    backdate(job_queue, stale_id, 600)
+    
+    assert job_queue.recover(stale_seconds=60) == 2
+    assert job_queue.get(live_id)['status'] == STATUS_RUNNING
+    assert job_queue.get(gone_id)['status'] == STATUS_QUEUED
+    assert job_queue.get(stale_id)['status'] == STATUS_QUEUED
+
+
+def test_heartbeat_keeps_running_jobs_fresh(tmp_path):
+    job_queue = make_queue(tmp_path)
+    job_id = job_queue.enqueue("https://youtu.be/abc")
+    job_queue.claim("other-host:1:worker-1")
+    backdate(job_queue, job_id, 600)
+    
+    job_queue.heartbeat([job_id])
+    
+    assert job_queue.recover(stale_seconds=60) == 0
+    assert job_queue.get(job_id)['status'] == STATUS_RUNNING
@@ -0,0 +1,36 @@
+"""
+실행 지표 테스트
+Run Metrics Tests
+"""
+
+import time
+
+import pytest
+
+from src.metrics import RunMetrics, PrometheusSink, current_rss_mb
+
+if current_rss_mb() is None:
+    pytest.skip("resident memory is not measurable on this platform", allow_module_level=True)
+
+
+def test_peak_rss_is_measured_per_run():
+    run = RunMetrics("audio")
+    block = b"x" * (96 * 1024 * 1024)
+    time.sleep(0.6)
+    del block
+    first = run.finish().to_dict()
+    
+    second = RunMetrics("audio").finish().to_dict()
+    
+    # 앞 실행에서 늘었다가 해제된 메모리는 다음 실행의 값에 포함되지 않음
+    assert first['rss_growth_mb'] >= 64
+    assert second['rss_growth_mb'] < 64
+    assert 'process_peak_rss_mb' not in first
+
+
+def test_prometheus_reports_the_last_run_peak():
+    sink = PrometheusSink()
+    sink.emit({'source': "audio", 'stages': {}, 'peak_rss_mb': 512.0})
+    sink.emit({'source': "audio", 'stages': {}, 'peak_rss_mb': 256.0})
+    
+    assert "videoscribe_last_run_peak_rss_bytes 268435456" in sink.render()
@@ -0,0 +1,114 @@
+"""
+모델 웜 풀 테스트
+Model Warm Pool Tests
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.backends import BACKEND_FASTER_WHISPER, BACKEND_WHISPER
+from src.model_pool import ModelPool
+
+
+class FakeConverter:
+    """모델 로드 없이 로드/해제 횟수만 기록하는 변환기"""
+    
+    def __init__(self, model_size, fail=False, backend=BACKEND_WHISPER):
+        self.model_size = model_size
+        self.fail = fail
+        self.backend = backend
+        self.loaded = False
+        self.closed = False
+    
+    def load_model(self):
+        if self.fail:
+            raise RuntimeError("load failed")
+        self.loaded = True
+        return SimpleNamespace(name=self.backend, device="cpu")
+    
+    def close(self):
+        self.closed = True
+
+
+def loaded_models(pool):
+    return [model['model_size'] for model in pool.stats()['models']]
+
+
+def test_repeated_get_reuses_the_loaded_model():
+    pool = ModelPool(lambda model_size, use_gpu, backend: FakeConverter(model_size))
+    
+    first = pool.get("tiny", use_gpu=False)
+    second = pool.get("tiny", use_gpu=False)
+    
+    assert first is second
+    assert pool.stats()['hits'] == 1
+    assert pool.stats()['misses'] == 1
+
+
+def test_failed_load_can_be_retried():
+    attempts = []
+    
+    def factory(model_size, use_gpu, backend):
+        attempts.append(model_size)
+        return FakeConverter(model_size, fail=len(attempts) == 1)
+    
+    pool = ModelPool(factory)
+    with pytest.raises(RuntimeError):
+        pool.get("tiny", use_gpu=False)
+    
+    converter = pool.get("tiny", use_gpu=False)
+    
+    assert converter.loaded
+    assert len(attempts) == 2
+    assert pool._loading_locks == {}
+
+
+def test_idle_models_are_evicted_lru_first():
+    pool = ModelPool(lambda model_size, use_gpu, backend: FakeConverter(model_size), ram_budget_mb=1200)
+    small = pool.get("small", use_gpu=False)
+    pool.get("tiny", use_gpu=False)
+    
+    pool.get("base", use_gpu=False)
+    
+    assert small.closed
+    assert loaded_models(pool) == ["tiny", "base"]
+    assert pool.stats()['evictions'] == 1
+
+
+def test_recently_used_models_stay_loaded():
+    pool = ModelPool(lambda model_size, use_gpu, backend: FakeConverter(model_size), ram_budget_mb=1400)
+    small = pool.get("small", use_gpu=False)
+    tiny = pool.get("tiny", use_gpu=False)
+    pool.get("small", use_gpu=False)
+    
+    pool.get("base", use_gpu=False)
+    
+    assert tiny.closed
+    assert not small.closed
+    assert loaded_models(pool) == ["small", "base"]
+
+
+def test_leased_models_are_not_evicted_until_released():
+    pool = ModelPool(lambda model_size, use_gpu, backend: FakeConverter(model_size), ram_budget_mb=1200)
+    
+    with pool.lease("small", use_gpu=False) as small:
+        pool.get("base", use_gpu=False)
+        
+        assert not small.closed
+        assert loaded_models(pool) == ["small", "base"]
+        assert pool.stats()['models'][0]['in_use'] == 1
+    
+    pool.get("tiny", use_gpu=False)
+    
+    assert small.closed
+    assert loaded_models(pool) == ["base", "tiny"]
+
+
+def test_entries_are_sized_from_the_backend_actually_loaded():
+    # faster-whisper가 없어 openai-whisper로 대체된 경우
+    pool = ModelPool(lambda model_size, use_gpu, backend: FakeConverter(model_size, backend=BACKEND_WHISPER))
+    
+    pool.get("small", use_gpu=False, backend=BACKEND_FASTER_WHISPER)
+    
+    assert pool.stats()['models'][0]['memory_mb'] == 1000
@@ -0,0 +1,99 @@
+"""
+자막 내보내기 테스트
+Subtitle Export Tests
+"""
+
+import json
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.audio_utils import SAMPLE_RATE
+from src.backends import TranscriptionBackend
+from src.converter import VideoToTextConverter
+from src.subtitle_writer import SubtitleWriter, format_timestamp, parse_formats, render_subtitles, write_subtitles
+
+SEGMENTS = [
+    {'id': 0, 'start': 0.0, 'end': 1.5, 'text': " Hello world"},
+    {'id': 1, 'start': 1.5, 'end': 2.0, 'text': " "},
+    {'id': 2, 'start': 3661.25, 'end': 3662.0, 'text': " a --> b\tc"}
+]
+
+
+class FakeBackend(TranscriptionBackend):
+    """모델 없이 정해진 세그먼트를 돌려주는 엔진"""
+    
+    name = "fake"
+    
+    def load(self):
+        return self
+    
+    def transcribe(self, audio, language=None, task="transcribe", initial_prompt=None, verbose=None):
+        return {'text': SEGMENTS[0]['text'], 'language': language or "en", 'segments': [dict(SEGMENTS[0])]}
+
+
+def test_format_timestamp():
+    assert format_timestamp(3661.25) == "01:01:01,250"
+    assert format_timestamp(0.0016, ".") == "00:00:00.002"
+    assert format_timestamp(-1.0) == "00:00:00,000"
+
+
+def test_parse_formats_deduplicates_and_rejects_unknown():
+    assert parse_formats(" SRT,.vtt,srt,,") == ("srt", "vtt")
+    with pytest.raises(ValueError):
+        parse_formats("docx")
+
+
+def test_cue_formats():
+    assert render_subtitles(SEGMENTS, "srt") == (
+        "1\n00:00:00,000 --> 00:00:01,500\nHello world\n\n"
+        "2\n01:01:01,250 --> 01:01:02,000\na -> b\tc\n\n"
+    )
+    assert render_subtitles(SEGMENTS, "vtt") == (
+        "WEBVTT\n\n"
+        "00:00:00.000 --> 00:00:01.500\nHello world\n\n"
+        "01:01:01.250 --> 01:01:02.000\na -> b\tc\n\n"
+    )
+    assert render_subtitles(SEGMENTS, "tsv") == "start\tend\ttext\n0\t1500\tHello world\n3661250\t3662000\ta --> b c\n"
+    assert render_subtitles(SEGMENTS, "txt") == "Hello world\na --> b\tc\n"
+
+
+def test_json_keeps_every_segment_and_the_language():
+    data = json.loads(render_subtitles(SEGMENTS, "json", "en"))
+    
+    assert data == {'segments': SEGMENTS, 'language': "en"}
+
+
+def test_write_subtitles_writes_one_file_per_format(tmp_path):
+    paths = write_subtitles(SEGMENTS, str(tmp_path), "clip", "srt,vtt", language="en")
+    
+    assert paths == {'srt': str(tmp_path / "clip.srt"), 'vtt': str(tmp_path / "clip.vtt")}
+    with open(paths['srt'], encoding='utf-8') as f:
+        assert f.read() == render_subtitles(SEGMENTS, "srt")
+
+
+def test_abort_removes_partial_files(tmp_path):
+    writer = SubtitleWriter(str(tmp_path), "clip", ("srt", "json"))
+    writer.write_segment(SEGMENTS[0])
+    
+    writer.abort()
+    
+    assert os.listdir(tmp_path) == []
+
+
+def test_write_errors_during_decode_abort_the_transcription(tmp_path, monkeypatch):
+    converter = VideoToTextConverter(use_gpu=False, use_cache=False, use_checkpoints=False, language_probe=False,
+                                     vad_filter=False, output_dir=str(tmp_path), subtitle_formats="srt,vtt")
+    converter.model = FakeBackend("tiny", "cpu")
+    
+    def fail(self, segment):
+        raise OSError("disk full")
+    
+    monkeypatch.setattr(SubtitleWriter, "write_segment", fail)
+    
+    with pytest.raises(OSError):
+        converter.transcribe_audio(np.zeros(2 * SAMPLE_RATE, dtype=np.float32), "clip.wav", language="en",
+                                   save_transcript=True)
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,438 @@
+"""
+변환 파이프라인 벤치마크
+Transcription Pipeline Benchmark
+
+합성 미디어(톤, 음성 유사 잡음, 무음, 강의형 무음 섞인 음성)를 결정적으로 생성하고
+VideoToTextConverter를 단계별/전체로 실행하여 실시간 배율(RTF), 최대 메모리, 실행 시간,
+디스크 쓰기량을 JSON으로 저장합니다. CPU 전용이며 네트워크를 사용하지 않습니다
+(모델 파일은 미리 내려받아 두어야 합니다).
+
+사용 예 / Usage:
+    python tools/benchmark.py -m tiny base --backend whisper faster-whisper
+    python tools/benchmark.py --kinds lecture --durations 10 600 3600 7200 -o after.json
+    python tools/benchmark.py --compare before.json after.json
+"""
+
+import os
+import sys
+import json
+import time
+import wave
+import zlib
+import platform
+import argparse
+import subprocess
+
+# 저장소 루트를 import 경로에 추가 (tools/에서 직접 실행)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from src.audio_utils import SAMPLE_RATE, load_audio_array, gate_speech  # noqa: E402
+from src.backends import BACKEND_OPTIONS, BACKEND_WHISPER  # noqa: E402
+from src.ffmpeg_setup import get_ffmpeg_binary  # noqa: E402
+from src.metrics import process_peak_rss_mb as _peak_rss_mb  # noqa: E402
+
+MEDIA_KINDS = ("tone", "speech", "silence", "lecture")
+DEFAULT_DURATIONS = (10, 60)
+DEFAULT_MEDIA_DIR = os.path.join(ROOT_DIR, "tools", "bench_media")
+
+# 합성 오디오 생성 단위 (초) - 2시간 파일도 메모리에 다 올리지 않음
+_BLOCK_SECONDS = 10
+
+
+def _rng_for(kind, seed, block_index):
+    """(종류, 시드, 블록) 별 난수 생성기 - 길이가 달라도 앞부분은 같은 신호"""
+    import numpy as np
+    return np.random.RandomState(zlib.crc32(f"{kind}:{seed}:{block_index}".encode('utf-8')))
+
+
+def _shaped_noise(rng, n_samples, sample_rate):
+    """음성 대역(포먼트 근처)을 강조한 잡음"""
+    import numpy as np
+    
+    spectrum = np.fft.rfft(rng.standard_normal(n_samples))
+    freqs = np.fft.rfftfreq(n_samples, 1.0 / sample_rate)
+    gain = np.zeros_like(freqs)
+    for center, width in ((500, 200), (1500, 300), (2500, 400)):
+        gain += np.exp(-0.5 * ((freqs - center) / width) ** 2)
+    noise = np.fft.irfft(spectrum * gain, n_samples)
+    return noise / (np.max(np.abs(noise)) + 1e-9)
+
+
+def _speech_block(rng, n_samples, sample_rate, pause_ratio=0.1):
+    """음절 단위로 켜지고 꺼지는 유성음(배음) + 잡음 신호 (TTS 없이 만드는 음성 유사 신호)"""
+    import numpy as np
+    
+    t = np.arange(n_samples) / sample_rate
+    f0 = rng.uniform(110, 220)
+    # 천천히 변하는 피치
+    phase = 2 * np.pi * np.cumsum(f0 * (1 + 0.08 * np.sin(2 * np.pi * 0.7 * t))) / sample_rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 8))
+    signal = 0.6 * voiced / 2.6 + 0.4 * _shaped_noise(rng, n_samples, sample_rate)
+    
+    # 음절 포락선 (0.12~0.35초 소리, 짧은 간격, 가끔 긴 쉼)
+    envelope = np.zeros(n_samples)
+    position = 0
+    while position < n_samples:
+        length = int(rng.uniform(0.12, 0.35) * sample_rate)
+        end = min(n_samples, position + length)
+        envelope[position:end] = np.hanning(max(2, length))[:end - position]
+        gap = rng.uniform(1.0, 3.0) if rng.uniform() < pause_ratio else rng.uniform(0.03, 0.15)
+        position = end + int(gap * sample_rate)
+    return 0.3 * signal * envelope
+
+
+def synthesize_block(kind, seed, block_index, n_samples, sample_rate=SAMPLE_RATE):
+    """
+    합성 오디오 한 블록을 생성합니다
+    
+    Args:
+        kind (str): tone, speech, silence, lecture
+        seed (int): 난수 시드
+        block_index (int): 블록 번호
+        n_samples (int): 샘플 수
+        sample_rate (int): 샘플링 레이트
+    
+    Returns:
+        numpy.ndarray: float32 오디오 (-1.0 ~ 1.0)
+    """
+    import numpy as np
+    
+    rng = _rng_for(kind, seed, block_index)
+    t = (np.arange(n_samples) + block_index * _BLOCK_SECONDS * sample_rate) / sample_rate
+    # 모든 종류에 -70dB 정도의 배경 잡음
+    floor = 10 ** (-70 / 20) * rng.standard_normal(n_samples)
+    
+    if kind == "tone":
+        # 220Hz~880Hz를 오가는 톤
+        frequency = 550 + 330 * np.sin(2 * np.pi * t / 20.0)
+        audio = 0.25 * np.sin(2 * np.pi * np.cumsum(frequency) / sample_rate)
+    elif kind == "speech":
+        audio = _speech_block(rng, n_samples, sample_rate)
+    elif kind == "silence":
+        audio = np.zeros(n_samples)
+    elif kind == "lecture":
+        # 30~40% 무음이 섞인 강의 녹음
+        audio = _speech_block(rng, n_samples, sample_rate, pause_ratio=0.35)
+        if rng.uniform() < 0.25:
+            audio[:int(n_samples * rng.uniform(0.3, 0.8))] = 0.0
+    else:
+        raise ValueError(f"Unknown media kind: {kind}")
+    
+    return (audio + floor).astype(np.float32)
+
+
+def generate_media(kind, seconds, output_path, seed=0, container="wav", sample_rate=SAMPLE_RATE):
+    """
+    합성 미디어 파일을 생성합니다 (같은 인자면 항상 같은 파일, 이미 있으면 재사용)
+    
+    Args:
+        kind (str): tone, speech, silence, lecture
+        seconds (float): 길이 (초)
+        output_path (str): 출력 경로 (확장자는 container에 맞춤)
+        seed (int): 난수 시드
+        container (str): wav, m4a, mp4 (m4a/mp4는 FFmpeg로 인코딩)
+        sample_rate (int): 샘플링 레이트
+    
+    Returns:
+        str: 생성된 파일 경로
+    """
+    import numpy as np
+    
+    if os.path.exists(output_path):
+        return output_path
+    
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    wav_path = output_path if container == "wav" else os.path.splitext(output_path)[0] + ".src.wav"
+    
+    total_samples = int(seconds * sample_rate)
+    block_samples = _BLOCK_SECONDS * sample_rate
+    partial_path = wav_path + ".part"
+    with wave.open(partial_path, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        for block_index, start in enumerate(range(0, total_samples, block_samples)):
+            block = synthesize_block(kind, seed, block_index, min(block_samples, total_samples - start), sample_rate)
+            wav_file.writeframes((np.clip(block, -1.0, 1.0) * 32767).astype('<i2').tobytes())
+    os.replace(partial_path, wav_path)
+    
+    if container == "wav":
+        return output_path
+    
+    command = [get_ffmpeg_binary(), '-nostdin', '-hide_banner', '-loglevel', 'error', '-y']
+    if container == "mp4":
+        # 작은 검은 화면 비디오 트랙 추가 (ffmpeg 기본 내장 인코더만 사용)
+        command += ['-f', 'lavfi', '-i', f"color=c=black:s=320x240:r=15:d={seconds}", '-i', wav_path,
+                    '-c:v', 'mpeg4', '-q:v', '10', '-c:a', 'aac', '-b:a', '96k', '-shortest']
+    else:
+        command += ['-i', wav_path, '-c:a', 'aac', '-b:a', '96k']
+    command.append(output_path)
+    
+    try:
+        subprocess.run(command, check=True, capture_output=True)
+    finally:
+        os.remove(wav_path)
+    return output_path
+
+
+def _write_bytes():
+    """프로세스가 지금까지 디스크에 쓴 바이트 수 (측정할 수 없으면 None)"""
+    try:
+        with open("/proc/self/io") as f:
+            for line in f:
+                if line.startswith("write_bytes:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import psutil
+        return psutil.Process().io_counters().write_bytes
+    except Exception:
+        return None
+
+
+def measure(func, audio_seconds=None):
+    """
+    함수를 실행하고 실행 시간, RTF, 최대 메모리, 쓰기량을 측정합니다
+    
+    Args:
+        func (function): 인자 없는 함수
+        audio_seconds (float): 처리한 오디오 길이 (RTF 계산용)
+    
+    Returns:
+        tuple: (함수 반환값, 측정 dict)
+    """
+    written_before = _write_bytes()
+    start_time = time.perf_counter()
+    value = func()
+    wall_seconds = time.perf_counter() - start_time
+    written_after = _write_bytes()
+    # 프로세스 전체 최댓값 - 조합마다 별도 프로세스로 실행해서 조합별 값이 됨
+    peak_rss = _peak_rss_mb()
+    
+    stats = {
+        'wall_seconds': round(wall_seconds, 4),
+        'rtf': round(wall_seconds / audio_seconds, 5) if audio_seconds else None,
+        'peak_rss_mb': round(peak_rss, 1) if peak_rss is not None else None,
+        'bytes_written': written_after - written_before if written_before is not None else None
+    }
+    return value, stats
+
+
+def run_single(model_size, backend, media_files, vad_filter=True, end_to_end=True):
+    """
+    하나의 (모델, 엔진) 조합으로 모든 미디어를 측정합니다
+    
+    Args:
+        model_size (str): 모델 크기
+        backend (str): 음성 인식 엔진
+        media_files (list): (종류, 길이, 경로) 목록
+        vad_filter (bool): 무음 제거 사용 여부
+        end_to_end (bool): 단계별 측정 후 process_local_video_with_info 전체 실행도 측정
+    
+    Returns:
+        dict: 모델 로드 측정과 미디어별 결과 목록
+    """
+    from src.converter import VideoToTextConverter
+    from src.media_probe import probe_media
+    
+    # 캐시를 끄고 CPU에서만 실행
+    converter = VideoToTextConverter(model_size=model_size, use_gpu=False, use_cache=False, backend=backend,
+                                     vad_filter=vad_filter)
+    _, load_stats = measure(converter.load_model)
+    print(f"[{model_size}/{backend}] model loaded in {load_stats['wall_seconds']:.1f}s")
+    
+    results = []
+    for kind, seconds, path in media_files:
+        stages = {}
+        info, stages['probe'] = measure(lambda: probe_media(path), seconds)
+        audio, stages['extract'] = measure(lambda: load_audio_array(path), seconds)
+        audio_seconds = len(audio) / SAMPLE_RATE
+        
+        speech_seconds = audio_seconds
+        if vad_filter:
+            (_, timeline), stages['vad'] = measure(lambda: gate_speech(audio), audio_seconds)
+            if timeline is not None:
+                speech_seconds = timeline.speech_seconds
+        
+        result, stages['transcribe'] = measure(lambda: converter.transcribe_audio(audio, path), audio_seconds)
+        del audio
+        
+        entry = {
+            'media': os.path.basename(path),
+            'kind': kind,
+            'duration_seconds': seconds,
+            'audio_seconds': round(audio_seconds, 3),
+            'speech_seconds': round(speech_seconds, 3),
+            'audio_codec': (info.get('audio') or {}).get('codec'),
+            'model': model_size,
+            'backend': backend,
+            'vad': vad_filter,
+            'stages': stages,
+            'segments': len(result['segments']),
+            'characters': len(result['transcript'])
+        }
+        
+        if end_to_end:
+            _, entry['end_to_end'] = measure(lambda: converter.process_local_video_with_info(path), audio_seconds)
+        
+        print(f"[{model_size}/{backend}] {entry['media']}: transcribe RTF {stages['transcribe']['rtf']}, "
+              f"peak RSS {stages['transcribe']['peak_rss_mb']} MB")
+        results.append(entry)
+    
+    converter.close()
+    return {'model_load': load_stats, 'results': results}
+
+
+def _environment():
+    """실행 환경 정보 (두 결과를 비교할 때 참고)"""
+    env = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'ffmpeg': get_ffmpeg_binary()
+    }
+    for module_name in ("numpy", "torch", "whisper", "faster_whisper"):
+        try:
+            module = __import__(module_name)
+            env[module_name] = getattr(module, "__version__", "unknown")
+        except ImportError:
+            env[module_name] = None
+    try:
+        env['git_commit'] = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                                           capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        env['git_commit'] = None
+    return env
+
+
+def _run_isolated(model_size, backend, args):
+    """(모델, 엔진) 조합을 별도 프로세스에서 측정합니다 (최대 메모리가 조합별로 따로 측정되도록)"""
+    import tempfile
+    
+    fd, result_path = tempfile.mkstemp(suffix=".json", prefix="bench_")
+    os.close(fd)
+    command = [sys.executable, os.path.abspath(__file__), '--single', '-m', model_size, '--backend', backend,
+               '--kinds', *args.kinds, '--durations', *[str(d) for d in args.durations],
+               '--container', args.container, '--media-dir', args.media_dir, '--seed', str(args.seed),
+               '-o', result_path]
+    if args.no_vad:
+        command.append('--no-vad')
+    if args.stages_only:
+        command.append('--stages-only')
+    try:
+        subprocess.run(command, check=True)
+        with open(result_path, encoding='utf-8') as f:
+            return json.load(f)['runs'][0]
+    finally:
+        os.remove(result_path)
+
+
+def compare(old_path, new_path):
+    """
+    두 벤치마크 결과의 RTF와 최대 메모리를 비교해 출력합니다
+    
+    Returns:
+        int: 종료 코드
+    """
+    def index(path):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        rows = {}
+        for run in data['runs']:
+            for entry in run['results']:
+                stages = dict(entry['stages'])
+                if 'end_to_end' in entry:
+                    stages['end_to_end'] = entry['end_to_end']
+                for stage, stats in stages.items():
+                    rows[(entry['media'], entry['model'], entry['backend'], stage)] = stats
+        return rows
+    
+    old_rows, new_rows = index(old_path), index(new_path)
+    print(f"{'media':<28}{'model':<8}{'backend':<16}{'stage':<12}{'rtf old':>10}{'rtf new':>10}{'change':>9}"
+          f"{'rss old':>10}{'rss new':>10}")
+    for key in sorted(set(old_rows) & set(new_rows)):
+        old, new = old_rows[key], new_rows[key]
+        change = ""
+        if old.get('rtf') and new.get('rtf') is not None:
+            change = f"{(new['rtf'] - old['rtf']) / old['rtf'] * 100:+.1f}%"
+        print(f"{key[0]:<28}{key[1]:<8}{key[2]:<16}{key[3]:<12}{str(old.get('rtf')):>10}{str(new.get('rtf')):>10}"
+              f"{change:>9}{str(old.get('peak_rss_mb')):>10}{str(new.get('peak_rss_mb')):>10}")
+    
+    missing = sorted(set(old_rows) ^ set(new_rows))
+    if missing:
+        print(f"\n{len(missing)} row(s) present in only one file")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="VideoScribe pipeline benchmark / 변환 파이프라인 벤치마크")
+    parser.add_argument("-m", "--models", nargs="+", default=["tiny"], help="Model sizes to benchmark")
+    parser.add_argument("--backend", nargs="+", default=[BACKEND_WHISPER], choices=list(BACKEND_OPTIONS))
+    parser.add_argument("--kinds", nargs="+", default=list(MEDIA_KINDS), choices=MEDIA_KINDS)
+    parser.add_argument("--durations", nargs="+", type=float, default=list(DEFAULT_DURATIONS),
+                        help="Media lengths in seconds (e.g. 10 60 600 3600 7200)")
+    parser.add_argument("--container", default="wav", choices=("wav", "m4a", "mp4"))
+    parser.add_argument("--media-dir", default=DEFAULT_MEDIA_DIR, help="Where generated media is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-vad", action="store_true", help="Disable silence trimming")
+    parser.add_argument("--stages-only", action="store_true", help="Skip the extra end-to-end run")
+    parser.add_argument("--no-isolate", action="store_true",
+                        help="Run all models in this process (peak RSS is then cumulative)")
+    parser.add_argument("-o", "--output", default=None, help="Result JSON path")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two result files")
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv=None):
+    """벤치마크 진입점"""
+    args = build_parser().parse_args(argv)
+    
+    if args.compare:
+        return compare(*args.compare)
+    
+    media_files = []
+    for kind in args.kinds:
+        for seconds in args.durations:
+            name = f"{kind}_{seconds:g}s_seed{args.seed}.{args.container}"
+            path = generate_media(kind, seconds, os.path.join(args.media_dir, name), args.seed, args.container)
+            media_files.append((kind, seconds, path))
+    
+    combinations = [(model_size, backend) for model_size in args.models for backend in args.backend]
+    isolate = not args.single and not args.no_isolate and len(combinations) > 1
+    
+    runs = []
+    for model_size, backend in combinations:
+        if isolate:
+            runs.append(_run_isolated(model_size, backend, args))
+        else:
+            run = run_single(model_size, backend, media_files, vad_filter=not args.no_vad,
+                             end_to_end=not args.stages_only)
+            runs.append({'model': model_size, 'backend': backend, **run})
+    
+    output = {
+        'created_at': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'environment': _environment(),
+        'options': {
+            'kinds': args.kinds,
+            'durations': args.durations,
+            'container': args.container,
+            'seed': args.seed,
+            'vad': not args.no_vad
+        },
+        'runs': runs
+    }
+    
+    output_path = args.output or f"benchmark_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+    print(f"Results saved to: {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())